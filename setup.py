@@ -27,11 +27,16 @@ setup(
     scripts=[
         'src/scs_mfr/afe_baseline.py',
         'src/scs_mfr/afe_calib.py',
+        'src/scs_mfr/afe_calib_prefetch.py',
         'src/scs_mfr/afe_conf.py',
+        'src/scs_mfr/calib_history.py',
+        'src/scs_mfr/chamber_calib.py',
         'src/scs_mfr/csv_reader.py',
         'src/scs_mfr/csv_writer.py',
         'src/scs_mfr/dfe_id.py',
         'src/scs_mfr/dfe_test.py',
+        'src/scs_mfr/dfe_test_query.py',
+        'src/scs_mfr/eeprom_build.py',
         'src/scs_mfr/eeprom_read.py',
         'src/scs_mfr/eeprom_write.py',
         'src/scs_mfr/gps_conf.py',
@@ -10,13 +10,22 @@ The afe_baseline utility is used to adjust the zero offset for electrochemical s
 negative, and represents a parts-per-billion value. Sensors are identified by their position on the Alphasense analogue
 front-end (AFE) board: SN1 to SN4 (the PID station is referred to as SN4). The date / time of any change is recorded.
 
+Alternatively, the offsets may be found from a CSV log of the gases_sampler output, such as one written by csv_writer.
+For each sensor on the AFE, the floor of its logged concentrations - column "val.GAS.cnc" - is estimated, either as a
+low percentile (by default, the 5th), or as the median of the minima of consecutive windows of readings. The offset is
+then changed by the difference between the floor and the target, which is zero by default. Logged concentrations are
+taken to include the offsets current when they were logged. Estimates are streamed in constant memory, so logs of any
+size may be processed on the device itself.
+
 Note that the scs_dev/gasses_sampler process must be restarted for changes to take effect.
 
 SYNOPSIS
-afe_baseline.py [-1 SN1_OFFSET] [-2 SN2_OFFSET] [-3 SN3_OFFSET] [-4 SN3_OFFSET] [-v]
+afe_baseline.py [{ [-1 SN1_OFFSET] [-2 SN2_OFFSET] [-3 SN3_OFFSET] [-4 SN3_OFFSET] |
+-f CSV_FILE [{ -p PERCENTILE | -w WINDOW }] [-t TARGET] }] [-v]
 
 EXAMPLES
 ./afe_baseline.py -1 15
+./afe_baseline.py -f ~/SCS/logs/gases.csv -w 360
 
 DOCUMENT EXAMPLE
 {"sn1": {"calibrated-on": "2017-10-04T17:18:31.832+01:00", "offset": 0},
@@ -26,25 +35,65 @@ DOCUMENT EXAMPLE
 
 FILES
 ~/SCS/conf/afe_baseline.json
+~/SCS/calib_history.db
 
 SEE ALSO
 scs_dev/gases_sampler
 scs_mfr/afe_calib
+scs_mfr/calib_history
+scs_mfr/csv_writer
 """
 
+import csv
 import sys
 
+from collections import OrderedDict
+
 from scs_core.data.json import JSONify
 from scs_core.data.localized_datetime import LocalizedDatetime
 
 from scs_core.gas.afe_baseline import AFEBaseline
+from scs_core.gas.afe_calib import AFECalib
 from scs_core.gas.sensor_baseline import SensorBaseline
 
 from scs_host.sys.host import Host
 
+from scs_mfr.calib.calib_history import CalibHistory
+from scs_mfr.calib.afe_baseline_estimator import AFEBaselineEstimator
+
 from scs_mfr.cmd.cmd_afe_baseline import CmdAFEBaseline
 
 
+# --------------------------------------------------------------------------------------------------------------------
+
+def estimate_floors(file, gas_names, percentile, window):
+    """
+    returns OrderedDict of sensor index: AFEBaselineEstimator, for each sensor whose concentration column is in the CSV
+    """
+    reader = csv.reader(file)
+    header = next(reader, [])
+
+    columns = OrderedDict()                 # sensor index: column index
+
+    for i, gas_name in gas_names.items():
+        path = "val.%s.cnc" % gas_name
+
+        if path in header:
+            columns[i] = header.index(path)
+
+    estimators = OrderedDict((i, AFEBaselineEstimator(percentile=percentile, window=window)) for i in columns)
+
+    for row in reader:
+        for i, column in columns.items():
+            try:
+                estimators[i].append(float(row[column]))
+
+            except (IndexError, ValueError):
+                continue
+
+    return estimators
+
+
 # --------------------------------------------------------------------------------------------------------------------
 
 if __name__ == '__main__':
@@ -54,6 +103,10 @@ if __name__ == '__main__':
 
     cmd = CmdAFEBaseline()
 
+    if not cmd.is_valid():
+        cmd.print_help(sys.stderr)
+        exit(2)
+
     if cmd.verbose:
         print("afe_baseline: %s" % cmd, file=sys.stderr)
         sys.stderr.flush()
@@ -77,4 +130,55 @@ if __name__ == '__main__':
 
         baseline.save(Host)
 
+        CalibHistory.record(Host, CalibHistory.AFE_BASELINE, AFEBaseline.load(Host))
+
+    if cmd.csv_filename is not None:
+        afe_calib = AFECalib.load(Host)
+
+        if afe_calib is None:
+            print("afe_baseline: an AFE calibration has not been set for this system.", file=sys.stderr)
+            exit(1)
+
+        gas_names = OrderedDict()
+
+        for i in range(len(cmd.offsets)):
+            sensor_calib = afe_calib.sensor_calib(i)
+
+            if sensor_calib is not None:
+                gas_names[i] = sensor_calib.gas_name
+
+        percentile = AFEBaselineEstimator.DEFAULT_PERCENTILE if cmd.percentile is None else cmd.percentile
+
+        try:
+            if cmd.csv_filename == '-':
+                estimators = estimate_floors(sys.stdin, gas_names, percentile, cmd.window)
+
+            else:
+                with open(cmd.csv_filename, newline='') as csv_file:
+                    estimators = estimate_floors(csv_file, gas_names, percentile, cmd.window)
+
+        except OSError as ex:
+            print("afe_baseline: %s" % ex, file=sys.stderr)
+            exit(1)
+
+        if not any(estimator.floor is not None for estimator in estimators.values()):
+            print("afe_baseline: no concentrations found for %s" % list(gas_names.values()), file=sys.stderr)
+            exit(1)
+
+        now = LocalizedDatetime.now()
+
+        for i, estimator in estimators.items():
+            if cmd.verbose:
+                print("afe_baseline: %s: %s" % (gas_names[i], JSONify.dumps(estimator)), file=sys.stderr)
+
+            if estimator.floor is None:
+                continue
+
+            offset = baseline.sensor_baseline(i).offset + int(round(cmd.target - estimator.floor))
+            baseline.set_sensor_baseline(i, SensorBaseline(now, offset))
+
+        baseline.save(Host)
+
+        CalibHistory.record(Host, CalibHistory.AFE_BASELINE, AFEBaseline.load(Host))
+
     print(JSONify.dumps(baseline))
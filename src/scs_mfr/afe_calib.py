@@ -13,6 +13,10 @@ Alphasense electrochemical sensors are calibrated in the factory when fitted to
 values are provided in a structured document, either on paper or - for AFE boards provided by South Coast Science -
 in electronic form. The afe_calib utility is used to retrieve this JSON document via a web API.
 
+Sheets are read from the local calibration sheet cache if present, and are otherwise downloaded and added to the
+cache. The sheets for a batch of AFEs may be downloaded to the cache ahead of provisioning with the afe_calib_prefetch
+utility.
+
 The afe_calib utility may also be used to set a "test" calibration sheet, for use in a manufacturing environment.
 
 Note that the scs_dev/gasses_sampler process must be restarted for changes to take effect.
@@ -42,10 +46,14 @@ DOCUMENT EXAMPLE
 
 FILES
 ~/SCS/conf/afe_calib.json
+~/SCS/afe_calib_cache/AFE_SERIAL_NUMBER.json
+~/SCS/calib_history.db
 
 SEE ALSO
 scs_dev/gases_sampler
 scs_mfr/afe_baseline
+scs_mfr/afe_calib_prefetch
+scs_mfr/calib_history
 
 RESOURCES
 https://www.alphasense-technology.co.uk/
@@ -64,6 +72,10 @@ from scs_host.client.http_client import HTTPClient
 
 from scs_host.sys.host import Host
 
+from scs_mfr.calib.afe_calib_cache import AFECalibCache
+from scs_mfr.calib.afe_calib_prefetch import AFECalibPrefetch
+from scs_mfr.calib.calib_history import CalibHistory
+
 from scs_mfr.cmd.cmd_afe_calib import CmdAFECalib
 
 
@@ -89,15 +101,36 @@ if __name__ == '__main__':
             jstr = AFECalib.TEST_JSON
 
         else:
-            client = HTTPClient()
-            client.connect(AFECalib.HOST)
+            cache = AFECalibCache.open(Host)
 
             try:
-                path = AFECalib.PATH + cmd.serial_number
-                jstr = client.get(path, None, AFECalib.HEADER)
+                jstr = cache.get(cmd.serial_number)
+
+            except ValueError as ex:
+                print("afe_calib: %s" % ex, file=sys.stderr)
+                exit(1)
+
+            if jstr is None:
+                client = HTTPClient()
+                client.connect(AFECalib.HOST)
+
+                try:
+                    path = AFECalib.PATH + cmd.serial_number
+                    jstr = client.get(path, None, AFECalib.HEADER)
 
-            finally:
-                client.close()
+                finally:
+                    client.close()
+
+                try:
+                    AFECalibPrefetch.validate(jstr)
+                    cache.put(cmd.serial_number, jstr)
+
+                except (ValueError, OSError) as ex:
+                    print("afe_calib: %s" % ex, file=sys.stderr)
+                    exit(1)
+
+            elif cmd.verbose:
+                print("afe_calib: cached: %s" % cache.filename(cmd.serial_number), file=sys.stderr)
 
         jdict = json.loads(jstr, object_pairs_hook=OrderedDict)
 
@@ -106,6 +139,8 @@ if __name__ == '__main__':
         if calib is not None:
             calib.save(Host)
 
+            CalibHistory.record(Host, CalibHistory.AFE_CALIB, AFECalib.load(Host))
+
     calib = AFECalib.load(Host)
 
     print(JSONify.dumps(calib))
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+DESCRIPTION
+The afe_calib_prefetch utility is used to download the calibration sheets for a batch of Alphasense analogue
+front-end (AFE) boards to the local calibration sheet cache, ahead of provisioning. The afe_calib utility reads the
+cache before the web API, so that the boards can then be provisioned without a network round-trip for each one.
+
+AFE serial numbers are given as arguments, or one per line on stdin. Sheets are downloaded concurrently, by a bounded
+number of workers, each of which reuses one keep-alive connection for all of its downloads. A download that fails
+with a network error is retried on a fresh connection. Sheets that are already cached are not downloaded again,
+unless the refresh flag is set.
+
+The outcome for each serial number is written to stdout. The utility exits with status 1 if any sheet could not be
+fetched.
+
+SYNOPSIS
+afe_calib_prefetch.py [-w WORKERS] [-r RETRIES] [-f] [-v] [AFE_SERIAL_NUMBER ...]
+
+EXAMPLES
+./afe_calib_prefetch.py 26-000345 26-000346
+cat batch_afe_serials.txt | ./afe_calib_prefetch.py -w 16 -v
+
+DOCUMENT EXAMPLE
+{"serial": "26-000345", "source": "download", "attempts": 1, "time": 0.214}
+
+FILES
+~/SCS/afe_calib_cache/AFE_SERIAL_NUMBER.json
+
+SEE ALSO
+scs_mfr/afe_calib
+"""
+
+import sys
+import time
+
+from scs_core.data.json import JSONify
+
+from scs_host.sys.host import Host
+
+from scs_mfr.calib.afe_calib_cache import AFECalibCache
+from scs_mfr.calib.afe_calib_prefetch import AFECalibPrefetch
+
+from scs_mfr.cmd.cmd_afe_calib_prefetch import CmdAFECalibPrefetch
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # cmd...
+
+    cmd = CmdAFECalibPrefetch()
+
+    if not cmd.is_valid():
+        cmd.print_help(sys.stderr)
+        exit(2)
+
+    if cmd.verbose:
+        print("afe_calib_prefetch: %s" % cmd, file=sys.stderr)
+        sys.stderr.flush()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # resources...
+
+    cache = AFECalibCache.open(Host)
+
+    prefetch = AFECalibPrefetch(cache, workers=cmd.workers, retries=cmd.retries, refresh=cmd.refresh)
+
+    if cmd.verbose:
+        print("afe_calib_prefetch: %s" % prefetch, file=sys.stderr)
+        sys.stderr.flush()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # run...
+
+    serial_numbers = cmd.serial_numbers if cmd.serial_numbers else [line.strip() for line in sys.stdin]
+    serial_numbers = [serial_number for serial_number in serial_numbers if serial_number]
+
+    start = time.monotonic()
+    fetched = 0
+    failed = 0
+
+    try:
+        for result in prefetch.fetch(serial_numbers):
+            if result.ok:
+                fetched += 1
+            else:
+                failed += 1
+
+            print(JSONify.dumps(result))
+            sys.stdout.flush()
+
+    except KeyboardInterrupt:
+        if cmd.verbose:
+            print("afe_calib_prefetch: KeyboardInterrupt", file=sys.stderr)
+
+    if cmd.verbose:
+        print("afe_calib_prefetch: fetched:%d failed:%d time:%0.1f" % (fetched, failed, time.monotonic() - start),
+              file=sys.stderr)
+
+    exit(1 if failed else 0)
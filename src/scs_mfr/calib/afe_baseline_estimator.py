@@ -0,0 +1,107 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Estimates the floor of an electrochemical sensor's concentration series, from which its baseline offset is found.
+
+In percentile mode, the floor is a low percentile of the series. In rolling-minimum mode, the series is divided into
+consecutive windows of readings, and the floor is the median of the window minima - so that a sensor that reads clean
+air at some time in most windows is credited with that reading, while occasional negative spikes are not.
+
+Either way, the estimate is streamed by P2Quantile, in constant memory, so that logs of any length may be processed.
+
+example JSON:
+{"n": 864000, "floor": 11.8}
+"""
+
+from collections import OrderedDict
+
+from scs_core.data.json import JSONable
+
+from scs_mfr.data.p2_quantile import P2Quantile
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class AFEBaselineEstimator(JSONable):
+    """
+    classdocs
+    """
+
+    DEFAULT_PERCENTILE =    5.0             # %
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, percentile=DEFAULT_PERCENTILE, window=None):
+        """
+        Constructor
+        """
+        self.__window = window                                  # int readings, or None for percentile mode
+
+        if window is None:
+            self.__quantile = P2Quantile(percentile / 100.0)
+
+        else:
+            self.__quantile = P2Quantile(0.5)
+
+        self.__n = 0
+        self.__window_count = 0
+        self.__window_minimum = None
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def append(self, cnc):
+        self.__n += 1
+
+        if self.__window is None:
+            self.__quantile.append(cnc)
+            return
+
+        if self.__window_minimum is None or cnc < self.__window_minimum:
+            self.__window_minimum = cnc
+
+        self.__window_count += 1
+
+        if self.__window_count == self.__window:
+            self.__quantile.append(self.__window_minimum)
+
+            self.__window_count = 0
+            self.__window_minimum = None
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self):
+        jdict = OrderedDict()
+
+        jdict['n'] = self.n
+        jdict['floor'] = None if self.floor is None else round(self.floor, 1)
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def floor(self):
+        """
+        returns the estimated floor, or None if there are too few readings - in rolling-minimum mode, the final
+        partial window is included only if there are no complete windows
+        """
+        if self.__quantile.count == 0 and self.__window_minimum is not None:
+            return self.__window_minimum
+
+        return self.__quantile.value
+
+
+    @property
+    def n(self):
+        return self.__n
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "AFEBaselineEstimator:{window:%s, quantile:%s, n:%s}" % (self.__window, self.__quantile, self.n)
@@ -0,0 +1,108 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A local mirror of Alphasense AFE calibration sheets, one JSON document per AFE serial number, as served by the
+AFECalib web API. Sheets are written to a temporary file and then renamed, so that concurrent writers and readers
+never see a partial sheet.
+"""
+
+import os
+import re
+import tempfile
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class AFECalibCache(object):
+    """
+    classdocs
+    """
+
+    __DIRECTORY =   "afe_calib_cache"
+    __SUFFIX =      ".json"
+
+    __SERIAL_NUMBER = re.compile(r'^[A-Za-z0-9][A-Za-z0-9_.-]*$')
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def directory(cls, host):
+        return os.path.join(host.scs_dir(), cls.__DIRECTORY)
+
+
+    @classmethod
+    def open(cls, host):
+        return AFECalibCache(cls.directory(host))
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, directory):
+        """
+        Constructor
+        """
+        self.__directory = directory                    # string path
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def get(self, serial_number):
+        """
+        returns the JSON string of the cached sheet, or None if the sheet is not cached
+        """
+        try:
+            with open(self.filename(serial_number)) as f:
+                return f.read()
+
+        except FileNotFoundError:
+            return None
+
+
+    def put(self, serial_number, jstr):
+        filename = self.filename(serial_number)
+
+        os.makedirs(self.__directory, exist_ok=True)
+
+        fd, tmp_filename = tempfile.mkstemp(dir=self.__directory, suffix=".tmp")
+
+        try:
+            with os.fdopen(fd, 'w') as f:
+                f.write(jstr)
+
+            os.replace(tmp_filename, filename)
+
+        except OSError:
+            os.remove(tmp_filename)
+            raise
+
+
+    def contains(self, serial_number):
+        return os.path.isfile(self.filename(serial_number))
+
+
+    def filename(self, serial_number):
+        if not self.__SERIAL_NUMBER.match(serial_number):
+            raise ValueError("invalid AFE serial number: %s" % serial_number)
+
+        return os.path.join(self.__directory, serial_number + self.__SUFFIX)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def serial_numbers(self):
+        try:
+            filenames = sorted(os.listdir(self.__directory))
+
+        except FileNotFoundError:
+            return []
+
+        return [filename[:-len(self.__SUFFIX)] for filename in filenames if filename.endswith(self.__SUFFIX)]
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "AFECalibCache:{directory:%s}" % self.__directory
@@ -0,0 +1,97 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+The outcome of fetching the calibration sheet of one AFE: its serial number, and either the source of the sheet -
+the cache, or a download - or the error that prevented it, with the number of attempts and the elapsed time.
+
+example JSON:
+{"serial": "26-000345", "source": "download", "attempts": 1, "time": 0.214}
+{"serial": "26-000346", "error": "HTTPException: 404: Not Found", "attempts": 1, "time": 0.187}
+"""
+
+from collections import OrderedDict
+
+from scs_core.data.json import JSONable
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class AFECalibFetchResult(JSONable):
+    """
+    classdocs
+    """
+
+    CACHE =     'cache'
+    DOWNLOAD =  'download'
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, serial_number, source, error, attempts, elapsed):
+        """
+        Constructor
+        """
+        self.__serial_number = serial_number        # string
+        self.__source = source                      # CACHE, DOWNLOAD, or None
+        self.__error = error                        # Exception, or None
+        self.__attempts = attempts                  # int
+        self.__elapsed = elapsed                    # float seconds
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self):
+        jdict = OrderedDict()
+
+        jdict['serial'] = self.serial_number
+
+        if self.error is None:
+            jdict['source'] = self.source
+
+        else:
+            jdict['error'] = "%s: %s" % (self.error.__class__.__name__, self.error)
+
+        jdict['attempts'] = self.attempts
+        jdict['time'] = round(self.elapsed, 3)
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def ok(self):
+        return self.error is None
+
+
+    @property
+    def serial_number(self):
+        return self.__serial_number
+
+
+    @property
+    def source(self):
+        return self.__source
+
+
+    @property
+    def error(self):
+        return self.__error
+
+
+    @property
+    def attempts(self):
+        return self.__attempts
+
+
+    @property
+    def elapsed(self):
+        return self.__elapsed
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "AFECalibFetchResult:{serial_number:%s, source:%s, error:%s, attempts:%s, elapsed:%s}" % \
+               (self.serial_number, self.source, self.error, self.attempts, self.elapsed)
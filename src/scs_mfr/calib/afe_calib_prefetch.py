@@ -0,0 +1,183 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Downloads the calibration sheets of a batch of AFEs to an AFECalibCache, with a bounded number of worker threads.
+Each worker holds one keep-alive HTTPClient connection to the AFECalib host, which it reuses for every sheet that it
+fetches, so that a batch costs one connection per worker rather than one per AFE.
+
+A download that fails with a network error is retried on a fresh connection, after a back-off. A download that the
+server refuses, or that is not a valid calibration sheet, is not retried, and is not cached. Sheets that are already
+cached are not downloaded unless a refresh is requested.
+"""
+
+import http.client
+import json
+import threading
+import time
+
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from scs_core.client.http_exception import HTTPException
+from scs_core.gas.afe_calib import AFECalib
+
+from scs_host.client.http_client import HTTPClient
+
+from scs_mfr.calib.afe_calib_fetch_result import AFECalibFetchResult
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class AFECalibPrefetch(object):
+    """
+    classdocs
+    """
+
+    DEFAULT_WORKERS =   8
+    DEFAULT_RETRIES =   2
+    DEFAULT_BACKOFF =   1.0                 # seconds, doubled on each retry
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def validate(jstr):
+        """
+        raises ValueError if the JSON string is not a valid AFE calibration sheet
+        """
+        jdict = json.loads(jstr, object_pairs_hook=OrderedDict)
+
+        if not isinstance(jdict, dict) or AFECalib.construct_from_jdict(jdict) is None:
+            raise ValueError("invalid calibration sheet")
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, cache, workers=DEFAULT_WORKERS, retries=DEFAULT_RETRIES, backoff=DEFAULT_BACKOFF,
+                 refresh=False):
+        """
+        Constructor
+        """
+        self.__cache = cache                        # AFECalibCache
+        self.__workers = workers                    # int
+        self.__retries = retries                    # int
+        self.__backoff = backoff                    # float seconds
+        self.__refresh = refresh                    # bool
+
+        self.__local = threading.local()
+
+        self.__clients = set()
+        self.__clients_lock = threading.Lock()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def fetch(self, serial_numbers):
+        """
+        yields AFECalibFetchResult for each distinct serial number - those cached or invalid first, then the downloads
+        in order of completion
+        """
+        pending = []
+
+        for serial_number in OrderedDict.fromkeys(serial_numbers):
+            try:
+                cached = not self.__refresh and self.__cache.contains(serial_number)
+
+            except ValueError as ex:
+                yield AFECalibFetchResult(serial_number, None, ex, 0, 0.0)
+                continue
+
+            if cached:
+                yield AFECalibFetchResult(serial_number, AFECalibFetchResult.CACHE, None, 0, 0.0)
+            else:
+                pending.append(serial_number)
+
+        if not pending:
+            return
+
+        try:
+            with ThreadPoolExecutor(max_workers=min(self.__workers, len(pending))) as executor:
+                futures = [executor.submit(self.__download, serial_number) for serial_number in pending]
+
+                for future in as_completed(futures):
+                    yield future.result()
+
+        finally:
+            with self.__clients_lock:
+                clients = list(self.__clients)
+                self.__clients.clear()
+
+            for client in clients:
+                client.close()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __download(self, serial_number):
+        start = time.monotonic()
+        attempts = 0
+
+        while True:
+            attempts += 1
+
+            try:
+                jstr = self.__client().get(AFECalib.PATH + serial_number, None, AFECalib.HEADER)
+
+                self.validate(jstr)
+                self.__cache.put(serial_number, jstr)
+
+                return AFECalibFetchResult(serial_number, AFECalibFetchResult.DOWNLOAD, None, attempts,
+                                           time.monotonic() - start)
+
+            except (OSError, http.client.HTTPException) as ex:
+                # network error - retry on a fresh connection...
+                self.__discard_client()
+
+                if attempts > self.__retries:
+                    return AFECalibFetchResult(serial_number, None, ex, attempts, time.monotonic() - start)
+
+                time.sleep(self.__backoff * 2 ** (attempts - 1))
+
+            except (HTTPException, ValueError) as ex:
+                return AFECalibFetchResult(serial_number, None, ex, attempts, time.monotonic() - start)
+
+
+    def __client(self):
+        client = getattr(self.__local, 'client', None)
+
+        if client is None:
+            client = HTTPClient()
+            client.connect(AFECalib.HOST)
+
+            self.__local.client = client
+
+            with self.__clients_lock:
+                self.__clients.add(client)
+
+        return client
+
+
+    def __discard_client(self):
+        client = getattr(self.__local, 'client', None)
+
+        if client is None:
+            return
+
+        self.__local.client = None
+
+        with self.__clients_lock:
+            self.__clients.discard(client)
+
+        try:
+            client.close()
+
+        except OSError:
+            pass
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "AFECalibPrefetch:{cache:%s, workers:%s, retries:%s, backoff:%s, refresh:%s}" % \
+               (self.__cache, self.__workers, self.__retries, self.__backoff, self.__refresh)
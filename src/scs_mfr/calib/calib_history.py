@@ -0,0 +1,223 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+An embedded SQLite history of the calibration documents saved on this host - AFE calibration sheets, AFE baselines,
+Pt1000 calibrations and MPL115A2 calibrations. Each kind of calibration is versioned, and a new version is appended
+whenever a document differs from the latest version of its kind. Versions are never updated or deleted.
+
+Versions are indexed on kind and calibrated-on, normalised to UTC, so that the calibration in force at any time -
+the version with the latest calibrated-on no later than that time - is found by a single index seek. Where a document
+has no calibrated-on of its own, its most recent sensor calibrated-on is used, or else the time it was recorded.
+
+example record:
+{"kind": "pt1000_calib", "version": 3, "calibrated-on": "2026-10-18T10:21:07.113000Z",
+"recorded": "2026-10-18T10:21:08.004000Z", "calib": {"calibrated-on": "2026-10-18T10:21:07.113+00:00", "v20": 0.002891}}
+"""
+
+import json
+import os
+import sqlite3
+
+from collections import OrderedDict
+from datetime import datetime
+
+from scs_core.data.json import JSONify
+
+from scs_mfr.calib.calib_timeline import CalibTimeline
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CalibHistory(object):
+    """
+    classdocs
+    """
+
+    AFE_CALIB =         'afe_calib'
+    AFE_BASELINE =      'afe_baseline'
+    PT1000_CALIB =      'pt1000_calib'
+    MPL115A2_CALIB =    'mpl115a2_calib'
+
+    KINDS = (AFE_CALIB, AFE_BASELINE, PT1000_CALIB, MPL115A2_CALIB)
+
+    __FILENAME =        "calib_history.db"
+
+    __SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS calibs (kind TEXT NOT NULL, version INTEGER NOT NULL, "
+        "calibrated_on TEXT NOT NULL, recorded TEXT NOT NULL, document TEXT NOT NULL, PRIMARY KEY (kind, version))",
+        "CREATE INDEX IF NOT EXISTS calibs_calibrated_on ON calibs (kind, calibrated_on, version)",
+
+        "CREATE TRIGGER IF NOT EXISTS calibs_no_update BEFORE UPDATE ON calibs "
+        "BEGIN SELECT RAISE(ABORT, 'calibration history is append-only'); END",
+        "CREATE TRIGGER IF NOT EXISTS calibs_no_delete BEFORE DELETE ON calibs "
+        "BEGIN SELECT RAISE(ABORT, 'calibration history is append-only'); END"
+    )
+
+    __COLUMNS = "kind, version, calibrated_on, recorded, document"
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def filename(cls, host):
+        return os.path.join(host.scs_dir(), cls.__FILENAME)
+
+
+    @classmethod
+    def open(cls, host):
+        return cls.open_file(cls.filename(host))
+
+
+    @classmethod
+    def open_file(cls, filename):
+        directory = os.path.dirname(filename)
+
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        connection = sqlite3.connect(filename)
+        connection.execute("PRAGMA journal_mode=WAL")
+
+        with connection:
+            for statement in cls.__SCHEMA:
+                connection.execute(statement)
+
+        return CalibHistory(connection)
+
+
+    @classmethod
+    def record(cls, host, kind, calib):
+        """
+        appends the calibration to the history of the host, as it is saved
+        returns the version of the kind that holds the calibration
+        """
+        history = cls.open(host)
+
+        try:
+            return history.append(kind, calib)
+
+        finally:
+            history.close()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def __calibrated_on(cls, jdict):
+        for key in ('calibrated-on', 'calibrated_on'):
+            if key in jdict:
+                return CalibTimeline.key(jdict[key])
+
+        # baselines: the most recent of the sensor baselines...
+        sensors = [cls.__calibrated_on(node) for node in jdict.values() if isinstance(node, dict)]
+        sensors = [calibrated_on for calibrated_on in sensors if calibrated_on is not None]
+
+        return max(sensors) if sensors else None
+
+
+    @classmethod
+    def __record(cls, row):
+        kind, version, calibrated_on, recorded, document = row
+
+        jdict = OrderedDict()
+
+        jdict['kind'] = kind
+        jdict['version'] = version
+        jdict['calibrated-on'] = calibrated_on
+        jdict['recorded'] = recorded
+        jdict['calib'] = json.loads(document, object_pairs_hook=OrderedDict)
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, connection):
+        """
+        Constructor
+        """
+        self.__connection = connection
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def append(self, kind, calib):
+        """
+        calib: a calibration, or its JSON dictionary
+        returns the version of the kind that holds the calibration - the latest version if it is unchanged
+        """
+        if kind not in self.KINDS:
+            raise ValueError("unknown calibration kind: %s" % kind)
+
+        jdict = calib if isinstance(calib, dict) else json.loads(JSONify.dumps(calib), object_pairs_hook=OrderedDict)
+        document = json.dumps(jdict)
+
+        recorded = datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+        calibrated_on = self.__calibrated_on(jdict) or recorded
+
+        with self.__connection:
+            row = self.__connection.execute("SELECT version, document FROM calibs WHERE kind = ? "
+                                            "ORDER BY version DESC LIMIT 1", (kind, )).fetchone()
+
+            if row is not None and row[1] == document:
+                return row[0]
+
+            version = 1 if row is None else row[0] + 1
+
+            self.__connection.execute("INSERT INTO calibs (%s) VALUES (?, ?, ?, ?, ?)" % self.__COLUMNS,
+                                      (kind, version, calibrated_on, recorded, document))
+
+        return version
+
+
+    def close(self):
+        self.__connection.close()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def in_force(self, kind, when):
+        """
+        when: an ISO 8601 datetime
+        returns the record of the given kind in force at the given time, or None
+        """
+        at = CalibTimeline.key(when)
+
+        if at is None:
+            raise ValueError("invalid datetime: %s" % when)
+
+        row = self.__connection.execute("SELECT %s FROM calibs WHERE kind = ? AND calibrated_on <= ? "
+                                        "ORDER BY calibrated_on DESC, version DESC LIMIT 1" % self.__COLUMNS,
+                                        (kind, at)).fetchone()
+
+        return None if row is None else self.__record(row)
+
+
+    def records(self, kind=None):
+        """
+        returns the records of the given kind, or of every kind, in calibrated-on order
+        """
+        if kind is None:
+            rows = self.__connection.execute("SELECT %s FROM calibs ORDER BY kind, calibrated_on, version" %
+                                             self.__COLUMNS)
+        else:
+            rows = self.__connection.execute("SELECT %s FROM calibs WHERE kind = ? ORDER BY calibrated_on, version" %
+                                             self.__COLUMNS, (kind, ))
+
+        for row in rows:
+            yield self.__record(row)
+
+
+    def timeline(self, kind):
+        """
+        returns a CalibTimeline of every record of the given kind, for bulk lookups in memory
+        """
+        return CalibTimeline(self.records(kind))
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "CalibHistory:{connection:%s}" % self.__connection
@@ -0,0 +1,95 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+The versions of one kind of calibration, held in memory in calibrated-on order, so that the calibration in force at
+each of a long series of times is found by bisection, without a query per lookup.
+"""
+
+import bisect
+import re
+
+from datetime import datetime, timedelta
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CalibTimeline(object):
+    """
+    classdocs
+    """
+
+    __ISO_8601 = re.compile(r'^(\d{4}-\d{2}-\d{2}(?:[T ]\d{2}:\d{2}:\d{2})?)(?:\.(\d+))?(Z|[+-]\d{2}:?\d{2})?$')
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def key(cls, iso):
+        """
+        returns the ISO 8601 datetime or date as a fixed-width UTC string, which sorts chronologically, or None if
+        it cannot be parsed - a datetime without an offset, or a date, is taken to be UTC
+        """
+        if iso is None:
+            return None
+
+        match = cls.__ISO_8601.match(str(iso).strip())
+
+        if match is None:
+            return None
+
+        body, fraction, offset = match.groups()
+
+        try:
+            value = datetime.strptime(body.replace(" ", "T"), "%Y-%m-%d" if len(body) == 10 else "%Y-%m-%dT%H:%M:%S")
+
+        except ValueError:
+            return None
+
+        if fraction:
+            value = value.replace(microsecond=int((fraction + '00000')[:6]))
+
+        if offset and offset != 'Z':
+            sign = -1 if offset[0] == '-' else 1
+            minutes = int(offset[1:3]) * 60 + int(offset[-2:])
+
+            value -= timedelta(minutes=sign * minutes)
+
+        return value.strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, records):
+        """
+        Constructor
+        """
+        self.__records = list(records)                          # CalibHistory records, in calibrated-on order
+        self.__keys = [record['calibrated-on'] for record in self.__records]
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def in_force(self, when):
+        """
+        when: an ISO 8601 datetime
+        returns the record in force at the given time, or None
+        """
+        at = self.key(when)
+
+        if at is None:
+            raise ValueError("invalid datetime: %s" % when)
+
+        index = bisect.bisect_right(self.__keys, at)
+
+        return None if index == 0 else self.__records[index - 1]
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __len__(self):
+        return len(self.__records)
+
+
+    def __str__(self, *args, **kwargs):
+        return "CalibTimeline:{records:%d}" % len(self)
@@ -0,0 +1,128 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+The calibration of one device over a climate chamber temperature ramp. The Pt1000 voltage and the MPL115A2
+temperature count are each fitted, by least squares, against the chamber reference temperature - the Pt1000 calib
+v20 is then the fitted voltage at 20 °C, and the MPL115A2 calib c25 the fitted count at 25 °C.
+
+A fit is only used if it has at least the minimum number of points, over at least the minimum temperature span.
+
+example JSON:
+{"device": "30-000123", "pt1000": {"n": 240, "span": 35.2, "slope": 0.001002, "intercept": 0.330114, "rms": 1.9e-05,
+"v20": 0.350154}, "mpl115a2": {"n": 240, "span": 35.2, "slope": -5.351, "intercept": 644.8, "rms": 0.61, "c25": 511}}
+"""
+
+from collections import OrderedDict
+
+from scs_core.climate.mpl115a2_calib import MPL115A2Calib
+from scs_core.data.json import JSONable
+from scs_core.gas.pt1000_calib import Pt1000Calib
+
+from scs_mfr.data.linear_fit import LinearFit
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class ChamberCalibration(JSONable):
+    """
+    classdocs
+    """
+
+    PT1000_REF_TEMP =       20.0            # °C
+    MPL115A2_REF_TEMP =     25.0            # °C
+
+    DEFAULT_MIN_POINTS =    10
+    DEFAULT_MIN_SPAN =      10.0            # °C
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, device, min_points=DEFAULT_MIN_POINTS, min_span=DEFAULT_MIN_SPAN):
+        """
+        Constructor
+        """
+        self.__device = device                      # string
+        self.__min_points = min_points              # int
+        self.__min_span = min_span                  # float °C
+
+        self.__pt1000 = LinearFit()                 # V against °C
+        self.__mpl115a2 = LinearFit()               # count against °C
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def append(self, ref_temp, pt1000_v=None, mpl115a2_tc=None):
+        if pt1000_v is not None:
+            self.__pt1000.append(ref_temp, pt1000_v)
+
+        if mpl115a2_tc is not None:
+            self.__mpl115a2.append(ref_temp, mpl115a2_tc)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def pt1000_calib(self):
+        """
+        returns Pt1000Calib, or None if the Pt1000 fit is not adequate
+        """
+        if not self.__adequate(self.__pt1000):
+            return None
+
+        return Pt1000Calib(None, round(self.__pt1000.value_at(self.PT1000_REF_TEMP), 6))
+
+
+    def mpl115a2_calib(self):
+        """
+        returns MPL115A2Calib, or None if the MPL115A2 fit is not adequate
+        """
+        if not self.__adequate(self.__mpl115a2):
+            return None
+
+        return MPL115A2Calib(None, int(round(self.__mpl115a2.value_at(self.MPL115A2_REF_TEMP))))
+
+
+    def __adequate(self, fit):
+        return fit.slope is not None and fit.n >= self.__min_points and fit.span >= self.__min_span
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self):
+        jdict = OrderedDict()
+
+        jdict['device'] = self.device
+
+        jdict['pt1000'] = self.__pt1000.as_json()
+        pt1000_calib = self.pt1000_calib()
+        jdict['pt1000']['v20'] = None if pt1000_calib is None else pt1000_calib.v20
+
+        jdict['mpl115a2'] = self.__mpl115a2.as_json()
+        mpl115a2_calib = self.mpl115a2_calib()
+        jdict['mpl115a2']['c25'] = None if mpl115a2_calib is None else mpl115a2_calib.c25
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def device(self):
+        return self.__device
+
+
+    @property
+    def pt1000(self):
+        return self.__pt1000
+
+
+    @property
+    def mpl115a2(self):
+        return self.__mpl115a2
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "ChamberCalibration:{device:%s, min_points:%s, min_span:%s, pt1000:%s, mpl115a2:%s}" % \
+               (self.device, self.__min_points, self.__min_span, self.pt1000, self.mpl115a2)
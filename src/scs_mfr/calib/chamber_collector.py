@@ -0,0 +1,95 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Collects the paired reference and sensor readings of many devices in a climate chamber, in whatever order they
+arrive, into one ChamberCalibration for each device. Each reading is folded into its device's fits as it arrives, so
+that all the devices are calibrated in a single pass over the readings, in memory proportional to the number of
+devices rather than the number of readings.
+
+Each reading gives the device, the chamber reference temperature, and either or both of the Pt1000 voltage and the
+MPL115A2 temperature count.
+
+example reading:
+{"device": "30-000123", "ref": {"tmp": 25.02}, "pt1000": {"v": 0.355143}, "mpl115a2": {"tc": 511}}
+"""
+
+import re
+
+from collections import OrderedDict
+
+from scs_mfr.calib.chamber_calibration import ChamberCalibration
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class ChamberCollector(object):
+    """
+    classdocs
+    """
+
+    __DEVICE = re.compile(r'^[A-Za-z0-9][A-Za-z0-9_.-]*$')
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def is_valid_device(cls, device):
+        """
+        a device identifier is used as a directory name, so may not be a path, or a relative reference such as ".."
+        """
+        return isinstance(device, str) and cls.__DEVICE.match(device) is not None
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, min_points=ChamberCalibration.DEFAULT_MIN_POINTS, min_span=ChamberCalibration.DEFAULT_MIN_SPAN):
+        """
+        Constructor
+        """
+        self.__min_points = min_points                  # int
+        self.__min_span = min_span                      # float °C
+
+        self.__calibrations = OrderedDict()             # device: ChamberCalibration
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def append(self, jdict):
+        """
+        raises ValueError if the reading is not valid
+        """
+        try:
+            device = jdict['device']
+            ref_temp = float(jdict['ref']['tmp'])
+
+            pt1000 = jdict.get('pt1000')
+            pt1000_v = None if pt1000 is None else float(pt1000['v'])
+
+            mpl115a2 = jdict.get('mpl115a2')
+            mpl115a2_tc = None if mpl115a2 is None else float(mpl115a2['tc'])
+
+        except (KeyError, TypeError, AttributeError) as ex:
+            raise ValueError("invalid reading: %s" % ex)
+
+        if not self.is_valid_device(device):
+            raise ValueError("invalid device: %s" % device)
+
+        if device not in self.__calibrations:
+            self.__calibrations[device] = ChamberCalibration(device, self.__min_points, self.__min_span)
+
+        self.__calibrations[device].append(ref_temp, pt1000_v=pt1000_v, mpl115a2_tc=mpl115a2_tc)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def calibrations(self):
+        return list(self.__calibrations.values())
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "ChamberCollector:{min_points:%s, min_span:%s, devices:%s}" % \
+               (self.__min_points, self.__min_span, len(self.__calibrations))
@@ -0,0 +1,176 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Samples an SHT and an MPL115A2 interleaved at a fixed cadence - SHT, barometer, SHT, barometer, SHT... - so that each
+barometer sample is bracketed by two SHT samples. Each barometer sample gives an estimate of c25 from the mean of the
+temperatures either side of it, which is therefore aligned in time with the barometer sample.
+
+c25 is the median of the estimates, which is robust to outlying pairs. Sampling stops once the median has moved by no
+more than the tolerance over the last window of samples, or once the maximum number of samples has been taken.
+
+example JSON:
+{"converged": true, "samples": 14, "elapsed": 6.512, "c25": 511, "mad": 1.0}
+"""
+
+import bisect
+import time
+
+from collections import deque, OrderedDict
+
+from scs_core.data.json import JSONable
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class MPL115A2Interleaving(JSONable):
+    """
+    classdocs
+    """
+
+    DEFAULT_CADENCE =       0.5             # seconds
+    DEFAULT_WINDOW =        10              # samples
+    DEFAULT_TOLERANCE =     0.5             # counts
+    DEFAULT_MAX_SAMPLES =   200
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def __median(ordered):
+        n = len(ordered)
+
+        if n == 0:
+            return None
+
+        mid = n // 2
+
+        return float(ordered[mid]) if n % 2 else (ordered[mid - 1] + ordered[mid]) / 2.0
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, sht, barometer, cadence=DEFAULT_CADENCE, window=DEFAULT_WINDOW, tolerance=DEFAULT_TOLERANCE,
+                 max_samples=DEFAULT_MAX_SAMPLES):
+        """
+        Constructor
+        """
+        self.__sht = sht
+        self.__barometer = barometer                    # an initialised MPL115A2
+
+        self.__cadence = cadence                        # float seconds
+        self.__window = window                          # int samples
+        self.__tolerance = tolerance                    # float counts
+        self.__max_samples = max_samples                # int
+
+        self.__estimates = []                           # sorted c25 estimates
+        self.__medians = deque(maxlen=window + 1)
+
+        self.__elapsed = 0.0
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def run(self, listener=None):
+        """
+        listener: callable taking the SHT temperature and barometer datum of each pair, or None
+        returns True if converged, False if the maximum number of samples was reached
+        """
+        start = time.monotonic()
+        before = self.__sht.sample().temp
+
+        while True:
+            datum = self.__barometer.sample()
+            after = self.__sht.sample().temp
+
+            temp = (before + after) / 2.0
+            before = after
+
+            bisect.insort(self.__estimates, datum.c25(temp))
+            self.__medians.append(self.median)
+
+            self.__elapsed = time.monotonic() - start
+
+            if listener is not None:
+                listener(temp, datum)
+
+            if self.converged:
+                return True
+
+            if self.samples >= self.__max_samples:
+                return False
+
+            # wait for the next tick...
+            next_tick = start + self.samples * self.__cadence
+            time.sleep(max(next_tick - time.monotonic(), 0.0))
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self):
+        jdict = OrderedDict()
+
+        jdict['converged'] = self.converged
+        jdict['samples'] = self.samples
+        jdict['elapsed'] = round(self.elapsed, 3)
+        jdict['c25'] = self.c25
+        jdict['mad'] = self.mad
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def converged(self):
+        if len(self.__medians) <= self.__window:
+            return False
+
+        median = self.__medians[-1]
+
+        return all(abs(previous - median) <= self.__tolerance for previous in self.__medians)
+
+
+    @property
+    def median(self):
+        return self.__median(self.__estimates)
+
+
+    @property
+    def c25(self):
+        """
+        returns int count, or None if there are no samples
+        """
+        median = self.median
+
+        return None if median is None else int(round(median))
+
+
+    @property
+    def mad(self):
+        """
+        returns the median absolute deviation of the estimates from their median, or None if there are no samples
+        """
+        median = self.median
+
+        if median is None:
+            return None
+
+        return self.__median(sorted(abs(estimate - median) for estimate in self.__estimates))
+
+
+    @property
+    def samples(self):
+        return len(self.__estimates)
+
+
+    @property
+    def elapsed(self):
+        return self.__elapsed
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "MPL115A2Interleaving:{cadence:%s, window:%s, tolerance:%s, max_samples:%s, samples:%s, median:%s}" % \
+               (self.__cadence, self.__window, self.__tolerance, self.__max_samples, self.samples, self.median)
@@ -0,0 +1,64 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A Pt1000Calib found once the SHT and Pt1000 readings have settled: v20 is the mean of the settled window, and is
+saved together with the number of paired samples in the window and its uncertainty - the standard error of the mean.
+
+The additional fields are ignored by Pt1000Calib.load(..).
+
+example JSON:
+{"calibrated-on": "2026-10-18T10:21:07.113+00:00", "v20": 0.002891, "n": 20, "uncertainty": 4e-06}
+"""
+
+from scs_core.gas.pt1000_calib import Pt1000Calib
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class Pt1000SettledCalib(Pt1000Calib):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, calibrated_on, v20, n, uncertainty):
+        """
+        Constructor
+        """
+        super().__init__(calibrated_on, v20)
+
+        self.__n = n                                # int
+        self.__uncertainty = uncertainty            # float V
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self):
+        jdict = super().as_json()
+
+        jdict['n'] = self.n
+        jdict['uncertainty'] = round(self.uncertainty, 6)
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def n(self):
+        return self.__n
+
+
+    @property
+    def uncertainty(self):
+        return self.__uncertainty
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "Pt1000SettledCalib:{calibrated_on:%s, v20:%s, n:%s, uncertainty:%s}" % \
+               (self.calibrated_on, self.v20, self.n, self.uncertainty)
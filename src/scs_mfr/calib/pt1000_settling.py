@@ -0,0 +1,150 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Samples an SHT and a Pt1000 in lockstep, at a fixed interval, until both have settled or the timeout is reached.
+
+For each pair of samples, the SHT temperature and the Pt1000 voltage at 20 °C back-calculated from that temperature
+are appended to settling windows. Sampling stops as soon as both windows have settled - so that a board that has
+already warmed up is calibrated after one window, and a board that is still warming up is not calibrated until it has
+finished.
+
+example JSON:
+{"settled": true, "samples": 26, "elapsed": 25.012, "temp": {"n": 20, "mean": 22.03, "std": 0.011, "ptp": 0.04,
+"slope": 0.0002}, "v20": {"n": 20, "mean": 0.002891, "std": 1.8e-05, "ptp": 6.1e-05, "slope": -1e-06}}
+"""
+
+import math
+import time
+
+from collections import OrderedDict
+
+from scs_core.data.json import JSONable
+
+from scs_mfr.calib.pt1000_settled_calib import Pt1000SettledCalib
+
+from scs_mfr.data.settling_window import SettlingWindow
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class Pt1000Settling(JSONable):
+    """
+    classdocs
+    """
+
+    DEFAULT_WINDOW =        20                  # samples
+    DEFAULT_INTERVAL =      1.0                 # seconds
+    DEFAULT_TIMEOUT =       600.0               # seconds
+
+    DEFAULT_TEMP_SLOPE =    0.1 / 60.0          # °C / s
+    DEFAULT_TEMP_STD =      0.1                 # °C
+
+    DEFAULT_V20_SLOPE =     0.0001 / 60.0       # V / s
+    DEFAULT_V20_STD =       0.0001              # V
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, sht, afe, window=DEFAULT_WINDOW, interval=DEFAULT_INTERVAL, timeout=DEFAULT_TIMEOUT,
+                 temp_limits=(DEFAULT_TEMP_SLOPE, DEFAULT_TEMP_STD), v20_limits=(DEFAULT_V20_SLOPE, DEFAULT_V20_STD)):
+        """
+        Constructor
+        """
+        self.__sht = sht
+        self.__afe = afe
+
+        self.__interval = interval                                      # float seconds
+        self.__timeout = timeout                                        # float seconds
+
+        self.__temp_window = SettlingWindow(window, *temp_limits)       # (slope °C / s, std °C)
+        self.__v20_window = SettlingWindow(window, *v20_limits)         # (slope V / s, std V)
+
+        self.__samples = 0
+        self.__elapsed = 0.0
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def run(self, listener=None):
+        """
+        listener: callable taking this Pt1000Settling after each pair of samples, or None
+        returns True if settled, False if timed out
+        """
+        start = time.monotonic()
+
+        while True:
+            sht_datum = self.__sht.sample()
+            pt1000_datum = self.__afe.sample_pt1000()
+
+            now = time.monotonic() - start
+
+            self.__temp_window.append(sht_datum.temp, now)
+            self.__v20_window.append(pt1000_datum.v20(sht_datum.temp), now)
+
+            self.__samples += 1
+            self.__elapsed = now
+
+            if listener is not None:
+                listener(self)
+
+            if self.settled:
+                return True
+
+            if now >= self.__timeout:
+                return False
+
+            # wait for the next tick...
+            next_tick = start + self.__samples * self.__interval
+            time.sleep(max(next_tick - time.monotonic(), 0.0))
+
+
+    def calib(self):
+        """
+        returns Pt1000SettledCalib from the v20 window, or None if it holds fewer than two samples
+        """
+        statistics = self.__v20_window.statistics
+
+        if statistics is None or statistics.std is None:
+            return None
+
+        return Pt1000SettledCalib(None, round(statistics.mean, 6), statistics.n,
+                                  statistics.std / math.sqrt(statistics.n))
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self):
+        jdict = OrderedDict()
+
+        jdict['settled'] = self.settled
+        jdict['samples'] = self.samples
+        jdict['elapsed'] = round(self.elapsed, 3)
+        jdict['temp'] = self.__temp_window.statistics
+        jdict['v20'] = self.__v20_window.statistics
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def settled(self):
+        return self.__temp_window.settled and self.__v20_window.settled
+
+
+    @property
+    def samples(self):
+        return self.__samples
+
+
+    @property
+    def elapsed(self):
+        return self.__elapsed
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "Pt1000Settling:{interval:%s, timeout:%s, temp_window:%s, v20_window:%s, samples:%s, elapsed:%s}" % \
+               (self.__interval, self.__timeout, self.__temp_window, self.__v20_window, self.samples, self.elapsed)
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+DESCRIPTION
+The calib_history utility is used to query the history of the calibrations saved on the host system - AFE calibration
+sheets, AFE baselines, Pt1000 calibrations and MPL115A2 calibrations. Whereas each calibration utility overwrites its
+configuration file, every calibration that it saves is also appended to the history - an SQLite database in the SCS
+directory - as a new version of its kind. Versions are never changed or removed.
+
+The import mode appends the calibrations currently saved on the host, and is used to start the history on a system
+whose calibrations predate it. A calibration that is unchanged since the latest version of its kind is not appended.
+
+The list mode reports every version, in calibrated-on order. The at mode reports the calibration of each kind in force
+at the given time - the version with the latest calibrated-on no later than that time. The annotate mode reads JSON
+documents, such as gases_sampler output, from stdin, and writes each with a calib field holding the calibrations in
+force at its rec, so that historical readings can be reprocessed in bulk with the offsets that were then active.
+In annotate mode, every version of each kind is read once, and each document is then matched by bisection.
+
+SYNOPSIS
+calib_history.py { -i | -l | -t DATETIME | -a } [-k KIND] [-f DB_FILE] [-v]
+
+EXAMPLES
+./calib_history.py -i
+./calib_history.py -t 2026-06-01T12:00:00Z -k afe_baseline
+csv_reader.py gases.csv | ./calib_history.py -a -k afe_baseline
+
+DOCUMENT EXAMPLE
+{"kind": "afe_baseline", "version": 4, "calibrated-on": "2026-10-12T09:14:55.201000Z",
+"recorded": "2026-10-12T09:14:55.410000Z", "calib": {"sn1": {"calibrated-on": "2026-10-12T10:14:55.201+01:00",
+"offset": -3}, "sn2": {"calibrated-on": null, "offset": 0}, "sn3": {"calibrated-on": null, "offset": 0},
+"sn4": {"calibrated-on": null, "offset": 0}}}
+
+FILES
+~/SCS/calib_history.db
+
+SEE ALSO
+scs_mfr/afe_baseline
+scs_mfr/afe_calib
+scs_mfr/mpl115a2_calib
+scs_mfr/pt1000_calib
+"""
+
+import json
+import sys
+
+from collections import OrderedDict
+
+from scs_core.climate.mpl115a2_calib import MPL115A2Calib
+
+from scs_core.data.json import JSONify
+
+from scs_core.gas.afe_baseline import AFEBaseline
+from scs_core.gas.afe_calib import AFECalib
+from scs_core.gas.pt1000_calib import Pt1000Calib
+
+from scs_host.sys.host import Host
+
+from scs_mfr.calib.calib_history import CalibHistory
+
+from scs_mfr.cmd.cmd_calib_history import CmdCalibHistory
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+CALIBS = OrderedDict((
+    (CalibHistory.AFE_CALIB, AFECalib),
+    (CalibHistory.AFE_BASELINE, AFEBaseline),
+    (CalibHistory.PT1000_CALIB, Pt1000Calib),
+    (CalibHistory.MPL115A2_CALIB, MPL115A2Calib)
+))
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # cmd...
+
+    cmd = CmdCalibHistory()
+
+    if not cmd.is_valid():
+        cmd.print_help(sys.stderr)
+        exit(2)
+
+    if cmd.verbose:
+        print("calib_history: %s" % cmd, file=sys.stderr)
+        sys.stderr.flush()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # resources...
+
+    filename = CalibHistory.filename(Host) if cmd.db_filename is None else cmd.db_filename
+
+    history = CalibHistory.open_file(filename)
+
+    if cmd.verbose:
+        print("calib_history: %s" % filename, file=sys.stderr)
+        sys.stderr.flush()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # run...
+
+    try:
+        if cmd.import_calibs:
+            for kind in cmd.kinds:
+                calib = CALIBS[kind].load(Host)
+
+                if calib is None:
+                    continue
+
+                version = history.append(kind, calib)
+
+                if cmd.verbose:
+                    print("calib_history: %s: version %d" % (kind, version), file=sys.stderr)
+
+        if cmd.list:
+            for record in history.records(cmd.kind):
+                print(JSONify.dumps(record))
+                sys.stdout.flush()
+
+        if cmd.at is not None:
+            try:
+                for kind in cmd.kinds:
+                    record = history.in_force(kind, cmd.at)
+
+                    if record is not None:
+                        print(JSONify.dumps(record))
+
+            except ValueError as ex:
+                print("calib_history: %s" % ex, file=sys.stderr)
+                exit(2)
+
+        if cmd.annotate:
+            timelines = OrderedDict((kind, history.timeline(kind)) for kind in cmd.kinds)
+
+            if cmd.verbose:
+                print("calib_history: %s" % ", ".join("%s:%d" % (kind, len(timeline))
+                                                      for kind, timeline in timelines.items()), file=sys.stderr)
+                sys.stderr.flush()
+
+            for line in sys.stdin:
+                if not line.strip():
+                    continue
+
+                try:
+                    jdict = json.loads(line, object_pairs_hook=OrderedDict)
+
+                    if not isinstance(jdict, dict):
+                        raise ValueError("not a JSON object: %s" % line.strip())
+
+                    jdict['calib'] = OrderedDict((kind, timeline.in_force(jdict.get('rec')))
+                                                 for kind, timeline in timelines.items())
+
+                except ValueError as ex:
+                    print("calib_history: %s" % ex, file=sys.stderr)
+                    continue
+
+                print(JSONify.dumps(jdict))
+                sys.stdout.flush()
+
+    except KeyboardInterrupt:
+        if cmd.verbose:
+            print("calib_history: KeyboardInterrupt", file=sys.stderr)
+
+    finally:
+        history.close()
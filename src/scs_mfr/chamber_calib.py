@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+DESCRIPTION
+The chamber_calib utility is used to calibrate the Pt1000 and MPL115A2 sensors of many devices at once, over a climate
+chamber temperature ramp, rather than one device at a time at room temperature.
+
+Readings are read from stdin, one JSON document per line, in any order - for example, the merged output of all the
+devices in the chamber. Each reading gives the device, the chamber reference temperature, and either or both of the
+Pt1000 voltage and the MPL115A2 temperature count. Each reading is folded into least-squares fits of the device's
+sensors against the reference temperature as it arrives, so that all the devices are calibrated in a single pass.
+
+At the end of input, the slope, offset and RMS residual of each fit are written to stdout, one JSON document per
+device. The Pt1000 calib v20 is the fitted voltage at 20 °C, and the MPL115A2 calib c25 the fitted count at 25 °C. A
+fit is only used if it has at least MIN_POINTS readings, over a span of at least MIN_SPAN °C.
+
+If a directory is given, the Pt1000 and MPL115A2 calibrations of each device are written to DIR/DEVICE, with the
+file names used in the device's conf directory. A device identifier must be a single file name - letters, digits,
+"_", "." and "-", not starting with "." - and a reading that gives any other device is rejected.
+
+SYNOPSIS
+chamber_calib.py [-d DIR] [-m MIN_POINTS] [-s MIN_SPAN] [-v]
+
+EXAMPLES
+cat chamber_run.json | ./chamber_calib.py -d ~/SCS/chamber -s 20
+
+DOCUMENT EXAMPLE - INPUT
+{"device": "30-000123", "ref": {"tmp": 25.02}, "pt1000": {"v": 0.355143}, "mpl115a2": {"tc": 511}}
+
+DOCUMENT EXAMPLE - OUTPUT
+{"device": "30-000123", "pt1000": {"n": 240, "span": 35.2, "slope": 0.001002, "intercept": 0.330114, "rms": 1.9e-05,
+"v20": 0.350154}, "mpl115a2": {"n": 240, "span": 35.2, "slope": -5.351, "intercept": 644.8, "rms": 0.61, "c25": 511}}
+
+FILES
+DIR/DEVICE/pt1000_calib.json
+DIR/DEVICE/mpl115a2_calib.json
+
+SEE ALSO
+scs_mfr/mpl115a2_calib
+scs_mfr/pt1000_calib
+"""
+
+import json
+import os
+import sys
+
+from collections import OrderedDict
+
+from scs_core.data.json import JSONify
+
+from scs_mfr.calib.chamber_collector import ChamberCollector
+
+from scs_mfr.cmd.cmd_chamber_calib import CmdChamberCalib
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+def save(directory, device, filename, calib):
+    if not ChamberCollector.is_valid_device(device):
+        raise ValueError("invalid device: %s" % device)
+
+    device_dir = os.path.join(directory, device)
+    os.makedirs(device_dir, exist_ok=True)
+
+    with open(os.path.join(device_dir, filename), 'w') as f:
+        f.write(JSONify.dumps(calib) + '\n')
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # cmd...
+
+    cmd = CmdChamberCalib()
+
+    if not cmd.is_valid():
+        cmd.print_help(sys.stderr)
+        exit(2)
+
+    if cmd.verbose:
+        print("chamber_calib: %s" % cmd, file=sys.stderr)
+        sys.stderr.flush()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # resources...
+
+    collector = ChamberCollector(min_points=cmd.min_points, min_span=cmd.min_span)
+
+    readings = 0
+    rejected = 0
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # run...
+
+    try:
+        for line in sys.stdin:
+            line = line.strip()
+
+            if not line:
+                continue
+
+            try:
+                collector.append(json.loads(line, object_pairs_hook=OrderedDict))
+                readings += 1
+
+            except ValueError as ex:
+                rejected += 1
+
+                if cmd.verbose:
+                    print("chamber_calib: %s" % ex, file=sys.stderr)
+
+    except KeyboardInterrupt:
+        if cmd.verbose:
+            print("chamber_calib: KeyboardInterrupt", file=sys.stderr)
+
+    if cmd.verbose:
+        print("chamber_calib: %s, readings:%d, rejected:%d" % (collector, readings, rejected), file=sys.stderr)
+        sys.stderr.flush()
+
+    incomplete = 0
+
+    for calibration in collector.calibrations:
+        print(JSONify.dumps(calibration))
+
+        pt1000_calib = calibration.pt1000_calib()
+        mpl115a2_calib = calibration.mpl115a2_calib()
+
+        if pt1000_calib is None and mpl115a2_calib is None:
+            incomplete += 1
+
+        if cmd.dir is None:
+            continue
+
+        if pt1000_calib is not None:
+            save(cmd.dir, calibration.device, "pt1000_calib.json", pt1000_calib)
+
+        if mpl115a2_calib is not None:
+            save(cmd.dir, calibration.device, "mpl115a2_calib.json", mpl115a2_calib)
+
+    sys.stdout.flush()
+
+    if incomplete:
+        print("chamber_calib: %d device(s) could not be calibrated" % incomplete, file=sys.stderr)
+        exit(1)
@@ -6,6 +6,8 @@ Created on 1 Mar 2017
 
 import optparse
 
+from scs_mfr.calib.afe_baseline_estimator import AFEBaselineEstimator
+
 
 # --------------------------------------------------------------------------------------------------------------------
 
@@ -16,8 +18,9 @@ class CmdAFEBaseline(object):
         """
         Constructor
         """
-        self.__parser = optparse.OptionParser(usage="%prog [-1 SN1_OFFSET] [-2 SN2_OFFSET] [-3 SN3_OFFSET] "
-                                                    "[-4 SN3_OFFSET] [-v]", version="%prog 1.0")
+        self.__parser = optparse.OptionParser(usage="%prog [{ [-1 SN1_OFFSET] [-2 SN2_OFFSET] [-3 SN3_OFFSET] "
+                                                    "[-4 SN3_OFFSET] | -f CSV_FILE [{ -p PERCENTILE | -w WINDOW }] "
+                                                    "[-t TARGET] }] [-v]", version="%prog 1.0")
 
         # optional...
         self.__parser.add_option("--sn1", "-1", type="int", nargs=1, action="store", dest="sn1_offset",
@@ -32,6 +35,19 @@ class CmdAFEBaseline(object):
         self.__parser.add_option("--sn4", "-4", type="int", nargs=1, action="store", dest="sn4_offset",
                                  help="SN4 baseline offset")
 
+        self.__parser.add_option("--file", "-f", type="string", nargs=1, action="store", dest="csv_filename",
+                                 help="set baseline offsets from the gases logged in CSV_FILE ('-' for stdin)")
+
+        self.__parser.add_option("--percentile", "-p", type="float", nargs=1, action="store", dest="percentile",
+                                 help="floor is the PERCENTILE of the logged concentrations (default %s)" %
+                                      AFEBaselineEstimator.DEFAULT_PERCENTILE)
+
+        self.__parser.add_option("--window", "-w", type="int", nargs=1, action="store", dest="window",
+                                 help="floor is the median of the minima of each WINDOW of logged concentrations")
+
+        self.__parser.add_option("--target", "-t", type="float", nargs=1, action="store", dest="target", default=0.0,
+                                 help="offset the floor to TARGET ppb (default 0)")
+
         self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
                                  help="report narrative to stderr")
 
@@ -40,6 +56,25 @@ class CmdAFEBaseline(object):
 
     # ----------------------------------------------------------------------------------------------------------------
 
+    def is_valid(self):
+        if self.set() and self.csv_filename is not None:
+            return False
+
+        if self.percentile is not None and self.window is not None:
+            return False
+
+        if (self.percentile is not None or self.window is not None) and self.csv_filename is None:
+            return False
+
+        if self.percentile is not None and not 0.0 < self.percentile < 100.0:
+            return False
+
+        if self.window is not None and self.window < 1:
+            return False
+
+        return True
+
+
     def set(self):
         return self.__opts.sn1_offset is not None or self.__opts.sn2_offset is not None or \
                self.__opts.sn3_offset is not None or self.__opts.sn4_offset is not None
@@ -74,6 +109,26 @@ class CmdAFEBaseline(object):
         return self.__opts.sn4_offset
 
 
+    @property
+    def csv_filename(self):
+        return self.__opts.csv_filename
+
+
+    @property
+    def percentile(self):
+        return self.__opts.percentile
+
+
+    @property
+    def window(self):
+        return self.__opts.window
+
+
+    @property
+    def target(self):
+        return self.__opts.target
+
+
     @property
     def verbose(self):
         return self.__opts.verbose
@@ -86,6 +141,12 @@ class CmdAFEBaseline(object):
 
     # ----------------------------------------------------------------------------------------------------------------
 
+    def print_help(self, file):
+        self.__parser.print_help(file)
+
+
     def __str__(self, *args, **kwargs):
-        return "CmdAFEBaseline:{sn1_offset:%s, sn2_offset:%s, sn3_offset:%s, sn4_offset:%s, verbose:%s, args:%s}" % \
-               (self.sn1_offset, self.sn2_offset, self.sn3_offset, self.sn4_offset, self.verbose, self.args)
+        return "CmdAFEBaseline:{sn1_offset:%s, sn2_offset:%s, sn3_offset:%s, sn4_offset:%s, csv_filename:%s, " \
+               "percentile:%s, window:%s, target:%s, verbose:%s, args:%s}" % \
+               (self.sn1_offset, self.sn2_offset, self.sn3_offset, self.sn4_offset, self.csv_filename,
+                self.percentile, self.window, self.target, self.verbose, self.args)
@@ -0,0 +1,91 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+"""
+
+import optparse
+
+from scs_mfr.calib.afe_calib_prefetch import AFECalibPrefetch
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CmdAFECalibPrefetch(object):
+    """unix command line handler"""
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.__parser = optparse.OptionParser(usage="%prog [-w WORKERS] [-r RETRIES] [-f] [-v] "
+                                                    "[AFE_SERIAL_NUMBER ...]", version="%prog 1.0")
+
+        # optional...
+        self.__parser.add_option("--workers", "-w", type="int", nargs=1, action="store", dest="workers",
+                                 default=AFECalibPrefetch.DEFAULT_WORKERS,
+                                 help="download with WORKERS concurrent connections (default %d)" %
+                                      AFECalibPrefetch.DEFAULT_WORKERS)
+
+        self.__parser.add_option("--retries", "-r", type="int", nargs=1, action="store", dest="retries",
+                                 default=AFECalibPrefetch.DEFAULT_RETRIES,
+                                 help="retry each download RETRIES times on network errors (default %d)" %
+                                      AFECalibPrefetch.DEFAULT_RETRIES)
+
+        self.__parser.add_option("--refresh", "-f", action="store_true", dest="refresh", default=False,
+                                 help="download sheets that are already cached")
+
+        self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
+                                 help="report narrative to stderr")
+
+        self.__opts, self.__args = self.__parser.parse_args()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def is_valid(self):
+        if self.workers < 1:
+            return False
+
+        if self.retries < 0:
+            return False
+
+        return True
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def workers(self):
+        return self.__opts.workers
+
+
+    @property
+    def retries(self):
+        return self.__opts.retries
+
+
+    @property
+    def refresh(self):
+        return self.__opts.refresh
+
+
+    @property
+    def serial_numbers(self):
+        return self.__args
+
+
+    @property
+    def verbose(self):
+        return self.__opts.verbose
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def print_help(self, file):
+        self.__parser.print_help(file)
+
+
+    def __str__(self, *args, **kwargs):
+        return "CmdAFECalibPrefetch:{workers:%s, retries:%s, refresh:%s, serial_numbers:%s, verbose:%s}" % \
+               (self.workers, self.retries, self.refresh, self.serial_numbers, self.verbose)
@@ -0,0 +1,133 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+"""
+
+import optparse
+
+from scs_mfr.calib.calib_history import CalibHistory
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CmdCalibHistory(object):
+    """unix command line handler"""
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.__parser = optparse.OptionParser(usage="%prog { -i | -l | -t DATETIME | -a } [-k KIND] [-f DB_FILE] [-v]",
+                                              version="%prog 1.0")
+
+        # compulsory...
+        self.__parser.add_option("--import", "-i", action="store_true", dest="import_calibs", default=False,
+                                 help="append the calibrations currently saved on the host to the history")
+
+        self.__parser.add_option("--list", "-l", action="store_true", dest="list", default=False,
+                                 help="report every version, in calibrated-on order")
+
+        self.__parser.add_option("--at", "-t", type="string", nargs=1, action="store", dest="at",
+                                 help="report the calibrations in force at DATETIME (ISO 8601)")
+
+        self.__parser.add_option("--annotate", "-a", action="store_true", dest="annotate", default=False,
+                                 help="add the calibrations in force at the rec of each JSON document on stdin")
+
+        # optional...
+        self.__parser.add_option("--kind", "-k", type="string", nargs=1, action="store", dest="kind",
+                                 help="only KIND { %s }" % " | ".join(CalibHistory.KINDS))
+
+        self.__parser.add_option("--file", "-f", type="string", nargs=1, action="store", dest="db_filename",
+                                 help="use DB_FILE rather than the host calibration history")
+
+        self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
+                                 help="report narrative to stderr")
+
+        self.__opts, self.__args = self.__parser.parse_args()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def is_valid(self):
+        count = 0
+
+        if self.import_calibs:
+            count += 1
+
+        if self.list:
+            count += 1
+
+        if self.at is not None:
+            count += 1
+
+        if self.annotate:
+            count += 1
+
+        if count != 1:
+            return False
+
+        if self.kind is not None and self.kind not in CalibHistory.KINDS:
+            return False
+
+        return True
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def import_calibs(self):
+        return self.__opts.import_calibs
+
+
+    @property
+    def list(self):
+        return self.__opts.list
+
+
+    @property
+    def at(self):
+        return self.__opts.at
+
+
+    @property
+    def annotate(self):
+        return self.__opts.annotate
+
+
+    @property
+    def kind(self):
+        return self.__opts.kind
+
+
+    @property
+    def kinds(self):
+        return CalibHistory.KINDS if self.kind is None else (self.kind, )
+
+
+    @property
+    def db_filename(self):
+        return self.__opts.db_filename
+
+
+    @property
+    def verbose(self):
+        return self.__opts.verbose
+
+
+    @property
+    def args(self):
+        return self.__args
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def print_help(self, file):
+        self.__parser.print_help(file)
+
+
+    def __str__(self, *args, **kwargs):
+        return "CmdCalibHistory:{import_calibs:%s, list:%s, at:%s, annotate:%s, kind:%s, db_filename:%s, " \
+               "verbose:%s, args:%s}" % \
+                    (self.import_calibs, self.list, self.at, self.annotate, self.kind, self.db_filename,
+                     self.verbose, self.args)
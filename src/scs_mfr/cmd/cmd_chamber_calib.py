@@ -0,0 +1,88 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+"""
+
+import optparse
+
+from scs_mfr.calib.chamber_calibration import ChamberCalibration
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CmdChamberCalib(object):
+    """unix command line handler"""
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.__parser = optparse.OptionParser(usage="%prog [-d DIR] [-m MIN_POINTS] [-s MIN_SPAN] [-v]",
+                                              version="%prog 1.0")
+
+        # optional...
+        self.__parser.add_option("--dir", "-d", type="string", nargs=1, action="store", dest="dir",
+                                 help="write the calibrations of each device to DIR/DEVICE")
+
+        self.__parser.add_option("--min-points", "-m", type="int", nargs=1, action="store", dest="min_points",
+                                 default=ChamberCalibration.DEFAULT_MIN_POINTS,
+                                 help="fit at least MIN_POINTS readings (default %s)" %
+                                      ChamberCalibration.DEFAULT_MIN_POINTS)
+
+        self.__parser.add_option("--min-span", "-s", type="float", nargs=1, action="store", dest="min_span",
+                                 default=ChamberCalibration.DEFAULT_MIN_SPAN,
+                                 help="fit readings over at least MIN_SPAN °C (default %s)" %
+                                      ChamberCalibration.DEFAULT_MIN_SPAN)
+
+        self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
+                                 help="report narrative to stderr")
+
+        self.__opts, self.__args = self.__parser.parse_args()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def is_valid(self):
+        if self.min_points < 2 or self.min_span < 0:
+            return False
+
+        return True
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def dir(self):
+        return self.__opts.dir
+
+
+    @property
+    def min_points(self):
+        return self.__opts.min_points
+
+
+    @property
+    def min_span(self):
+        return self.__opts.min_span
+
+
+    @property
+    def verbose(self):
+        return self.__opts.verbose
+
+
+    @property
+    def args(self):
+        return self.__args
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def print_help(self, file):
+        self.__parser.print_help(file)
+
+
+    def __str__(self, *args, **kwargs):
+        return "CmdChamberCalib:{dir:%s, min_points:%s, min_span:%s, verbose:%s, args:%s}" % \
+               (self.dir, self.min_points, self.min_span, self.verbose, self.args)
@@ -6,20 +6,33 @@ Created on 2 Aug 2016
 
 import optparse
 
+from collections import OrderedDict
+
 
 # --------------------------------------------------------------------------------------------------------------------
 
 class CmdDFETest(object):
     """unix command line handler"""
 
+    EMPTY_CHANNEL =     '-'
+    MAX_CHANNELS =      8
+
+    # ----------------------------------------------------------------------------------------------------------------
+
     def __init__(self):
         """
         Constructor
         """
-        self.__parser = optparse.OptionParser(usage="%prog [-e] [-g] [-r] [-v] DFE_SERIAL_NUMBER",
+        self.__parser = optparse.OptionParser(usage="%prog [-t PLAN_FILE] [-e] [-g] [{-r | -f}] [-n SAMPLES] [-z] [-p] "
+                                                    "[-w TIMEOUT] [-x] [-o] [-m] [-j] [-s] [-R] [-S SIM_FILE] [-v] "
+                                                    "{ DFE_SERIAL_NUMBER | -b MUX_ADDR DFE_SERIAL_NUMBER_0 "
+                                                    "[... DFE_SERIAL_NUMBER_7] }",
                                               version="%prog 1.0")
 
         # optional...
+        self.__parser.add_option("--plan", "-t", type="string", nargs=1, action="store", dest="plan_filename",
+                                 help="conduct the tests specified in PLAN_FILE")
+
         self.__parser.add_option("--eeprom", "-e", action="store_true", dest="ignore_eeprom", default=False,
                                  help="ignore EEPROM")
 
@@ -29,6 +42,45 @@ class CmdDFETest(object):
         self.__parser.add_option("--rtc", "-r", action="store_true", dest="ignore_rtc", default=False,
                                  help="ignore real-time clock")
 
+        self.__parser.add_option("--fast-rtc", "-f", action="store_true", dest="fast_rtc", default=False,
+                                 help="test real-time clock on its first tick, reporting drift")
+
+        self.__parser.add_option("--afe-samples", "-n", type="int", nargs=1, action="store", dest="afe_samples",
+                                 help="test statistics of a burst of SAMPLES AFE samples")
+
+        self.__parser.add_option("--population", "-z", action="store_true", dest="population", default=False,
+                                 help="score AFE and Pt1000 readings against the stored population of passing DFEs")
+
+        self.__parser.add_option("--parallel", "-p", action="store_true", dest="parallel", default=False,
+                                 help="conduct tests on different buses concurrently")
+
+        self.__parser.add_option("--timeout", "-w", type="float", nargs=1, action="store", dest="timeout",
+                                 help="abandon any subject that does not complete within TIMEOUT seconds")
+
+        self.__parser.add_option("--fail-fast", "-x", action="store_true", dest="fail_fast", default=False,
+                                 help="start no further tests once a mandatory subject has not passed")
+
+        self.__parser.add_option("--order", "-o", action="store_true", dest="order", default=False,
+                                 help="test subjects in order of stored failure rate per second")
+
+        self.__parser.add_option("--timing", "-m", action="store_true", dest="timing", default=False,
+                                 help="report wall time, bus time and retries for each subject")
+
+        self.__parser.add_option("--stream", "-j", action="store_true", dest="stream", default=False,
+                                 help="write an event for each subject as it starts and completes")
+
+        self.__parser.add_option("--store", "-s", action="store_true", dest="store", default=False,
+                                 help="append the report to the local result store")
+
+        self.__parser.add_option("--retest", "-R", action="store_true", dest="retest", default=False,
+                                 help="re-test only the subjects that did not pass in the stored report")
+
+        self.__parser.add_option("--batch", "-b", type="string", nargs=1, action="store", dest="mux_addr",
+                                 help="test one DFE on each channel of the I2C multiplexer at MUX_ADDR")
+
+        self.__parser.add_option("--simulate", "-S", type="string", nargs=1, action="store", dest="sim_filename",
+                                 help="test the simulated devices specified in SIM_FILE")
+
         self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
                                  help="report narrative to stderr")
 
@@ -38,7 +90,30 @@ class CmdDFETest(object):
     # ----------------------------------------------------------------------------------------------------------------
 
     def is_valid(self):
-        if self.dfe_serial_number is None:
+        if not self.channels:
+            return False
+
+        if self.batch:
+            try:
+                if not 0 < self.mux_addr < 0x80:
+                    return False
+
+            except ValueError:
+                return False
+
+            if len(self.__args) > self.MAX_CHANNELS:
+                return False
+
+        elif len(self.__args) != 1 or self.dfe_serial_number == self.EMPTY_CHANNEL:
+            return False
+
+        if self.ignore_rtc and self.fast_rtc:
+            return False
+
+        if self.afe_samples is not None and self.afe_samples < 1:
+            return False
+
+        if self.timeout is not None and self.timeout <= 0:
             return False
 
         return True
@@ -51,6 +126,30 @@ class CmdDFETest(object):
         return self.__args[0] if len(self.__args) > 0 else None
 
 
+    @property
+    def channels(self):
+        """
+        returns OrderedDict of multiplexer channel: DFE serial number, omitting empty channels
+        """
+        return OrderedDict((channel, dfe_serial_number) for channel, dfe_serial_number in enumerate(self.__args)
+                           if dfe_serial_number != self.EMPTY_CHANNEL)
+
+
+    @property
+    def batch(self):
+        return self.__opts.mux_addr is not None
+
+
+    @property
+    def mux_addr(self):
+        return None if self.__opts.mux_addr is None else int(self.__opts.mux_addr, 0)
+
+
+    @property
+    def plan_filename(self):
+        return self.__opts.plan_filename
+
+
     @property
     def ignore_eeprom(self):
         return self.__opts.ignore_eeprom
@@ -66,6 +165,66 @@ class CmdDFETest(object):
         return self.__opts.ignore_rtc
 
 
+    @property
+    def fast_rtc(self):
+        return self.__opts.fast_rtc
+
+
+    @property
+    def afe_samples(self):
+        return self.__opts.afe_samples
+
+
+    @property
+    def population(self):
+        return self.__opts.population
+
+
+    @property
+    def parallel(self):
+        return self.__opts.parallel
+
+
+    @property
+    def timeout(self):
+        return self.__opts.timeout
+
+
+    @property
+    def fail_fast(self):
+        return self.__opts.fail_fast
+
+
+    @property
+    def order(self):
+        return self.__opts.order
+
+
+    @property
+    def timing(self):
+        return self.__opts.timing
+
+
+    @property
+    def stream(self):
+        return self.__opts.stream
+
+
+    @property
+    def store(self):
+        return self.__opts.store
+
+
+    @property
+    def retest(self):
+        return self.__opts.retest
+
+
+    @property
+    def sim_filename(self):
+        return self.__opts.sim_filename
+
+
     @property
     def verbose(self):
         return self.__opts.verbose
@@ -83,7 +242,10 @@ class CmdDFETest(object):
 
 
     def __str__(self, *args, **kwargs):
-        return "CmdDFETest:{dfe_serial_number:%s, ignore_eeprom:%s, ignore_gps:%s, ignore_rtc:%s, " \
-               "verbose:%s, args:%s}" % \
-                    (self.dfe_serial_number, self.ignore_eeprom, self.ignore_gps, self.ignore_rtc,
-                     self.verbose, self.args)
+        return "CmdDFETest:{channels:%s, plan_filename:%s, ignore_eeprom:%s, ignore_gps:%s, ignore_rtc:%s, " \
+               "fast_rtc:%s, afe_samples:%s, population:%s, parallel:%s, timeout:%s, fail_fast:%s, order:%s, " \
+               "timing:%s, stream:%s, store:%s, retest:%s, mux_addr:%s, sim_filename:%s, verbose:%s, args:%s}" % \
+                    (dict(self.channels), self.plan_filename, self.ignore_eeprom, self.ignore_gps, self.ignore_rtc,
+                     self.fast_rtc, self.afe_samples, self.population, self.parallel, self.timeout, self.fail_fast,
+                     self.order, self.timing, self.stream, self.store, self.retest, self.__opts.mux_addr,
+                     self.sim_filename, self.verbose, self.args)
@@ -0,0 +1,139 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+"""
+
+import optparse
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CmdDFETestQuery(object):
+    """unix command line handler"""
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.__parser = optparse.OptionParser(usage="%prog { -i | -y | -p | -t | -g } [-s START_DAY] [-e END_DAY] "
+                                                    "[-f DB_FILE] [-v]", version="%prog 1.0")
+
+        # compulsory...
+        self.__parser.add_option("--import", "-i", action="store_true", dest="import_reports", default=False,
+                                 help="append DFE test reports from stdin to the store")
+
+        self.__parser.add_option("--yield", "-y", action="store_true", dest="subject_yield", default=False,
+                                 help="report the yield of each subject")
+
+        self.__parser.add_option("--pareto", "-p", action="store_true", dest="pareto", default=False,
+                                 help="report failures by subject and outcome, most frequent first")
+
+        self.__parser.add_option("--throughput", "-t", action="store_true", dest="throughput", default=False,
+                                 help="report the number of boards tested and passed on each day")
+
+        self.__parser.add_option("--population", "-g", action="store_true", dest="population", default=False,
+                                 help="report the golden population of AFE and Pt1000 readings")
+
+        # optional...
+        self.__parser.add_option("--start", "-s", type="string", nargs=1, action="store", dest="start_day",
+                                 help="include reports from START_DAY (YYYY-MM-DD)")
+
+        self.__parser.add_option("--end", "-e", type="string", nargs=1, action="store", dest="end_day",
+                                 help="include reports up to and including END_DAY (YYYY-MM-DD)")
+
+        self.__parser.add_option("--file", "-f", type="string", nargs=1, action="store", dest="db_filename",
+                                 help="use DB_FILE rather than the host result store")
+
+        self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
+                                 help="report narrative to stderr")
+
+        self.__opts, self.__args = self.__parser.parse_args()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def is_valid(self):
+        count = 0
+
+        if self.import_reports:
+            count += 1
+
+        if self.subject_yield:
+            count += 1
+
+        if self.pareto:
+            count += 1
+
+        if self.throughput:
+            count += 1
+
+        if self.population:
+            count += 1
+
+        return count == 1
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def import_reports(self):
+        return self.__opts.import_reports
+
+
+    @property
+    def subject_yield(self):
+        return self.__opts.subject_yield
+
+
+    @property
+    def pareto(self):
+        return self.__opts.pareto
+
+
+    @property
+    def throughput(self):
+        return self.__opts.throughput
+
+
+    @property
+    def population(self):
+        return self.__opts.population
+
+
+    @property
+    def start_day(self):
+        return self.__opts.start_day
+
+
+    @property
+    def end_day(self):
+        return self.__opts.end_day
+
+
+    @property
+    def db_filename(self):
+        return self.__opts.db_filename
+
+
+    @property
+    def verbose(self):
+        return self.__opts.verbose
+
+
+    @property
+    def args(self):
+        return self.__args
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def print_help(self, file):
+        self.__parser.print_help(file)
+
+
+    def __str__(self, *args, **kwargs):
+        return "CmdDFETestQuery:{import_reports:%s, subject_yield:%s, pareto:%s, throughput:%s, population:%s, " \
+               "start_day:%s, end_day:%s, db_filename:%s, verbose:%s, args:%s}" % \
+                    (self.import_reports, self.subject_yield, self.pareto, self.throughput, self.population,
+                     self.start_day, self.end_day, self.db_filename, self.verbose, self.args)
@@ -0,0 +1,80 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+"""
+
+import optparse
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CmdEEPROMBuild(object):
+    """unix command line handler"""
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.__parser = optparse.OptionParser(usage="%prog -c CONF_FILE [-d DIR] [-v] [SERIAL_NUMBER ...]",
+                                              version="%prog 1.0")
+
+        # compulsory...
+        self.__parser.add_option("--conf", "-c", type="string", nargs=1, action="store", dest="conf_filename",
+                                 help="build images to the HAT specification in CONF_FILE")
+
+        # optional...
+        self.__parser.add_option("--dir", "-d", type="string", nargs=1, action="store", dest="dir", default=".",
+                                 help="write the images to DIR (default current directory)")
+
+        self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
+                                 help="report narrative to stderr")
+
+        self.__opts, self.__args = self.__parser.parse_args()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def is_valid(self):
+        if self.conf_filename is None:
+            return False
+
+        return True
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def conf_filename(self):
+        return self.__opts.conf_filename
+
+
+    @property
+    def dir(self):
+        return self.__opts.dir
+
+
+    @property
+    def serial_numbers(self):
+        return self.__args
+
+
+    @property
+    def verbose(self):
+        return self.__opts.verbose
+
+
+    @property
+    def args(self):
+        return self.__args
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def print_help(self, file):
+        self.__parser.print_help(file)
+
+
+    def __str__(self, *args, **kwargs):
+        return "CmdEEPROMBuild:{conf_filename:%s, dir:%s, verbose:%s, args:%s}" % \
+                    (self.conf_filename, self.dir, self.verbose, self.args)
@@ -0,0 +1,81 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+"""
+
+import optparse
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CmdEEPROMRead(object):
+    """unix command line handler"""
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.__parser = optparse.OptionParser(usage="%prog [{ -b | -j | -i }] [-v]", version="%prog 1.0")
+
+        # optional...
+        self.__parser.add_option("--binary", "-b", action="store_true", dest="binary", default=False,
+                                 help="write the whole EEPROM to stdout as binary")
+
+        self.__parser.add_option("--json", "-j", action="store_true", dest="json", default=False,
+                                 help="write the decoded HAT header and atoms to stdout as JSON")
+
+        self.__parser.add_option("--identity", "-i", action="store_true", dest="identity", default=False,
+                                 help="read only the HAT vendor info, and write it to stdout as JSON")
+
+        self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
+                                 help="report narrative to stderr")
+
+        self.__opts, self.__args = self.__parser.parse_args()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def is_valid(self):
+        if int(self.binary) + int(self.json) + int(self.identity) > 1:
+            return False
+
+        return True
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def binary(self):
+        return self.__opts.binary
+
+
+    @property
+    def json(self):
+        return self.__opts.json
+
+
+    @property
+    def identity(self):
+        return self.__opts.identity
+
+
+    @property
+    def verbose(self):
+        return self.__opts.verbose
+
+
+    @property
+    def args(self):
+        return self.__args
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def print_help(self, file):
+        self.__parser.print_help(file)
+
+
+    def __str__(self, *args, **kwargs):
+        return "CmdEEPROMRead:{binary:%s, json:%s, identity:%s, verbose:%s, args:%s}" % \
+                    (self.binary, self.json, self.identity, self.verbose, self.args)
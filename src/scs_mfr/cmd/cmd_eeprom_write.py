@@ -6,6 +6,8 @@ Created on 2 Aug 2016
 
 import optparse
 
+from scs_mfr.eeprom.eeprom_target import EEPROMTarget
+
 
 # --------------------------------------------------------------------------------------------------------------------
 
@@ -16,9 +18,20 @@ class CmdEEPROMWrite(object):
         """
         Constructor
         """
-        self.__parser = optparse.OptionParser(usage="%prog FILENAME [-v]", version="%prog 1.0")
+        self.__parser = optparse.OptionParser(usage="%prog [-d] [-v] FILENAME | "
+                                                    "-g [-m MUX_ADDR] [-v] FILENAME TARGET [... TARGET]",
+                                              version="%prog 1.0")
 
         # optional...
+        self.__parser.add_option("--differential", "-d", action="store_true", dest="differential", default=False,
+                                 help="write and verify only the pages that differ from FILENAME")
+
+        self.__parser.add_option("--gang", "-g", action="store_true", dest="gang", default=False,
+                                 help="program each TARGET concurrently, where TARGET is BUS or BUS:CHANNEL")
+
+        self.__parser.add_option("--mux", "-m", type="string", nargs=1, action="store", dest="mux_addr",
+                                 help="the CHANNEL of a gang TARGET is on the I2C multiplexer at MUX_ADDR")
+
         self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
                                  help="report sent samples to stderr")
 
@@ -31,6 +44,30 @@ class CmdEEPROMWrite(object):
         if self.filename is None:
             return False
 
+        if not self.gang:
+            return len(self.__args) == 1 and self.__opts.mux_addr is None
+
+        try:
+            targets = self.targets
+
+            if self.mux_addr is not None and not 0 < self.mux_addr < 0x80:
+                return False
+
+        except ValueError:
+            return False
+
+        if not targets or len(set(targets)) != len(targets):
+            return False
+
+        mux_buses = set(target.bus for target in targets if target.channel is not None)
+
+        if mux_buses and (self.mux_addr is None or len(mux_buses) > 1):
+            return False
+
+        # a target without a channel on the multiplexed bus would be written through whichever channel is selected...
+        if any(target.channel is None and target.bus in mux_buses for target in targets):
+            return False
+
         return True
 
 
@@ -41,6 +78,26 @@ class CmdEEPROMWrite(object):
         return self.__args[0] if len(self.__args) > 0 else None
 
 
+    @property
+    def differential(self):
+        return self.__opts.differential
+
+
+    @property
+    def gang(self):
+        return self.__opts.gang
+
+
+    @property
+    def targets(self):
+        return [EEPROMTarget.construct_from_arg(arg) for arg in self.__args[1:]]
+
+
+    @property
+    def mux_addr(self):
+        return None if self.__opts.mux_addr is None else int(self.__opts.mux_addr, 0)
+
+
     @property
     def verbose(self):
         return self.__opts.verbose
@@ -58,5 +115,5 @@ class CmdEEPROMWrite(object):
 
 
     def __str__(self, *args, **kwargs):
-        return "CmdEEPROMWrite:{filename:%s, verbose:%s, args:%s}" % \
-                    (self.filename, self.verbose, self.args)
+        return "CmdEEPROMWrite:{filename:%s, differential:%s, gang:%s, mux_addr:%s, verbose:%s, args:%s}" % \
+                    (self.filename, self.differential, self.gang, self.__opts.mux_addr, self.verbose, self.args)
@@ -6,6 +6,8 @@ Created on 20 Jun 2018
 
 import optparse
 
+from scs_mfr.calib.mpl115a2_interleaving import MPL115A2Interleaving
+
 
 # --------------------------------------------------------------------------------------------------------------------
 
@@ -16,18 +18,56 @@ class CmdMPL115A2Calib(object):
         """
         Constructor
         """
-        self.__parser = optparse.OptionParser(usage="%prog [-s] [-v]", version="%prog 1.0")
+        self.__parser = optparse.OptionParser(usage="%prog [{ -s | -i [-c CADENCE] [-w WINDOW] [-t TOLERANCE] "
+                                                    "[-n MAX_SAMPLES] }] [-S SIM_FILE] [-v]", version="%prog 1.0")
 
         # optional...
         self.__parser.add_option("--set", "-s", action="store_true", dest="set", default=False,
                                  help="set MPL115A2 calib from internal SHT")
 
+        self.__parser.add_option("--interleave", "-i", action="store_true", dest="interleave", default=False,
+                                 help="set MPL115A2 calib from internal SHT, by the median of interleaved samples")
+
+        self.__parser.add_option("--cadence", "-c", type="float", nargs=1, action="store", dest="cadence",
+                                 default=MPL115A2Interleaving.DEFAULT_CADENCE,
+                                 help="take a pair of samples every CADENCE seconds (default %s)" %
+                                      MPL115A2Interleaving.DEFAULT_CADENCE)
+
+        self.__parser.add_option("--window", "-w", type="int", nargs=1, action="store", dest="window",
+                                 default=MPL115A2Interleaving.DEFAULT_WINDOW,
+                                 help="converge over WINDOW samples (default %s)" % MPL115A2Interleaving.DEFAULT_WINDOW)
+
+        self.__parser.add_option("--tolerance", "-t", type="float", nargs=1, action="store", dest="tolerance",
+                                 default=MPL115A2Interleaving.DEFAULT_TOLERANCE,
+                                 help="converge within TOLERANCE counts (default %s)" %
+                                      MPL115A2Interleaving.DEFAULT_TOLERANCE)
+
+        self.__parser.add_option("--max-samples", "-n", type="int", nargs=1, action="store", dest="max_samples",
+                                 default=MPL115A2Interleaving.DEFAULT_MAX_SAMPLES,
+                                 help="give up after MAX_SAMPLES pairs (default %s)" %
+                                      MPL115A2Interleaving.DEFAULT_MAX_SAMPLES)
+
+        self.__parser.add_option("--simulate", "-S", type="string", nargs=1, action="store", dest="sim_filename",
+                                 help="calibrate the simulated devices specified in SIM_FILE")
+
         self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
                                  help="report narrative to stderr")
 
         self.__opts, self.__args = self.__parser.parse_args()
 
 
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def is_valid(self):
+        if self.set and self.interleave:
+            return False
+
+        if self.cadence <= 0 or self.window < 1 or self.tolerance < 0 or self.max_samples < 1:
+            return False
+
+        return True
+
+
     # ----------------------------------------------------------------------------------------------------------------
 
     @property
@@ -35,6 +75,36 @@ class CmdMPL115A2Calib(object):
         return self.__opts.set
 
 
+    @property
+    def interleave(self):
+        return self.__opts.interleave
+
+
+    @property
+    def cadence(self):
+        return self.__opts.cadence
+
+
+    @property
+    def window(self):
+        return self.__opts.window
+
+
+    @property
+    def tolerance(self):
+        return self.__opts.tolerance
+
+
+    @property
+    def max_samples(self):
+        return self.__opts.max_samples
+
+
+    @property
+    def sim_filename(self):
+        return self.__opts.sim_filename
+
+
     @property
     def verbose(self):
         return self.__opts.verbose
@@ -47,5 +117,12 @@ class CmdMPL115A2Calib(object):
 
     # ----------------------------------------------------------------------------------------------------------------
 
+    def print_help(self, file):
+        self.__parser.print_help(file)
+
+
     def __str__(self, *args, **kwargs):
-        return "CmdMPL115A2Calib:{set:%s, verbose:%s, args:%s}" % (self.set, self.verbose, self.args)
+        return "CmdMPL115A2Calib:{set:%s, interleave:%s, cadence:%s, window:%s, tolerance:%s, max_samples:%s, " \
+               "sim_filename:%s, verbose:%s, args:%s}" % \
+               (self.set, self.interleave, self.cadence, self.window, self.tolerance, self.max_samples,
+                self.sim_filename, self.verbose, self.args)
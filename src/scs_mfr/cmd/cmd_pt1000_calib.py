@@ -6,6 +6,8 @@ Created on 28 Feb 2017
 
 import optparse
 
+from scs_mfr.calib.pt1000_settling import Pt1000Settling
+
 
 # --------------------------------------------------------------------------------------------------------------------
 
@@ -16,18 +18,65 @@ class CmdPt1000Calib(object):
         """
         Constructor
         """
-        self.__parser = optparse.OptionParser(usage="%prog [-s] [-v]", version="%prog 1.0")
+        self.__parser = optparse.OptionParser(usage="%prog [{ -s | -c [-w WINDOW] [-i INTERVAL] [-t TIMEOUT] "
+                                                    "[-T SLOPE STD] [-V SLOPE STD] }] [-S SIM_FILE] [-v]",
+                                              version="%prog 1.0")
 
         # optional...
         self.__parser.add_option("--set", "-s", action="store_true", dest="set", default=False,
                                  help="set Pt1000 calib from internal SHT")
 
+        self.__parser.add_option("--settle", "-c", action="store_true", dest="settle", default=False,
+                                 help="set Pt1000 calib from internal SHT, once both have settled")
+
+        self.__parser.add_option("--window", "-w", type="int", nargs=1, action="store", dest="window",
+                                 default=Pt1000Settling.DEFAULT_WINDOW,
+                                 help="settle over WINDOW samples (default %d)" % Pt1000Settling.DEFAULT_WINDOW)
+
+        self.__parser.add_option("--interval", "-i", type="float", nargs=1, action="store", dest="interval",
+                                 default=Pt1000Settling.DEFAULT_INTERVAL,
+                                 help="sample every INTERVAL seconds (default %s)" % Pt1000Settling.DEFAULT_INTERVAL)
+
+        self.__parser.add_option("--timeout", "-t", type="float", nargs=1, action="store", dest="timeout",
+                                 default=Pt1000Settling.DEFAULT_TIMEOUT,
+                                 help="give up after TIMEOUT seconds (default %s)" % Pt1000Settling.DEFAULT_TIMEOUT)
+
+        self.__parser.add_option("--temp-limits", "-T", type="float", nargs=2, action="store", dest="temp_limits",
+                                 metavar="SLOPE STD",
+                                 default=(Pt1000Settling.DEFAULT_TEMP_SLOPE * 60.0, Pt1000Settling.DEFAULT_TEMP_STD),
+                                 help="SHT settles within SLOPE °C / min and STD °C (default %s %s)" %
+                                      (Pt1000Settling.DEFAULT_TEMP_SLOPE * 60.0, Pt1000Settling.DEFAULT_TEMP_STD))
+
+        self.__parser.add_option("--v20-limits", "-V", type="float", nargs=2, action="store", dest="v20_limits",
+                                 metavar="SLOPE STD",
+                                 default=(Pt1000Settling.DEFAULT_V20_SLOPE * 60.0, Pt1000Settling.DEFAULT_V20_STD),
+                                 help="Pt1000 v20 settles within SLOPE V / min and STD V (default %s %s)" %
+                                      (Pt1000Settling.DEFAULT_V20_SLOPE * 60.0, Pt1000Settling.DEFAULT_V20_STD))
+
+        self.__parser.add_option("--simulate", "-S", type="string", nargs=1, action="store", dest="sim_filename",
+                                 help="calibrate the simulated devices specified in SIM_FILE")
+
         self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
                                  help="report narrative to stderr")
 
         self.__opts, self.__args = self.__parser.parse_args()
 
 
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def is_valid(self):
+        if self.set and self.settle:
+            return False
+
+        if self.window < 2 or self.interval <= 0 or self.timeout <= 0:
+            return False
+
+        if min(self.temp_limits) < 0 or min(self.v20_limits) < 0:
+            return False
+
+        return True
+
+
     # ----------------------------------------------------------------------------------------------------------------
 
     @property
@@ -35,6 +84,51 @@ class CmdPt1000Calib(object):
         return self.__opts.set
 
 
+    @property
+    def settle(self):
+        return self.__opts.settle
+
+
+    @property
+    def window(self):
+        return self.__opts.window
+
+
+    @property
+    def interval(self):
+        return self.__opts.interval
+
+
+    @property
+    def timeout(self):
+        return self.__opts.timeout
+
+
+    @property
+    def temp_limits(self):
+        """
+        returns (slope °C / s, std °C)
+        """
+        slope, std = self.__opts.temp_limits
+
+        return slope / 60.0, std
+
+
+    @property
+    def v20_limits(self):
+        """
+        returns (slope V / s, std V)
+        """
+        slope, std = self.__opts.v20_limits
+
+        return slope / 60.0, std
+
+
+    @property
+    def sim_filename(self):
+        return self.__opts.sim_filename
+
+
     @property
     def verbose(self):
         return self.__opts.verbose
@@ -47,5 +141,12 @@ class CmdPt1000Calib(object):
 
     # ----------------------------------------------------------------------------------------------------------------
 
+    def print_help(self, file):
+        self.__parser.print_help(file)
+
+
     def __str__(self, *args, **kwargs):
-        return "CmdPt1000Calib:{set:%s, verbose:%s, args:%s}" % (self.set, self.verbose, self.args)
+        return "CmdPt1000Calib:{set:%s, settle:%s, window:%s, interval:%s, timeout:%s, temp_limits:%s, " \
+               "v20_limits:%s, sim_filename:%s, verbose:%s, args:%s}" % \
+               (self.set, self.settle, self.window, self.interval, self.timeout, self.__opts.temp_limits,
+                self.__opts.v20_limits, self.sim_filename, self.verbose, self.args)
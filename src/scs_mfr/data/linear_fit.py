@@ -0,0 +1,157 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+An ordinary least-squares straight line fitted to points appended one at a time. Only the sums are held, so that any
+number of points may be appended in constant memory, and the fit is solved in closed form when it is read.
+
+Points are taken relative to the first point, so that small variations about a large offset do not lose precision.
+
+The fit is None until there are at least two points with distinct x.
+
+example JSON:
+{"n": 240, "span": 35.2, "slope": 0.001002, "intercept": 0.330114, "rms": 1.9e-05}
+"""
+
+import math
+
+from collections import OrderedDict
+
+from scs_core.data.json import JSONable
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class LinearFit(JSONable):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.__n = 0
+
+        self.__x0 = None
+        self.__y0 = None
+
+        self.__sum_x = self.__sum_y = 0.0
+        self.__sum_xx = self.__sum_yy = self.__sum_xy = 0.0
+
+        self.__min_x = None
+        self.__max_x = None
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def append(self, x, y):
+        if self.__n == 0:
+            self.__x0 = x
+            self.__y0 = y
+
+            self.__min_x = self.__max_x = x
+
+        else:
+            self.__min_x = min(self.__min_x, x)
+            self.__max_x = max(self.__max_x, x)
+
+        dx = x - self.__x0
+        dy = y - self.__y0
+
+        self.__n += 1
+
+        self.__sum_x += dx
+        self.__sum_y += dy
+        self.__sum_xx += dx * dx
+        self.__sum_yy += dy * dy
+        self.__sum_xy += dx * dy
+
+
+    def value_at(self, x):
+        """
+        returns the fitted y at the given x, or None if there is no fit
+        """
+        slope = self.slope
+
+        if slope is None:
+            return None
+
+        mean_x = self.__sum_x / self.__n
+        mean_y = self.__sum_y / self.__n
+
+        return self.__y0 + mean_y + slope * (x - self.__x0 - mean_x)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self):
+        jdict = OrderedDict()
+
+        jdict['n'] = self.n
+        jdict['span'] = None if self.span is None else round(self.span, 3)
+        jdict['slope'] = None if self.slope is None else round(self.slope, 6)
+        jdict['intercept'] = None if self.slope is None else round(self.value_at(0.0), 6)
+        jdict['rms'] = None if self.rms is None else round(self.rms, 6)
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __sxx(self):
+        return self.__sum_xx - self.__sum_x * self.__sum_x / self.__n
+
+
+    def __sxy(self):
+        return self.__sum_xy - self.__sum_x * self.__sum_y / self.__n
+
+
+    def __syy(self):
+        return self.__sum_yy - self.__sum_y * self.__sum_y / self.__n
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def n(self):
+        return self.__n
+
+
+    @property
+    def span(self):
+        return None if self.__n == 0 else self.__max_x - self.__min_x
+
+
+    @property
+    def slope(self):
+        if self.__n < 2:
+            return None
+
+        sxx = self.__sxx()
+
+        return None if sxx <= 0.0 else self.__sxy() / sxx
+
+
+    @property
+    def rms(self):
+        """
+        returns the root mean square residual, or None if there is no fit
+        """
+        slope = self.slope
+
+        if slope is None:
+            return None
+
+        sse = max(self.__syy() - slope * self.__sxy(), 0.0)
+
+        return math.sqrt(sse / self.__n)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "LinearFit:{n:%s, span:%s, slope:%s, rms:%s}" % (self.n, self.span, self.slope, self.rms)
@@ -0,0 +1,127 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A streaming estimate of a quantile of a series, by the P-squared algorithm of Jain and Chlamtac. Five markers are
+held, whatever the length of the series, and each is adjusted by piecewise-parabolic interpolation as readings are
+appended. The estimate is exact until five readings have been appended.
+
+https://www.cse.wustl.edu/~jain/papers/ftp/psqr.pdf
+"""
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class P2Quantile(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, p):
+        """
+        Constructor
+        """
+        if not 0.0 < p < 1.0:
+            raise ValueError("quantile %s" % p)
+
+        self.__p = p                                            # float
+
+        self.__count = 0
+        self.__heights = []                                     # marker heights
+        self.__positions = [0, 1, 2, 3, 4]                      # marker positions
+        self.__desired = [0.0, 2.0 * p, 4.0 * p, 2.0 + 2.0 * p, 4.0]
+        self.__increments = [0.0, p / 2.0, p, (1.0 + p) / 2.0, 1.0]
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def append(self, value):
+        self.__count += 1
+
+        q = self.__heights
+
+        if self.__count <= 5:
+            q.append(value)
+            q.sort()
+            return
+
+        n = self.__positions
+
+        # find the cell...
+        if value < q[0]:
+            q[0] = value
+            k = 0
+
+        elif value >= q[4]:
+            q[4] = value
+            k = 3
+
+        else:
+            k = 0
+
+            while value >= q[k + 1]:
+                k += 1
+
+        for i in range(k + 1, 5):
+            n[i] += 1
+
+        for i in range(5):
+            self.__desired[i] += self.__increments[i]
+
+        # adjust the middle markers...
+        for i in (1, 2, 3):
+            d = self.__desired[i] - n[i]
+
+            if (d >= 1.0 and n[i + 1] - n[i] > 1) or (d <= -1.0 and n[i - 1] - n[i] < -1):
+                d = 1 if d > 0 else -1
+
+                height = self.__parabolic(i, d)
+
+                if not q[i - 1] < height < q[i + 1]:
+                    height = q[i] + d * (q[i + d] - q[i]) / (n[i + d] - n[i])
+
+                q[i] = height
+                n[i] += d
+
+
+    def __parabolic(self, i, d):
+        q = self.__heights
+        n = self.__positions
+
+        return q[i] + d / (n[i + 1] - n[i - 1]) * ((n[i] - n[i - 1] + d) * (q[i + 1] - q[i]) / (n[i + 1] - n[i]) +
+                                                   (n[i + 1] - n[i] - d) * (q[i] - q[i - 1]) / (n[i] - n[i - 1]))
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def value(self):
+        """
+        returns the estimated quantile, or None if no readings have been appended
+        """
+        if self.__count == 0:
+            return None
+
+        if self.__count <= 5:
+            return self.__heights[min(int(self.__p * self.__count), self.__count - 1)]
+
+        return self.__heights[2]
+
+
+    @property
+    def p(self):
+        return self.__p
+
+
+    @property
+    def count(self):
+        return self.__count
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "P2Quantile:{p:%s, count:%s, value:%s}" % (self.p, self.count, self.value)
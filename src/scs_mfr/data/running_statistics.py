@@ -0,0 +1,115 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+The running mean and variance of a population, updated one reading at a time in constant time and memory, by
+Welford's method. The state is the count, the mean, and the sum of squared deviations from the mean (m2).
+
+The standard deviation and z-score are None until the population has at least two readings, and the z-score is None
+if the population has no spread.
+
+example JSON:
+{"n": 412, "mean": 0.35213, "m2": 0.000934}
+"""
+
+import math
+
+from collections import OrderedDict
+
+from scs_core.data.json import JSONable
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class RunningStatistics(JSONable):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct_from_jdict(cls, jdict):
+        if not jdict:
+            return RunningStatistics()
+
+        n = jdict.get('n', 0)
+        mean = jdict.get('mean', 0.0)
+        m2 = jdict.get('m2', 0.0)
+
+        return RunningStatistics(n, mean, m2)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, n=0, mean=0.0, m2=0.0):
+        """
+        Constructor
+        """
+        self.__n = int(n)                       # int
+        self.__mean = float(mean)               # float
+        self.__m2 = float(m2)                   # float sum of squared deviations
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def append(self, value):
+        self.__n += 1
+
+        delta = value - self.__mean
+        self.__mean += delta / self.__n
+        self.__m2 += delta * (value - self.__mean)
+
+
+    def z_score(self, value):
+        std = self.std
+
+        return None if not std else (value - self.__mean) / std
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self):
+        jdict = OrderedDict()
+
+        jdict['n'] = self.n
+        jdict['mean'] = self.mean
+        jdict['m2'] = self.m2
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def n(self):
+        return self.__n
+
+
+    @property
+    def mean(self):
+        return self.__mean
+
+
+    @property
+    def m2(self):
+        return self.__m2
+
+
+    @property
+    def variance(self):
+        return None if self.__n < 2 else self.__m2 / (self.__n - 1)
+
+
+    @property
+    def std(self):
+        variance = self.variance
+
+        return None if variance is None else math.sqrt(variance)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "RunningStatistics:{n:%s, mean:%s, m2:%s}" % (self.n, self.mean, self.m2)
@@ -0,0 +1,153 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+The summary statistics of a burst of readings: the mean, the sample standard deviation, the peak-to-peak range, and
+the drift - the least-squares slope of the readings against their times, in units per second.
+
+All statistics are accumulated in a single pass over the readings, in pure Python. Readings and times are taken
+relative to the first of each, so that small variations about a large offset do not lose precision.
+
+The standard deviation and slope of a single reading are None, as is the slope of readings that share one time.
+
+example JSON:
+{"n": 10, "mean": 1.00214, "std": 0.001873, "ptp": 0.006123, "slope": -0.000412}
+"""
+
+import math
+
+from collections import OrderedDict
+
+from scs_core.data.json import JSONable
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class SampleStatistics(JSONable):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct(cls, values, times=None):
+        """
+        values: sequence of numbers, times: sequence of seconds, or None for one second per reading
+        """
+        n = len(values)
+
+        if n == 0:
+            raise ValueError("no values")
+
+        if times is None:
+            times = range(n)
+
+        elif len(times) != n:
+            raise ValueError("%d values, but %d times" % (n, len(times)))
+
+        x0 = values[0]
+        t0 = times[0]
+
+        sum_x = sum_xx = sum_t = sum_tt = sum_tx = 0.0
+        lowest = highest = x0
+
+        for value, time in zip(values, times):
+            x = value - x0
+            t = time - t0
+
+            sum_x += x
+            sum_xx += x * x
+            sum_t += t
+            sum_tt += t * t
+            sum_tx += t * x
+
+            if value < lowest:
+                lowest = value
+
+            if value > highest:
+                highest = value
+
+        mean = x0 + sum_x / n
+        std = None if n < 2 else math.sqrt(max(sum_xx - sum_x * sum_x / n, 0.0) / (n - 1))
+
+        denominator = n * sum_tt - sum_t * sum_t
+        slope = None if n < 2 or denominator <= 0 else (n * sum_tx - sum_t * sum_x) / denominator
+
+        return SampleStatistics(n, mean, std, highest - lowest, slope)
+
+
+    @classmethod
+    def construct_from_jdict(cls, jdict):
+        if not jdict:
+            return None
+
+        n = jdict.get('n')
+        mean = jdict.get('mean')
+        std = jdict.get('std')
+        ptp = jdict.get('ptp')
+        slope = jdict.get('slope')
+
+        return SampleStatistics(n, mean, std, ptp, slope)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, n, mean, std, ptp, slope):
+        """
+        Constructor
+        """
+        self.__n = n                            # int
+        self.__mean = mean                      # float
+        self.__std = std                        # float or None
+        self.__ptp = ptp                        # float
+        self.__slope = slope                    # float units per second or None
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self):
+        jdict = OrderedDict()
+
+        jdict['n'] = self.n
+        jdict['mean'] = round(self.mean, 6)
+        jdict['std'] = None if self.std is None else round(self.std, 6)
+        jdict['ptp'] = round(self.ptp, 6)
+        jdict['slope'] = None if self.slope is None else round(self.slope, 6)
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def n(self):
+        return self.__n
+
+
+    @property
+    def mean(self):
+        return self.__mean
+
+
+    @property
+    def std(self):
+        return self.__std
+
+
+    @property
+    def ptp(self):
+        return self.__ptp
+
+
+    @property
+    def slope(self):
+        return self.__slope
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "SampleStatistics:{n:%s, mean:%s, std:%s, ptp:%s, slope:%s}" % \
+               (self.n, self.mean, self.std, self.ptp, self.slope)
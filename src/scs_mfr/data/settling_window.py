@@ -0,0 +1,84 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A sliding window of the most recent readings of a signal that is expected to settle. The signal has settled once the
+window is full, the magnitude of the least-squares slope of the window is within the slope limit, and the standard
+deviation of the window is within the standard deviation limit.
+
+Limits are in units of the signal, and units of the signal per second.
+"""
+
+from collections import deque
+
+from scs_mfr.data.sample_statistics import SampleStatistics
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class SettlingWindow(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, size, slope_limit, std_limit):
+        """
+        Constructor
+        """
+        if size < 2:
+            raise ValueError("window of %d readings" % size)
+
+        self.__size = size                              # int readings
+        self.__slope_limit = slope_limit                # float units per second
+        self.__std_limit = std_limit                    # float units
+
+        self.__values = deque(maxlen=size)
+        self.__times = deque(maxlen=size)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def append(self, value, time):
+        self.__values.append(value)
+        self.__times.append(time)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def statistics(self):
+        """
+        returns SampleStatistics of the window, or None if it is empty
+        """
+        if not self.__values:
+            return None
+
+        return SampleStatistics.construct(list(self.__values), list(self.__times))
+
+
+    @property
+    def settled(self):
+        if len(self.__values) < self.__size:
+            return False
+
+        statistics = self.statistics
+
+        if statistics.slope is None or abs(statistics.slope) > self.__slope_limit:
+            return False
+
+        return statistics.std <= self.__std_limit
+
+
+    @property
+    def size(self):
+        return self.__size
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "SettlingWindow:{size:%s, slope_limit:%s, std_limit:%s, len:%s}" % \
+               (self.size, self.__slope_limit, self.__std_limit, len(self.__values))
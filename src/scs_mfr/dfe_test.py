@@ -12,49 +12,155 @@ The test exercises all of the ADCs and connectors.
 
 The output of the test is a JSON document, summarising the result of each of a series of tests.
 
+The subjects of the test are specified by a test plan. If no plan file is given, all of the DFE subjects are tested.
+A plan file lists, for each subject, the Test class and its arguments, the subjects on which it depends, and its
+acceptance limits. A subject is only tested if all of the subjects it depends on have passed. Subjects that are not
+present on a given product variant may be omitted from the plan, or disabled.
+
+In fast RTC mode, the real-time clock is set and then polled for its first seconds rollover, which is timed against
+the host clock. This takes about one second rather than two, and the clock drift is reported in parts per million.
+If the rollover cannot be timed to within the res limit - 5000 ppm by default - the subject is reported as
+RTCUnmeasurableError rather than failed.
+
+In AFE burst mode, the AFE is sampled the given number of times, back-to-back. The mean, standard deviation,
+peak-to-peak range and drift of each WE and AE voltage are tested, each against its own limits, and are reported in
+an afe-stats block. This finds noisy or unstable ADC channels that a single sample would pass. The limits - for
+example we_v_std or ae_v_slope - may be set in the test plan, with null for an open bound.
+
+In population mode, the AFE WE and AE voltages and the Pt1000 voltage are also scored against the golden population -
+the running mean and standard deviation of the readings of all the DFEs that have passed, as held in the local result
+store. A reading fails if its z-score is outside the limits - for example v_z or we_v_z - which are -4 to 4 by
+default. Readings are only scored once their channel has a population of at least 30. The z-scores are reported in a
+z-scores block. The population is updated with the readings of each passing report that is stored.
+
+If the parallel flag is set, all subjects whose dependencies are satisfied are tested concurrently. Tests that share a
+host bus (I2C, SPI, UART) are serialised by a per-bus lock. The subjects are reported in plan order in either case.
+
+If a timeout is given, any subject that has not completed within that time - including retries - is abandoned: its bus
+locks are released, its device is powered down where possible, and it is reported as TIMEOUT. A timeout given for a
+subject in the test plan takes precedence. The time for any one subject is thereby bounded.
+
+In fail-fast mode, no further tests are started once a mandatory subject has not passed, and the subjects not yet
+started are reported as ignored. All subjects are mandatory unless the test plan states otherwise.
+
+In priority order mode, subjects are tested - as far as their dependencies allow - in descending order of their
+historical failure probability divided by their mean duration, as held in the local result store. Together with
+fail-fast mode, this rejects a bad board in the least expected time.
+
+If the timing flag is set, the report includes a timing block, giving the total run time, and the wall time, time
+holding a bus, and number of retries for each subject that was conducted.
+
+In stream mode, an event is written as each subject's test starts, and as each subject is resolved - with its outcome,
+timing and test datum - as newline-delimited JSON. Result events are written in order of completion, not plan order.
+The final report follows the events, and is distinguished by its lack of an event field.
+
+If the store flag is set, the report is also appended to the local result store - an SQLite database in the SCS
+directory - which may be queried using the dfe_test_query utility. Stored reports always include the timing block.
+The store is created only when a report is stored: the priority order, population and retest modes read it if it
+exists, and otherwise proceed as if it were empty.
+
+In retest mode, the most recent stored report for the DFE is loaded, and only the subjects that did not pass are tested
+again. Subjects that passed are carried over to the new report, together with their AFE and RTC data, and the report
+records the time of the report that it was merged with, and the subjects that were carried. Carried AFE readings are
+not added to the golden population again. Subjects that were ignored because a dependency failed are tested again if
+the dependency now passes.
+
+In batch mode, the DFEs of a test fixture are tested together: one DFE on each channel of a TCA9548A I2C multiplexer
+at the given address, with one serial number given per channel, in channel order. A serial number of "-" marks an
+empty channel. The DFEs are tested concurrently, each on its own runner, so that the I2C bus is used for one DFE
+while the tests of another are waiting - the multiplexer channel is switched as each test takes the bus. Subjects that
+are not on the multiplexed I2C sensors bus - the OPC, GPS and EEPROM - are ignored. One report is written for each DFE,
+as its test completes. In stream mode, each event is labelled with the serial number of its DFE.
+
+If a simulation file is given, the tests are conducted on simulated devices, with the latency, noise and fault
+probability specified for each device. The simulated host has its own SCS directory, holding its conf documents and
+result store. This allows the test harness to be run and benchmarked on a workstation.
+
 Ideally, a standard resistor load should be attached to the AFE connector of the DFE before the test is run.
 
 SYNOPSIS
-dfe_test.py [-e] [-g] [-r] [-v] DFE_SERIAL_NUMBER
+dfe_test.py [-t PLAN_FILE] [-e] [-g] [{-r | -f}] [-n SAMPLES] [-z] [-p] [-w TIMEOUT] [-x] [-o] [-m] [-j] [-s] [-R] \
+    [-S SIM_FILE] [-v] { DFE_SERIAL_NUMBER | -b MUX_ADDR DFE_SERIAL_NUMBER_0 [... DFE_SERIAL_NUMBER_7] }
 
 EXAMPLES
 ./dfe_test.py -g -r -v 123
+./dfe_test.py -p -f -m -s 123
+./dfe_test.py -p -w 30 123
+./dfe_test.py -n 20 -m 123
+./dfe_test.py -z -s 123
+./dfe_test.py -x -o -s 123
+./dfe_test.py -p -j 123
+./dfe_test.py -t ~/SCS/conf/dfe_test_plan_no_opc.json -p 123
+./dfe_test.py -R -s 123
+./dfe_test.py -b 0x70 -p -f -s 201 202 - 204 205 206 207 208
+./dfe_test.py -S ~/SCS-sim/dfe_sim.json -p -m 123
 
 DOCUMENT EXAMPLE - OUTPUT
 {"tag": "scs-ap1-6", "rec": "2018-04-06T16:08:45.037+00:00",
 "val": {"host-sn": "0000000040d4d158", "dfe-sn": "123", "result": "FAIL",
-"subjects": {"RTC": "-", "BoardTemp": "OK", "OPC": "FAIL", "GPS": "-", "Int SHT": "OK", "Ext SHT": "OK",
+"subjects": {"RTC": "-", "BoardTemp": "OK", "OPC": "FAIL", "GPS": "TIMEOUT", "Int SHT": "OK", "Ext SHT": "OK",
 "Pt1000": "OK", "AFE": "FAIL", "EEPROM": "OK"}, "afe": {"pt1": {"v": 0.323286, "tmp": 22.8},
 "sns": {"CO": {"weV": 0.339005, "aeV": 0.257254, "weC": 0.042188, "cnc": 155.1},
 "SO2": {"weV": 0.267942, "aeV": 0.275942, "weC": -0.009696, "cnc": -26.4},
 "H2S": {"weV": 0.296192, "aeV": 0.285754, "weC": 0.026254, "cnc": 19.4},
-"VOC": {"weV": 0.102627, "weC": 0.102037, "cnc": 1300.9}}}}}
+"VOC": {"weV": 0.102627, "weC": 0.102037, "cnc": 1300.9}}},
+"afe-stats": {"CO": {"weV": {"n": 20, "mean": 0.339102, "std": 0.000214, "ptp": 0.000771, "slope": -2.1e-05},
+"aeV": {...}}, ...}, "z-scores": {"afe.pt1.v": -0.42, "afe.sns.CO.weV": 1.17, ...},
+"rtc": {"period": 1.000412, "ppm": 412.0, "res": 520.0},
+"timing": {"total": 9.412, "subjects": {"BoardTemp": {"wall": 0.021, "bus": 0.003, "retries": 0}, ...}},
+"retest-of": "2018-04-06T16:02:11.516+00:00"}}
+
+DOCUMENT EXAMPLE - STREAM EVENTS
+{"event": "start", "subject": "Int SHT", "rec": "2018-04-06T16:08:36.102+00:00"}
+{"event": "result", "subject": "Int SHT", "rec": "2018-04-06T16:08:36.125+00:00", "outcome": "OK",
+"timing": {"wall": 0.023, "bus": 0.021, "retries": 0}, "datum": {"hmd": 44.1, "tmp": 22.3}}
+
+DOCUMENT EXAMPLE - PLAN FILE
+{"tests": [{"subject": "BoardTemp", "test": "BoardTempTest"},
+{"subject": "Int SHT", "test": "SHTTest", "args": {"sht": "int"}, "limits": {"humid": [10, 90], "temp": [10, 50]}},
+{"subject": "Pt1000", "test": "Pt1000Test", "limits": {"v": [0.3, 0.4]}},
+{"subject": "AFE", "test": "AFETest", "args": {"samples": 20}, "depends-on": ["Pt1000"],
+"limits": {"we_v_std": [null, 0.001], "ae_v_std": [null, 0.001]}},
+{"subject": "GPS", "test": "GPSTest", "timeout": 60, "mandatory": false},
+{"subject": "EEPROM", "test": "EEPROMTest"}]}
+
+DOCUMENT EXAMPLE - SIMULATION FILE
+{"seed": 1, "tag": "scs-sim", "host-sn": "sim-0001", "scs-dir": "~/SCS-sim",
+"ambient": {"temp": 22.0, "humid": 45.0},
+"devices": {"i2c": {"latency": 0.0005}, "afe": {"latency": 0.012, "noise": 0.002},
+"rtc": {"values": {"ppm": 35}}, "gps": {"latency": 2.5, "fault": 0.05}, "eeprom": {"latency": 0.005}}}
 """
 
 import sys
 
-from scs_core.data.json import JSONify
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
 from scs_core.data.localized_datetime import LocalizedDatetime
 
 from scs_core.sys.system_id import SystemID
 
-from scs_dfe.climate.sht_conf import SHTConf
-
 from scs_host.sys.host import Host
 
 from scs_mfr.cmd.cmd_dfe_test import CmdDFETest
 
 from scs_mfr.report.dfe_test_datum import DFETestDatum
 from scs_mfr.report.dfe_test_reporter import DFETestReporter
+from scs_mfr.report.dfe_test_store import DFETestStore
+from scs_mfr.report.dfe_test_writer import DFETestWriter
+
+from scs_mfr.sim.sim_conf import SimConf
+from scs_mfr.sim.sim_platform import SimPlatform
+from scs_mfr.sim.sim_test_session import SimTestSession
 
-from scs_mfr.test.afe_test import AFETest
-from scs_mfr.test.board_temp_test import BoardTempTest
-from scs_mfr.test.eeprom_test import EEPROMTest
-from scs_mfr.test.gps_test import GPSTest
-from scs_mfr.test.opc_test import OPCTest
-from scs_mfr.test.pt1000_test import Pt1000Test
+from scs_mfr.test.bus_lock import BusLock
+from scs_mfr.test.golden_population import GoldenPopulation
 from scs_mfr.test.rtc_test import RTCTest
-from scs_mfr.test.sht_test import SHTTest
+from scs_mfr.test.subject_priority import SubjectPriority
+from scs_mfr.test.tca9548a import TCA9548A
+from scs_mfr.test.test_plan import TestPlan
+from scs_mfr.test.test_runner import TestRunner
+from scs_mfr.test.test_session import TestSession
 
 
 # --------------------------------------------------------------------------------------------------------------------
@@ -78,185 +184,236 @@ if __name__ == '__main__':
     # ----------------------------------------------------------------------------------------------------------------
     # resources...
 
+    # SimPlatform...
+    platform = None
+
+    if cmd.sim_filename is not None:
+        try:
+            platform = SimPlatform(SimConf.load_from_file(cmd.sim_filename))
+
+        except (OSError, ValueError) as ex:
+            print("dfe_test: invalid simulation: %s" % ex, file=sys.stderr)
+            exit(1)
+
+        if cmd.verbose:
+            print(platform, file=sys.stderr)
+            sys.stderr.flush()
+
+    host = Host if platform is None else platform.host
+
     # SystemID...
-    system_id = SystemID.load(Host)
+    system_id = SystemID.load(host)
 
-    if system_id is None:
+    if system_id is None and platform is None:
         print("dfe_test: SystemID not available.", file=sys.stderr)
         exit(1)
 
+    tag = platform.conf.tag if system_id is None else system_id.message_tag()
+
     if cmd.verbose:
         print(system_id, file=sys.stderr)
         sys.stderr.flush()
 
-    reporter = DFETestReporter(cmd.verbose)
+    # TestPlan...
+    try:
+        plan = TestPlan.default() if cmd.plan_filename is None else TestPlan.load_from_file(cmd.plan_filename)
 
+        if plan is None:
+            raise ValueError("no tests specified")
 
-    # ----------------------------------------------------------------------------------------------------------------
-    # run...
+        plan.ordered()
 
-    afe_datum = None
+    except (OSError, ValueError) as ex:
+        print("dfe_test: invalid test plan: %s" % ex, file=sys.stderr)
+        exit(1)
 
+    if cmd.ignore_rtc:
+        plan.disable("RTC")
 
-    # ----------------------------------------------------------------------------------------------------------------
-    # UUID...
+    if cmd.fast_rtc and plan.item("RTC") is not None:
+        plan.item("RTC").args['mode'] = RTCTest.MODE_FAST
 
+    if cmd.afe_samples is not None and plan.item("AFE") is not None:
+        plan.item("AFE").args['samples'] = cmd.afe_samples
 
-    # ----------------------------------------------------------------------------------------------------------------
-    # RTC...
+    if cmd.ignore_gps:
+        plan.disable("GPS")
 
-    if cmd.ignore_rtc:
-        reporter.report_ignore("RTC")
+    if cmd.ignore_eeprom:
+        plan.disable("EEPROM")
 
-    else:
-        try:
-            test = RTCTest(cmd.verbose)
+    if cmd.batch:
+        for item in plan.items:
+            if any(bus != BusLock.I2C_SENSORS for bus in item.test_class.BUSES):
+                plan.disable(item.subject)
 
-            test_ok = test.conduct()
-            reporter.report_test("RTC", test_ok)
+    # the store is created only when a report is stored...
+    if cmd.order and DFETestStore.exists(host):
+        store = DFETestStore.open(host)
 
-        except Exception as ex:
-            reporter.report_exception("RTC", ex)
+        try:
+            plan.prioritise(SubjectPriority.priorities(store.subject_statistics()))
 
+        finally:
+            store.close()
 
-    # ----------------------------------------------------------------------------------------------------------------
-    # Board temp...
+    # GoldenPopulation...
+    population = None
 
-    try:
-        test = BoardTempTest(cmd.verbose)
+    if cmd.population:
+        if DFETestStore.exists(host):
+            store = DFETestStore.open(host)
 
-        test_ok = test.conduct()
-        reporter.report_test("BoardTemp", test_ok)
+            try:
+                population = store.population()
 
-    except Exception as ex:
-        reporter.report_exception("BoardTemp", ex)
+            finally:
+                store.close()
 
+        else:
+            population = GoldenPopulation()
 
-    # ----------------------------------------------------------------------------------------------------------------
-    # OPC...
+        if cmd.verbose:
+            print(population, file=sys.stderr)
 
-    try:
-        test = OPCTest(cmd.verbose)
+    if cmd.verbose:
+        print(plan, file=sys.stderr)
+        print("dfe_test: order: %s" % [item.subject for item in plan.ordered()], file=sys.stderr)
+        sys.stderr.flush()
 
-        test_ok = test.conduct()
-        reporter.report_test("OPC", test_ok)
+    # previous reports...
+    previous = {}
+    carried = {}
 
-    except Exception as ex:
-        reporter.report_exception("OPC", ex)
+    if cmd.retest:
+        if DFETestStore.exists(host):
+            store = DFETestStore.open(host)
 
+            try:
+                for channel, dfe_serial_number in cmd.channels.items():
+                    previous[channel] = store.latest(dfe_serial_number)
 
-    # ----------------------------------------------------------------------------------------------------------------
-    # GPS...
+            finally:
+                store.close()
 
-    if cmd.ignore_gps:
-        reporter.report_ignore("GPS")
+        for channel, dfe_serial_number in cmd.channels.items():
+            if previous.get(channel) is None:
+                print("dfe_test: no stored report for DFE %s." % dfe_serial_number, file=sys.stderr)
+                exit(1)
 
-    else:
-        try:
-            test = GPSTest(cmd.verbose)
+            carried[channel] = [subject for subject, outcome in previous[channel]['val']['subjects'].items()
+                                if outcome == DFETestStore.PASSED and plan.item(subject) is not None]
 
-            test_ok = test.conduct()
-            reporter.report_test("GPS", test_ok)
+            if cmd.verbose:
+                print("dfe_test: DFE %s: retest of %s, carrying %s" %
+                      (dfe_serial_number, previous[channel]['rec'], carried[channel]), file=sys.stderr)
+                sys.stderr.flush()
 
-        except Exception as ex:
-            reporter.report_exception("GPS", ex)
+    # TestSessions...
+    if platform is None:
+        mux = TCA9548A(cmd.mux_addr) if cmd.batch else None
 
+        sessions = OrderedDict((channel, TestSession(host, mux=mux, channel=None if mux is None else channel,
+                                                     population=population))
+                               for channel in cmd.channels)
+    else:
+        sessions = OrderedDict((channel, SimTestSession(platform.board(channel) if cmd.batch else platform,
+                                                        population=population))
+                               for channel in cmd.channels)
 
-    # ----------------------------------------------------------------------------------------------------------------
-    # NDIR...
+    # DFETestWriter...
+    writer = DFETestWriter()
 
+    # TestRunners...
+    reporters = OrderedDict()
+    runners = OrderedDict()
 
-    # ----------------------------------------------------------------------------------------------------------------
-    # Int SHT...
+    for channel, dfe_serial_number in cmd.channels.items():
+        listener = writer.listener(dfe_serial_number if cmd.batch else None) if cmd.stream else None
 
-    try:
-        sht_conf = SHTConf.load(Host)
-        sht = sht_conf.int_sht()
+        reporters[channel] = DFETestReporter(cmd.verbose)
+        runners[channel] = TestRunner(reporters[channel], cmd.parallel, timeout=cmd.timeout, fail_fast=cmd.fail_fast,
+                                      listener=listener, verbose=cmd.verbose)
 
-        test = SHTTest("Int SHT", sht, cmd.verbose)
+    if cmd.verbose:
+        print(runners[next(iter(runners))], file=sys.stderr)
+        sys.stderr.flush()
 
-        test_ok = test.conduct()
-        reporter.report_test("Int SHT", test_ok)
 
-    except Exception as ex:
-        reporter.report_exception("Int SHT", ex)
+    # ----------------------------------------------------------------------------------------------------------------
+    # run...
 
+    def conduct(channel):
+        dfe_serial_number = cmd.channels[channel]
+        reporter = reporters[channel]
 
-    # ----------------------------------------------------------------------------------------------------------------
-    # Ext SHT...
+        tests = runners[channel].run(plan, sessions[channel], carried=carried.get(channel))
 
-    try:
-        sht_conf = SHTConf.load(Host)
-        sht = sht_conf.ext_sht()
+        afe_datum = tests["AFE"].datum if "AFE" in tests else None
+        afe_stats = tests["AFE"].statistics if "AFE" in tests else None
+        rtc_datum = tests["RTC"].drift if isinstance(tests.get("RTC"), RTCTest) else None
+        timing = reporter.timing if cmd.timing or cmd.store else None
 
-        test = SHTTest("Ext SHT", sht, cmd.verbose)
+        if "AFE" in carried.get(channel, []):
+            afe_datum = previous[channel]['val'].get('afe')
+            afe_stats = previous[channel]['val'].get('afe-stats')
 
-        test_ok = test.conduct()
-        reporter.report_test("Ext SHT", test_ok)
+        if "RTC" in carried.get(channel, []):
+            rtc_datum = previous[channel]['val'].get('rtc')
 
-    except Exception as ex:
-        reporter.report_exception("Ext SHT", ex)
+        retest_of = previous[channel]['rec'] if channel in previous else None
 
+        z_scores = None
 
-    # ----------------------------------------------------------------------------------------------------------------
-    # Pt1000...
+        if cmd.population:
+            z_scores = OrderedDict(previous[channel]['val'].get('z-scores') or {}) if channel in previous else \
+                OrderedDict()
 
-    try:
-        test = Pt1000Test(cmd.verbose)
+            for test in tests.values():
+                z_scores.update((name, round(z_score, 2)) for name, z_score in test.z_scores.items())
 
-        test_ok = test.conduct()
-        reporter.report_test("Pt1000", test_ok)
+        # result...
+        if cmd.verbose:
+            print("dfe_test: DFE %s: %s" % (dfe_serial_number, reporter), file=sys.stderr)
+            print(reporter.result, file=sys.stderr)
+            print("-", file=sys.stderr)
 
-    except Exception as ex:
-        reporter.report_exception("Pt1000", ex)
+        # report...
+        recorded = LocalizedDatetime.now()
+        report = DFETestDatum(tag, recorded, host.serial_number(), dfe_serial_number,
+                              reporter.subjects, afe_datum, reporter.result,
+                              rtc=rtc_datum, timing=timing, retest_of=retest_of, afe_stats=afe_stats,
+                              z_scores=z_scores, carried=carried.get(channel))
 
+        writer.write(report)
 
-    # ----------------------------------------------------------------------------------------------------------------
-    # AFE...
+        return report
 
     try:
-        test = AFETest(cmd.verbose)
+        for session in sessions.values():
+            session.open()
 
-        test_ok = test.conduct()
-        reporter.report_test("AFE", test_ok)
+        with ThreadPoolExecutor(max_workers=len(sessions)) as executor:
+            reports = list(executor.map(conduct, sessions))
 
-        afe_datum = test.datum
-
-    except Exception as ex:
-        reporter.report_exception("AFE", ex)
+    finally:
+        for session in sessions.values():
+            session.close()
 
 
     # ----------------------------------------------------------------------------------------------------------------
-    # EEPROM...
+    # store...
 
-    if cmd.ignore_eeprom:
-        reporter.report_ignore("EEPROM")
+    if cmd.store:
+        store = DFETestStore.open(host)
 
-    else:
         try:
-            test = EEPROMTest(cmd.verbose)
-
-            test_ok = test.conduct()
-            reporter.report_test("EEPROM", test_ok)
-
-        except Exception as ex:
-            reporter.report_exception("EEPROM", ex)
-
-
-    # ----------------------------------------------------------------------------------------------------------------
-    # result...
-
-    if cmd.verbose:
-        print(reporter, file=sys.stderr)
-        print(reporter.result, file=sys.stderr)
-        print("-", file=sys.stderr)
-
-
-    # ----------------------------------------------------------------------------------------------------------------
-    # report...
+            for dfe_serial_number, report in zip(cmd.channels.values(), reports):
+                report_id = store.append(report)
 
-    recorded = LocalizedDatetime.now()
-    datum = DFETestDatum(system_id.message_tag(), recorded, Host.serial_number(), cmd.dfe_serial_number,
-                         reporter.subjects, afe_datum, reporter.result)
+                if cmd.verbose:
+                    print("dfe_test: DFE %s stored as report %d in %s" %
+                          (dfe_serial_number, report_id, DFETestStore.filename(host)), file=sys.stderr)
 
-    print(JSONify.dumps(datum))
+        finally:
+            store.close()
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+DESCRIPTION
+The dfe_test_query utility is used to analyse the DFE test reports held in the local result store. Reports are
+appended to the store by the dfe_test utility when its store flag is set, or may be imported from stdin.
+
+The yield report gives, for each subject, the number of boards on which the subject was tested, and the number and
+percentage that passed. The Pareto report lists failures by subject and outcome, most frequent first, with the
+cumulative percentage of all failures. The throughput report gives the number of boards tested and passed on each day.
+The population report gives the number, mean and standard deviation of the AFE and Pt1000 readings of all the boards
+that have passed - the golden population used by the dfe_test population mode. It is not limited to a range of days.
+
+Reports may be limited to a range of days. The store maintains daily summaries as reports are appended, so the
+queries do not need to scan the reports themselves. If there is no store, the queries report nothing - the store is
+only created by an import, or by the dfe_test utility.
+
+On import, each line that is not a valid report is reported on stderr with its line number, and skipped - the
+other reports are imported, and the utility then exits with status 1.
+
+SYNOPSIS
+dfe_test_query.py { -i | -y | -p | -t | -g } [-s START_DAY] [-e END_DAY] [-f DB_FILE] [-v]
+
+EXAMPLES
+./dfe_test_query.py -y -s 2026-10-01
+./dfe_test_query.py -p
+cat dfe_test_reports.json | ./dfe_test_query.py -i
+
+DOCUMENT EXAMPLE - YIELD
+{"subject": "AFE", "tested": 1204, "passed": 1163, "yield": 96.6}
+
+DOCUMENT EXAMPLE - PARETO
+{"subject": "OPC", "outcome": "FAIL", "failures": 31, "cum-pct": 43.7}
+
+DOCUMENT EXAMPLE - THROUGHPUT
+{"day": "2026-10-16", "tested": 212, "passed": 201, "yield": 94.8}
+
+DOCUMENT EXAMPLE - POPULATION
+{"channel": "afe.pt1.v", "n": 1163, "mean": 0.352109, "std": 0.001934}
+"""
+
+import json
+import sys
+
+from collections import OrderedDict
+
+from scs_core.data.json import JSONify
+
+from scs_host.sys.host import Host
+
+from scs_mfr.cmd.cmd_dfe_test_query import CmdDFETestQuery
+
+from scs_mfr.report.dfe_test_store import DFETestStore
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # cmd...
+
+    cmd = CmdDFETestQuery()
+
+    if cmd.verbose:
+        print("dfe_test_query: %s" % cmd, file=sys.stderr)
+        sys.stderr.flush()
+
+    if not cmd.is_valid():
+        cmd.print_help(sys.stderr)
+        exit(2)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # resources...
+
+    filename = DFETestStore.filename(Host) if cmd.db_filename is None else cmd.db_filename
+
+    if cmd.verbose:
+        print("dfe_test_query: %s" % filename, file=sys.stderr)
+        sys.stderr.flush()
+
+    # the store is created only by an import...
+    if not cmd.import_reports and not DFETestStore.exists_file(filename):
+        if cmd.verbose:
+            print("dfe_test_query: no result store", file=sys.stderr)
+
+        exit(0)
+
+    store = DFETestStore.open_file(filename)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # run...
+
+    try:
+        if cmd.import_reports:
+            count = 0
+            rejected = 0
+
+            for number, line in enumerate(sys.stdin, start=1):
+                if not line.strip():
+                    continue
+
+                try:
+                    store.append(json.loads(line, object_pairs_hook=OrderedDict))
+                    count += 1
+
+                except KeyError as ex:
+                    print("dfe_test_query: line %d: missing field: %s" % (number, ex), file=sys.stderr)
+                    rejected += 1
+
+                except (ValueError, TypeError) as ex:
+                    print("dfe_test_query: line %d: invalid report: %s" % (number, ex), file=sys.stderr)
+                    rejected += 1
+
+            if cmd.verbose or rejected:
+                print("dfe_test_query: imported %d reports, rejected %d" % (count, rejected), file=sys.stderr)
+
+            exit(1 if rejected else 0)
+
+        if cmd.subject_yield:
+            rows = store.subject_yields(cmd.start_day, cmd.end_day)
+
+        elif cmd.pareto:
+            rows = store.failure_pareto(cmd.start_day, cmd.end_day)
+
+        elif cmd.population:
+            rows = store.population_statistics()
+
+        else:
+            rows = store.daily_throughput(cmd.start_day, cmd.end_day)
+
+        for row in rows:
+            print(JSONify.dumps(row))
+            sys.stdout.flush()
+
+    except KeyboardInterrupt:
+        if cmd.verbose:
+            print("dfe_test_query: KeyboardInterrupt", file=sys.stderr)
+
+    finally:
+        store.close()
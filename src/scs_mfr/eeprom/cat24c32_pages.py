@@ -0,0 +1,83 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Page-level access to a CAT24C32 EEPROM on the current I2C bus. Unlike the CAT24C32 driver, nothing is read on
+construction - any range may be read with one sequential read, and any page written with one page-write burst,
+followed by the write cycle time. The caller may instead wait out the write cycle itself, for example after releasing
+the bus.
+
+The caller must hold the I2C bus open.
+
+http://www.onsemi.com/pub/Collateral/CAT24C32-D.PDF
+"""
+
+import time
+
+from scs_host.bus.i2c import I2C
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CAT24C32Pages(object):
+    """
+    classdocs
+    """
+
+    SIZE =              0x1000              # bytes
+    PAGE_SIZE =         32                  # bytes
+
+    DEFAULT_ADDR =      0x50
+
+    TWR =               0.005               # seconds write cycle time
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, addr=DEFAULT_ADDR):
+        """
+        Constructor
+        """
+        self.__addr = addr
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def read(self, memory_addr, count):
+        if memory_addr < 0 or memory_addr + count > self.SIZE:
+            raise ValueError("invalid range: 0x%04x + %d" % (memory_addr, count))
+
+        try:
+            I2C.start_tx(self.__addr)
+            return bytes(I2C.read_cmd16(memory_addr, count))
+
+        finally:
+            I2C.end_tx()
+
+
+    def write_page(self, memory_addr, values, wait=True):
+        if memory_addr % self.PAGE_SIZE != 0 or not 0 < len(values) <= self.PAGE_SIZE:
+            raise ValueError("invalid page write: 0x%04x + %d" % (memory_addr, len(values)))
+
+        try:
+            I2C.start_tx(self.__addr)
+            I2C.write_addr16(memory_addr, *values)
+
+            if wait:
+                time.sleep(self.TWR)
+
+        finally:
+            I2C.end_tx()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def addr(self):
+        return self.__addr
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "CAT24C32Pages:{addr:0x%02x}" % self.addr
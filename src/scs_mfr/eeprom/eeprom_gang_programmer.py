@@ -0,0 +1,94 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Differential programming of a gang of EEPROMs with the same image, one worker thread per device. Each device is
+programmed and verified by an EEPROMProgrammer, and the results are yielded in order of completion.
+
+Devices on different I2C buses share the host's single I2C handle, as do devices on different channels of a
+multiplexer, so their transfers are serialised by the BusLock - the gain is that each device's write cycles overlap
+the transfers to the others. The I2C handle is retained between transfers for the whole run, so that it is not
+re-opened for each transfer on the same bus - it is still re-opened whenever consecutive transfers are on different
+buses.
+"""
+
+import time
+
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from scs_mfr.eeprom.cat24c32_pages import CAT24C32Pages
+from scs_mfr.eeprom.eeprom_gang_result import EEPROMGangResult
+from scs_mfr.eeprom.eeprom_programmer import EEPROMProgrammer
+
+from scs_mfr.test.bus_lock import BusLock
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class EEPROMGangProgrammer(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def __program(device, content):
+        start = time.monotonic()
+
+        try:
+            programmer = EEPROMProgrammer(device, CAT24C32Pages.SIZE, CAT24C32Pages.PAGE_SIZE)
+            programming = programmer.program(content)
+            error = None
+
+        except (OSError, ValueError) as ex:
+            programming = None
+            error = ex
+
+        return EEPROMGangResult(device.target, programming, error, time.monotonic() - start)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, devices):
+        """
+        Constructor
+        """
+        self.__devices = devices                    # list of GangCAT24C32
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def program(self, content):
+        """
+        content: bytes-like image of the whole device
+        yields EEPROMGangResult for each device, in order of completion
+        """
+        if not self.__devices:
+            return
+
+        BusLock.retain()
+
+        try:
+            with ThreadPoolExecutor(max_workers=len(self.__devices)) as executor:
+                futures = [executor.submit(self.__program, device, content) for device in self.__devices]
+
+                for future in as_completed(futures):
+                    yield future.result()
+
+        finally:
+            BusLock.release()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def devices(self):
+        return self.__devices
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "EEPROMGangProgrammer:{devices:[%s]}" % ", ".join(str(device) for device in self.devices)
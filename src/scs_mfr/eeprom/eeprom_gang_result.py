@@ -0,0 +1,83 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+The outcome of programming one EEPROM of a gang: its target, and either the EEPROMProgramming or the error that
+prevented it, with the elapsed time.
+
+example JSON:
+{"bus": 1, "channel": 3, "pages": 128, "written": 6, "crc": "0x5f1c0a92", "verified": true, "time": 0.061}
+{"bus": 1, "channel": 4, "error": "OSError: [Errno 121] Remote I/O error", "time": 0.002}
+"""
+
+from scs_core.data.json import JSONable
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class EEPROMGangResult(JSONable):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, target, programming, error, elapsed):
+        """
+        Constructor
+        """
+        self.__target = target                      # EEPROMTarget
+        self.__programming = programming            # EEPROMProgramming, or None
+        self.__error = error                        # Exception, or None
+        self.__elapsed = elapsed                    # float seconds
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self):
+        jdict = self.target.as_json()
+
+        if self.programming is not None:
+            jdict.update(self.programming.as_json())
+
+        else:
+            jdict['error'] = "%s: %s" % (self.error.__class__.__name__, self.error)
+
+        jdict['time'] = round(self.elapsed, 3)
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def verified(self):
+        return self.programming is not None and self.programming.verified
+
+
+    @property
+    def target(self):
+        return self.__target
+
+
+    @property
+    def programming(self):
+        return self.__programming
+
+
+    @property
+    def error(self):
+        return self.__error
+
+
+    @property
+    def elapsed(self):
+        return self.__elapsed
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "EEPROMGangResult:{target:%s, programming:%s, error:%s, elapsed:%s}" % \
+               (self.target, self.programming, self.error, self.elapsed)
@@ -0,0 +1,95 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Differential EEPROM programming. The device is read once, in a single sequential read, and only the pages that differ
+from the image are written, each with one full page-write burst. The written pages are then read back - one read for
+each run of adjacent pages - and verified by a CRC-32 over the written pages.
+
+Programming a device that already holds the image therefore takes one read and no write cycles, and programming a
+blank device takes one write cycle for each page that is not blank in the image.
+
+The device must provide read(memory_addr, count) and write_page(memory_addr, values), as CAT24C32Pages does.
+"""
+
+import zlib
+
+from scs_mfr.eeprom.eeprom_programming import EEPROMProgramming
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class EEPROMProgrammer(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def __runs(page_addrs, page_size):
+        """
+        returns (start, end) address pairs for each run of adjacent pages
+        """
+        runs = []
+
+        for addr in page_addrs:
+            if runs and runs[-1][1] == addr:
+                runs[-1][1] = addr + page_size
+
+            else:
+                runs.append([addr, addr + page_size])
+
+        return [(start, end) for start, end in runs]
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, device, size, page_size):
+        """
+        Constructor
+        """
+        self.__device = device
+        self.__size = size                              # int bytes
+        self.__page_size = page_size                    # int bytes
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def program(self, content):
+        """
+        content: bytes-like image of the whole device
+        returns EEPROMProgramming
+        """
+        content = bytes(content)
+
+        if len(content) != self.__size:
+            raise ValueError("image is %d bytes, device is %d bytes" % (len(content), self.__size))
+
+        # read...
+        current = self.__device.read(0, self.__size)
+
+        # write...
+        page_addrs = [addr for addr in range(0, self.__size, self.__page_size)
+                      if current[addr:addr + self.__page_size] != content[addr:addr + self.__page_size]]
+
+        for addr in page_addrs:
+            self.__device.write_page(addr, content[addr:addr + self.__page_size])
+
+        # verify...
+        expected_crc = 0
+        actual_crc = 0
+
+        for start, end in self.__runs(page_addrs, self.__page_size):
+            expected_crc = zlib.crc32(content[start:end], expected_crc)
+            actual_crc = zlib.crc32(self.__device.read(start, end - start), actual_crc)
+
+        return EEPROMProgramming(self.__size // self.__page_size, len(page_addrs), expected_crc,
+                                 actual_crc == expected_crc)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "EEPROMProgrammer:{device:%s, size:%s, page_size:%s}" % (self.__device, self.__size, self.__page_size)
@@ -0,0 +1,76 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+The outcome of differential EEPROM programming: the number of pages in the device, the number that differed from the
+image and were written, the CRC-32 of the image over the written pages, and whether the pages read back matched it.
+
+example JSON:
+{"pages": 128, "written": 3, "crc": "0x5f1c0a92", "verified": true}
+"""
+
+from collections import OrderedDict
+
+from scs_core.data.json import JSONable
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class EEPROMProgramming(JSONable):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, pages, written, crc, verified):
+        """
+        Constructor
+        """
+        self.__pages = pages                    # int
+        self.__written = written                # int
+        self.__crc = crc                        # int CRC-32
+        self.__verified = verified              # bool
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self):
+        jdict = OrderedDict()
+
+        jdict['pages'] = self.pages
+        jdict['written'] = self.written
+        jdict['crc'] = "0x%08x" % self.crc
+        jdict['verified'] = self.verified
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def pages(self):
+        return self.__pages
+
+
+    @property
+    def written(self):
+        return self.__written
+
+
+    @property
+    def crc(self):
+        return self.__crc
+
+
+    @property
+    def verified(self):
+        return self.__verified
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "EEPROMProgramming:{pages:%s, written:%s, crc:0x%08x, verified:%s}" % \
+               (self.pages, self.written, self.crc, self.verified)
@@ -0,0 +1,86 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+The location of an EEPROM to be programmed: an I2C bus and, if the bus is fanned out by a multiplexer, a channel.
+
+Given on the command line as BUS or BUS:CHANNEL - for example, 1 or 1:3.
+"""
+
+from collections import OrderedDict
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class EEPROMTarget(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct_from_arg(cls, arg):
+        """
+        raises ValueError if arg is not BUS or BUS:CHANNEL
+        """
+        fields = arg.split(':')
+
+        if len(fields) > 2:
+            raise ValueError("invalid target: %s" % arg)
+
+        bus = int(fields[0])
+        channel = int(fields[1]) if len(fields) > 1 else None
+
+        if bus < 0 or (channel is not None and channel < 0):
+            raise ValueError("invalid target: %s" % arg)
+
+        return EEPROMTarget(bus, channel)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, bus, channel=None):
+        """
+        Constructor
+        """
+        self.__bus = bus                        # int
+        self.__channel = channel                # int, or None
+
+
+    def __eq__(self, other):
+        return isinstance(other, EEPROMTarget) and self.bus == other.bus and self.channel == other.channel
+
+
+    def __hash__(self):
+        return hash((self.bus, self.channel))
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self):
+        jdict = OrderedDict()
+
+        jdict['bus'] = self.bus
+        jdict['channel'] = self.channel
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def bus(self):
+        return self.__bus
+
+
+    @property
+    def channel(self):
+        return self.__channel
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return str(self.bus) if self.channel is None else "%s:%s" % (self.bus, self.channel)
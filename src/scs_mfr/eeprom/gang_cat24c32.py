@@ -0,0 +1,67 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A CAT24C32 EEPROM at an EEPROMTarget, for gang programming. Each read and page write holds the target's I2C bus - with
+the calling thread bound to the target's multiplexer channel - only for the transfer itself. The write cycle time is
+waited out after the bus is released, so that the write cycles of devices on a shared bus overlap.
+
+The page-level device must provide read(memory_addr, count) and write_page(memory_addr, values, wait), as
+CAT24C32Pages does.
+"""
+
+import time
+
+from scs_mfr.eeprom.cat24c32_pages import CAT24C32Pages
+
+from scs_mfr.test.bus_lock import BusLock
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class GangCAT24C32(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, target, pages=None, twr=CAT24C32Pages.TWR):
+        """
+        Constructor
+        """
+        self.__target = target                                              # EEPROMTarget
+        self.__pages = CAT24C32Pages() if pages is None else pages          # page-level device
+        self.__twr = twr                                                    # float seconds
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def read(self, memory_addr, count):
+        BusLock.bind(self.target.channel)
+
+        with BusLock.i2c(BusLock.I2C_EEPROM, self.target.bus):
+            return self.__pages.read(memory_addr, count)
+
+
+    def write_page(self, memory_addr, values):
+        BusLock.bind(self.target.channel)
+
+        with BusLock.i2c(BusLock.I2C_EEPROM, self.target.bus):
+            self.__pages.write_page(memory_addr, values, wait=False)
+
+        time.sleep(self.__twr)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def target(self):
+        return self.__target
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "GangCAT24C32:{target:%s, pages:%s, twr:%s}" % (self.target, self.__pages, self.__twr)
@@ -0,0 +1,119 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+An atom of a Raspberry Pi HAT EEPROM image: type, count and data length, the data, then a CRC-16 over all of those.
+
+The CRC is CRC-16/ARC (polynomial 0x8005, reflected, initial value 0), as used by eepmake, and is computed by table.
+
+https://github.com/raspberrypi/hats/blob/master/eeprom-format.md
+"""
+
+import struct
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class HATAtom(object):
+    """
+    classdocs
+    """
+
+    TYPE_VENDOR_INFO =      0x0001
+    TYPE_GPIO_MAP =         0x0002
+    TYPE_DT_BLOB =          0x0003
+    TYPE_CUSTOM =           0x0004
+
+    HEADER_SIZE =           8                   # type, count, dlen
+    CRC_SIZE =              2
+
+    __HEADER_FORMAT =       '<HHI'
+    __CRC_FORMAT =          '<H'
+
+    __CRC_POLY =            0xa001              # 0x8005, reflected
+
+    __crc_table = None                          # built on first use
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def crc16(cls, data, crc=0):
+        table = cls.__table()
+
+        for byte in data:
+            crc = (crc >> 8) ^ table[(crc ^ byte) & 0xff]
+
+        return crc
+
+
+    @classmethod
+    def __table(cls):
+        if cls.__crc_table is None:
+            table = []
+
+            for byte in range(256):
+                crc = byte
+
+                for _ in range(8):
+                    crc = (crc >> 1) ^ cls.__CRC_POLY if crc & 1 else crc >> 1
+
+                table.append(crc)
+
+            cls.__crc_table = table
+
+        return cls.__crc_table
+
+
+    @classmethod
+    def pack_crc(cls, crc):
+        return struct.pack(cls.__CRC_FORMAT, crc)
+
+
+    @classmethod
+    def unpack_header(cls, content, offset=0):
+        """
+        returns type, count, dlen - where dlen includes the CRC
+        """
+        return struct.unpack_from(cls.__HEADER_FORMAT, content, offset)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, atom_type, data):
+        """
+        Constructor
+        """
+        self.__atom_type = atom_type                # int
+        self.__data = bytes(data)                   # bytes
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_bytes(self, count):
+        atom = struct.pack(self.__HEADER_FORMAT, self.atom_type, count, len(self.data) + self.CRC_SIZE) + self.data
+
+        return atom + self.pack_crc(self.crc16(atom))
+
+
+    def __len__(self):
+        return self.HEADER_SIZE + len(self.data) + self.CRC_SIZE
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def atom_type(self):
+        return self.__atom_type
+
+
+    @property
+    def data(self):
+        return self.__data
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "HATAtom:{atom_type:0x%04x, data:%s}" % (self.atom_type, len(self.data))
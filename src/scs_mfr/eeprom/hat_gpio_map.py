@@ -0,0 +1,98 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+The data of a Raspberry Pi HAT GPIO map atom: the bank drive byte, the power byte, and one byte for each of GPIOs 0 to
+27 - bit 7 is set if the pin is used, bits 6 and 5 give the pull type, and bits 2 to 0 the function.
+
+example JSON:
+{"bank-drive": 0, "power": 0, "pins": [0, 0, 128, 128, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+0, 0, 0]}
+"""
+
+from collections import OrderedDict
+
+from scs_core.data.json import JSONable
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class HATGPIOMap(JSONable):
+    """
+    classdocs
+    """
+
+    PINS =      28
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct_from_jdict(cls, jdict):
+        if not jdict:
+            return HATGPIOMap()
+
+        return HATGPIOMap(jdict.get('bank-drive', 0), jdict.get('power', 0), jdict.get('pins'))
+
+
+    @classmethod
+    def construct_from_data(cls, data):
+        if len(data) != 2 + cls.PINS:
+            raise ValueError("GPIO map atom of %d bytes" % len(data))
+
+        return HATGPIOMap(data[0], data[1], list(data[2:]))
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, bank_drive=0, power=0, pins=None):
+        """
+        Constructor
+        """
+        pins = [0] * self.PINS if pins is None else [int(pin) for pin in pins]
+
+        if len(pins) != self.PINS:
+            raise ValueError("GPIO map of %d pins" % len(pins))
+
+        self.__bank_drive = int(bank_drive)             # int 8 bit
+        self.__power = int(power)                       # int 8 bit
+        self.__pins = pins                              # list of int 8 bit
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_data(self):
+        return bytes([self.bank_drive, self.power] + self.pins)
+
+
+    def as_json(self):
+        jdict = OrderedDict()
+
+        jdict['bank-drive'] = self.bank_drive
+        jdict['power'] = self.power
+        jdict['pins'] = self.pins
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def bank_drive(self):
+        return self.__bank_drive
+
+
+    @property
+    def power(self):
+        return self.__power
+
+
+    @property
+    def pins(self):
+        return self.__pins
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "HATGPIOMap:{bank_drive:%s, power:%s, pins:%s}" % (self.bank_drive, self.power, self.pins)
@@ -0,0 +1,173 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+The specification of a Raspberry Pi HAT EEPROM image: the vendor info and GPIO map atoms, an optional device tree blob
+atom, any number of custom data atoms, and a final custom atom of fixed width that holds the board serial number.
+
+The image is laid out once, as a HATImageTemplate, from which an image for each board is stamped.
+
+example JSON:
+{"vendor": "South Coast Science", "product": "Digital Front End", "product-id": 1, "product-ver": 2,
+"gpio-map": {"bank-drive": 0, "power": 0, "pins": null}, "dt-blob": "/home/pi/SCS/dfe.dtbo", "custom": [],
+"serial-width": 16}
+
+https://github.com/raspberrypi/hats/blob/master/eeprom-format.md
+"""
+
+import struct
+
+from collections import OrderedDict
+
+from scs_core.data.json import JSONable
+
+from scs_mfr.eeprom.hat_atom import HATAtom
+from scs_mfr.eeprom.hat_gpio_map import HATGPIOMap
+from scs_mfr.eeprom.hat_image_template import HATImageTemplate
+from scs_mfr.eeprom.hat_vendor_info import HATVendorInfo
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class HATImage(JSONable):
+    """
+    classdocs
+    """
+
+    SIGNATURE =             0x69502d52          # "R-Pi"
+    VERSION =               0x01
+
+    HEADER_SIZE =           12
+
+    DEFAULT_SERIAL_WIDTH =  16
+
+    __HEADER_FORMAT =       '<IBBHI'            # signature, version, reserved, numatoms, eeplen
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct_from_jdict(cls, jdict):
+        if not jdict:
+            return None
+
+        vendor_info = HATVendorInfo(jdict.get('product-id'), jdict.get('product-ver'), jdict.get('vendor'),
+                                    jdict.get('product'))
+
+        gpio_map = HATGPIOMap.construct_from_jdict(jdict.get('gpio-map'))
+
+        return HATImage(vendor_info, gpio_map, dt_blob=jdict.get('dt-blob'), custom=jdict.get('custom'),
+                        serial_width=jdict.get('serial-width', cls.DEFAULT_SERIAL_WIDTH))
+
+
+    @classmethod
+    def pack_header(cls, numatoms, eeplen):
+        return struct.pack(cls.__HEADER_FORMAT, cls.SIGNATURE, cls.VERSION, 0, numatoms, eeplen)
+
+
+    @classmethod
+    def unpack_header(cls, content):
+        """
+        returns signature, version, numatoms, eeplen
+        """
+        signature, version, _, numatoms, eeplen = struct.unpack_from(cls.__HEADER_FORMAT, content)
+
+        return signature, version, numatoms, eeplen
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, vendor_info, gpio_map, dt_blob=None, custom=None, serial_width=DEFAULT_SERIAL_WIDTH):
+        """
+        Constructor
+        """
+        self.__vendor_info = vendor_info                    # HATVendorInfo
+        self.__gpio_map = gpio_map                          # HATGPIOMap
+        self.__dt_blob = dt_blob                            # string filename, or None
+        self.__custom = [] if custom is None else custom    # list of string
+        self.__serial_width = int(serial_width)             # int bytes
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def template(self):
+        """
+        lays out the image, reading the device tree blob file if there is one
+        returns HATImageTemplate
+        """
+        atoms = [HATAtom(HATAtom.TYPE_VENDOR_INFO, self.vendor_info.as_data()),
+                 HATAtom(HATAtom.TYPE_GPIO_MAP, self.gpio_map.as_data())]
+
+        if self.dt_blob is not None:
+            with open(self.dt_blob, 'rb') as f:
+                atoms.append(HATAtom(HATAtom.TYPE_DT_BLOB, f.read()))
+
+        for custom in self.custom:
+            atoms.append(HATAtom(HATAtom.TYPE_CUSTOM, custom.encode('utf-8')))
+
+        atoms.append(HATAtom(HATAtom.TYPE_CUSTOM, bytes(self.serial_width)))
+
+        # layout...
+        eeplen = self.HEADER_SIZE + sum(len(atom) for atom in atoms)
+        content = bytearray(self.pack_header(len(atoms), eeplen))
+
+        for count, atom in enumerate(atoms):
+            content += atom.as_bytes(count)
+
+        vendor_info_offset = self.HEADER_SIZE
+        serial_offset = eeplen - len(atoms[-1])
+
+        return HATImageTemplate(content, vendor_info_offset, len(atoms[0]), serial_offset, len(atoms[-1]))
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self):
+        jdict = OrderedDict()
+
+        jdict['vendor'] = self.vendor_info.vendor
+        jdict['product'] = self.vendor_info.product
+        jdict['product-id'] = self.vendor_info.product_id
+        jdict['product-ver'] = self.vendor_info.product_ver
+
+        jdict['gpio-map'] = self.gpio_map
+        jdict['dt-blob'] = self.dt_blob
+        jdict['custom'] = self.custom
+
+        jdict['serial-width'] = self.serial_width
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def vendor_info(self):
+        return self.__vendor_info
+
+
+    @property
+    def gpio_map(self):
+        return self.__gpio_map
+
+
+    @property
+    def dt_blob(self):
+        return self.__dt_blob
+
+
+    @property
+    def custom(self):
+        return self.__custom
+
+
+    @property
+    def serial_width(self):
+        return self.__serial_width
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "HATImage:{vendor_info:%s, gpio_map:%s, dt_blob:%s, custom:%s, serial_width:%s}" % \
+               (self.vendor_info, self.gpio_map, self.dt_blob, self.custom, self.serial_width)
@@ -0,0 +1,241 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+The decoded content of a Raspberry Pi HAT EEPROM image: the header, and each atom with its CRC check. Vendor info and
+GPIO map atoms are decoded in full, custom data atoms as text where they are printable, and device tree blob atoms by
+size only.
+
+An image may be read with read(..), which fetches only eeplen bytes rather than the whole device. The vendor info
+alone may be read with read_vendor_info(..): the header and the first atom are fetched with one sequential burst,
+which is extended by a second read only if the vendor and product strings do not fit. The atom's CRC is checked.
+
+example JSON:
+{"signature": "0x69502d52", "version": 1, "numatoms": 5, "eeplen": 175, "atoms": [{"type": "vendor-info", "count": 0,
+"dlen": 60, "crc-ok": true, "data": {"uuid": "8a6ff630-47c8-4592-809f-77145cf31d7d", "product-id": 1,
+"product-ver": 2, "vendor": "South Coast Science", "product": "Digital Front End"}}, ...]}
+"""
+
+import string
+
+from collections import OrderedDict
+
+from scs_core.data.json import JSONable
+
+from scs_mfr.eeprom.hat_atom import HATAtom
+from scs_mfr.eeprom.hat_gpio_map import HATGPIOMap
+from scs_mfr.eeprom.hat_image import HATImage
+from scs_mfr.eeprom.hat_vendor_info import HATVendorInfo
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class HATImageContent(JSONable):
+    """
+    classdocs
+    """
+
+    IDENTITY_BURST =    96                  # bytes - header and a typical vendor info atom
+
+    __TYPE_NAMES = {
+        HATAtom.TYPE_VENDOR_INFO:   'vendor-info',
+        HATAtom.TYPE_GPIO_MAP:      'gpio-map',
+        HATAtom.TYPE_DT_BLOB:       'dt-blob',
+        HATAtom.TYPE_CUSTOM:        'custom'
+    }
+
+    __PRINTABLE = set(string.printable.encode('ascii'))
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct_from_content(cls, content):
+        """
+        content: bytes-like image, at least eeplen bytes long
+        """
+        content = bytes(content)
+
+        version, numatoms, eeplen = cls.__header(content)
+
+        if eeplen > len(content):
+            raise ValueError("eeplen %d exceeds content of %d bytes" % (eeplen, len(content)))
+
+        atoms = []
+        offset = HATImage.HEADER_SIZE
+
+        for _ in range(numatoms):
+            if offset + HATAtom.HEADER_SIZE > eeplen:
+                raise ValueError("atom at 0x%04x exceeds eeplen" % offset)
+
+            atom_type, count, dlen = HATAtom.unpack_header(content, offset)
+            end = offset + HATAtom.HEADER_SIZE + dlen
+
+            if dlen < HATAtom.CRC_SIZE or end > eeplen:
+                raise ValueError("atom at 0x%04x has invalid dlen %d" % (offset, dlen))
+
+            data = content[offset + HATAtom.HEADER_SIZE:end - HATAtom.CRC_SIZE]
+            crc_ok = HATAtom.pack_crc(HATAtom.crc16(content[offset:end - HATAtom.CRC_SIZE])) == \
+                content[end - HATAtom.CRC_SIZE:end]
+
+            atoms.append((atom_type, count, dlen, crc_ok, data))
+            offset = end
+
+        return HATImageContent(version, numatoms, eeplen, atoms)
+
+
+    @classmethod
+    def read(cls, device, burst=IDENTITY_BURST):
+        """
+        reads the image up to eeplen only - with one sequential read if it fits in the burst, otherwise two
+        device: provides read(memory_addr, count), as CAT24C32Pages does
+        """
+        content = device.read(0, burst)
+
+        _, _, eeplen = cls.__header(content)
+
+        if eeplen > len(content):
+            content += device.read(len(content), eeplen - len(content))
+
+        return cls.construct_from_content(content)
+
+
+    @classmethod
+    def read_vendor_info(cls, device, burst=IDENTITY_BURST):
+        """
+        device: provides read(memory_addr, count), as CAT24C32Pages does
+        returns HATVendorInfo
+        """
+        content = device.read(0, burst)
+
+        cls.__header(content)
+
+        atom_type, _, dlen = HATAtom.unpack_header(content, HATImage.HEADER_SIZE)
+
+        if atom_type != HATAtom.TYPE_VENDOR_INFO:
+            raise ValueError("first atom is of type 0x%04x" % atom_type)
+
+        start = HATImage.HEADER_SIZE + HATAtom.HEADER_SIZE
+        end = start + dlen
+
+        if end > len(content):
+            content += device.read(len(content), end - len(content))
+
+        crc_start = end - HATAtom.CRC_SIZE
+
+        if HATAtom.pack_crc(HATAtom.crc16(content[HATImage.HEADER_SIZE:crc_start])) != content[crc_start:end]:
+            raise ValueError("vendor info atom CRC mismatch")
+
+        return HATVendorInfo.construct_from_data(content[start:crc_start])
+
+
+    @classmethod
+    def __header(cls, content):
+        if len(content) < HATImage.HEADER_SIZE + HATAtom.HEADER_SIZE:
+            raise ValueError("content of %d bytes" % len(content))
+
+        signature, version, numatoms, eeplen = HATImage.unpack_header(content)
+
+        if signature != HATImage.SIGNATURE:
+            raise ValueError("no HAT signature: 0x%08x" % signature)
+
+        return version, numatoms, eeplen
+
+
+    @classmethod
+    def __decode(cls, atom_type, data):
+        try:
+            if atom_type == HATAtom.TYPE_VENDOR_INFO:
+                return HATVendorInfo.construct_from_data(data)
+
+            if atom_type == HATAtom.TYPE_GPIO_MAP:
+                return HATGPIOMap.construct_from_data(data)
+
+        except ValueError:
+            return data.hex()
+
+        if atom_type == HATAtom.TYPE_CUSTOM:
+            text = data.rstrip(b'\0')
+
+            if all(byte in cls.__PRINTABLE for byte in text):
+                return text.decode('ascii')
+
+            return data.hex()
+
+        return OrderedDict([('size', len(data))])
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, version, numatoms, eeplen, atoms):
+        """
+        Constructor
+        """
+        self.__version = version                    # int
+        self.__numatoms = numatoms                  # int
+        self.__eeplen = eeplen                      # int bytes
+        self.__atoms = atoms                        # list of (type, count, dlen, crc_ok, data)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self):
+        jdict = OrderedDict()
+
+        jdict['signature'] = "0x%08x" % HATImage.SIGNATURE
+        jdict['version'] = self.version
+        jdict['numatoms'] = self.numatoms
+        jdict['eeplen'] = self.eeplen
+
+        jdict['atoms'] = []
+
+        for atom_type, count, dlen, crc_ok, data in self.__atoms:
+            atom = OrderedDict()
+
+            atom['type'] = self.__TYPE_NAMES.get(atom_type, "0x%04x" % atom_type)
+            atom['count'] = count
+            atom['dlen'] = dlen
+            atom['crc-ok'] = crc_ok
+            atom['data'] = self.__decode(atom_type, data)
+
+            jdict['atoms'].append(atom)
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def version(self):
+        return self.__version
+
+
+    @property
+    def numatoms(self):
+        return self.__numatoms
+
+
+    @property
+    def eeplen(self):
+        return self.__eeplen
+
+
+    @property
+    def crc_ok(self):
+        return all(atom[3] for atom in self.__atoms)
+
+
+    @property
+    def vendor_info(self):
+        for atom_type, _, _, _, data in self.__atoms:
+            if atom_type == HATAtom.TYPE_VENDOR_INFO:
+                return HATVendorInfo.construct_from_data(data)
+
+        return None
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "HATImageContent:{version:%s, numatoms:%s, eeplen:%s, crc_ok:%s}" % \
+               (self.version, self.numatoms, self.eeplen, self.crc_ok)
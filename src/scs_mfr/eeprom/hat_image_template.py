@@ -0,0 +1,90 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A laid-out Raspberry Pi HAT EEPROM image, from which an image for each board is stamped in memory. Only the UUID in the
+vendor info atom and the serial number atom are written, and only the CRCs of those two atoms are recomputed - the
+image is not laid out or parsed again.
+
+The CRC of each stamped atom's header is computed once, when the template is constructed.
+"""
+
+import uuid
+
+from scs_mfr.eeprom.hat_atom import HATAtom
+from scs_mfr.eeprom.hat_vendor_info import HATVendorInfo
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class HATImageTemplate(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, content, vendor_info_offset, vendor_info_size, serial_offset, serial_size):
+        """
+        Constructor
+        """
+        self.__content = bytes(content)
+
+        self.__uuid_start = vendor_info_offset + HATAtom.HEADER_SIZE
+        self.__vendor_info_crc_start = vendor_info_offset + vendor_info_size - HATAtom.CRC_SIZE
+        self.__vendor_info_header_crc = HATAtom.crc16(self.__content[vendor_info_offset:self.__uuid_start])
+
+        self.__serial_start = serial_offset + HATAtom.HEADER_SIZE
+        self.__serial_crc_start = serial_offset + serial_size - HATAtom.CRC_SIZE
+        self.__serial_header_crc = HATAtom.crc16(self.__content[serial_offset:self.__serial_start])
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def stamp(self, serial_number, product_uuid=None):
+        """
+        serial_number: string, product_uuid: UUID, or None for a new random UUID
+        returns bytes
+        """
+        if product_uuid is None:
+            product_uuid = uuid.uuid4()
+
+        serial = serial_number.encode('ascii')
+
+        if len(serial) > self.serial_width:
+            raise ValueError("serial number %s exceeds %d bytes" % (serial_number, self.serial_width))
+
+        image = bytearray(self.__content)
+
+        # vendor info...
+        uuid_end = self.__uuid_start + HATVendorInfo.UUID_SIZE
+        image[self.__uuid_start:uuid_end] = product_uuid.bytes[::-1]
+
+        crc = HATAtom.crc16(image[self.__uuid_start:self.__vendor_info_crc_start], self.__vendor_info_header_crc)
+        image[self.__vendor_info_crc_start:self.__vendor_info_crc_start + HATAtom.CRC_SIZE] = HATAtom.pack_crc(crc)
+
+        # serial...
+        image[self.__serial_start:self.__serial_crc_start] = serial.ljust(self.serial_width, b'\0')
+
+        crc = HATAtom.crc16(image[self.__serial_start:self.__serial_crc_start], self.__serial_header_crc)
+        image[self.__serial_crc_start:self.__serial_crc_start + HATAtom.CRC_SIZE] = HATAtom.pack_crc(crc)
+
+        return bytes(image)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def serial_width(self):
+        return self.__serial_crc_start - self.__serial_start
+
+
+    def __len__(self):
+        return len(self.__content)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "HATImageTemplate:{size:%s, serial_width:%s}" % (len(self), self.serial_width)
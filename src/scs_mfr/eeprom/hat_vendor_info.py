@@ -0,0 +1,141 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+The data of a Raspberry Pi HAT vendor info atom: the product UUID, product ID, product version, and the vendor and
+product strings.
+
+As written by eepmake, the 16 bytes of the UUID are stored in reverse order.
+
+example JSON:
+{"uuid": "b8e9b1a5-4c1e-4d0c-9a3e-7f0f2d1b6c55", "product-id": 1, "product-ver": 2, "vendor": "South Coast Science",
+"product": "Digital Front End"}
+"""
+
+import struct
+import uuid
+
+from collections import OrderedDict
+
+from scs_core.data.json import JSONable
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class HATVendorInfo(JSONable):
+    """
+    classdocs
+    """
+
+    UUID_SIZE =         16
+
+    __FORMAT =          '<HHBB'             # pid, pver, vslen, pslen - following the UUID
+    __FIXED_SIZE =      UUID_SIZE + 6
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct_from_jdict(cls, jdict):
+        if not jdict:
+            return None
+
+        product_uuid = None if jdict.get('uuid') is None else uuid.UUID(jdict.get('uuid'))
+
+        return HATVendorInfo(jdict.get('product-id'), jdict.get('product-ver'), jdict.get('vendor'),
+                             jdict.get('product'), product_uuid=product_uuid)
+
+
+    @classmethod
+    def construct_from_data(cls, data):
+        if len(data) < cls.__FIXED_SIZE:
+            raise ValueError("vendor info atom of %d bytes" % len(data))
+
+        product_uuid = uuid.UUID(bytes=bytes(data[cls.UUID_SIZE - 1::-1]))
+        product_id, product_ver, vslen, pslen = struct.unpack_from(cls.__FORMAT, data, cls.UUID_SIZE)
+
+        vendor_start = cls.__FIXED_SIZE
+        product_start = vendor_start + vslen
+
+        vendor = bytes(data[vendor_start:product_start]).decode('ascii', errors='replace')
+        product = bytes(data[product_start:product_start + pslen]).decode('ascii', errors='replace')
+
+        return HATVendorInfo(product_id, product_ver, vendor, product, product_uuid=product_uuid)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, product_id, product_ver, vendor, product, product_uuid=None):
+        """
+        Constructor
+        """
+        self.__product_id = int(product_id)                 # int 16 bit
+        self.__product_ver = int(product_ver)               # int 16 bit
+        self.__vendor = vendor                              # string
+        self.__product = product                            # string
+
+        self.__product_uuid = product_uuid                  # UUID, or None until stamped
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_data(self):
+        """
+        returns bytes - the UUID is zero if not set
+        """
+        vendor = self.vendor.encode('ascii')
+        product = self.product.encode('ascii')
+
+        if len(vendor) > 255 or len(product) > 255:
+            raise ValueError("vendor and product strings may not exceed 255 bytes")
+
+        uuid_bytes = bytes(self.UUID_SIZE) if self.product_uuid is None else self.product_uuid.bytes[::-1]
+
+        return uuid_bytes + struct.pack(self.__FORMAT, self.product_id, self.product_ver, len(vendor),
+                                        len(product)) + vendor + product
+
+
+    def as_json(self):
+        jdict = OrderedDict()
+
+        jdict['uuid'] = None if self.product_uuid is None else str(self.product_uuid)
+        jdict['product-id'] = self.product_id
+        jdict['product-ver'] = self.product_ver
+        jdict['vendor'] = self.vendor
+        jdict['product'] = self.product
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def product_uuid(self):
+        return self.__product_uuid
+
+
+    @property
+    def product_id(self):
+        return self.__product_id
+
+
+    @property
+    def product_ver(self):
+        return self.__product_ver
+
+
+    @property
+    def vendor(self):
+        return self.__vendor
+
+
+    @property
+    def product(self):
+        return self.__product
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "HATVendorInfo:{product_uuid:%s, product_id:%s, product_ver:%s, vendor:%s, product:%s}" % \
+               (self.product_uuid, self.product_id, self.product_ver, self.vendor, self.product)
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+DESCRIPTION
+The eeprom_build utility builds Raspberry Pi HAT EEPROM images for South Coast Science digital front-end (DFE) boards,
+one for each of the given serial numbers, or for each line of stdin if none are given.
+
+The HAT specification - vendor and product strings, product ID and version, GPIO map, device tree blob file and any
+custom data - is read from the JSON CONF_FILE, and laid out once. The image for each board is then stamped in memory
+with a new random UUID and the board's serial number, which is held in a final custom data atom of fixed width. Only
+the CRCs of the two stamped atoms are recomputed, so that thousands of images may be built each second.
+
+Each image is written to DIR/SERIAL_NUMBER.eep, in the form accepted by eeprom_write, and a JSON document giving the
+serial number, UUID and filename is written to stdout.
+
+SYNOPSIS
+eeprom_build.py -c CONF_FILE [-d DIR] [-v] [SERIAL_NUMBER ...]
+
+EXAMPLES
+./eeprom_build.py -c ~/SCS/hat_conf.json -d ~/SCS/eep 30-000123 30-000124
+./eeprom_build.py -c ~/SCS/hat_conf.json -d ~/SCS/eep < serials.txt
+
+FILES
+CONF_FILE, for example:
+{"vendor": "South Coast Science", "product": "Digital Front End", "product-id": 1, "product-ver": 2,
+"gpio-map": {"bank-drive": 0, "power": 0, "pins": null}, "dt-blob": "/home/pi/SCS/dfe.dtbo", "custom": [],
+"serial-width": 16}
+
+DOCUMENT EXAMPLE - OUTPUT
+{"serial": "30-000123", "uuid": "b8e9b1a5-4c1e-4d0c-9a3e-7f0f2d1b6c55", "file": "/home/pi/SCS/eep/30-000123.eep"}
+
+SEE ALSO
+scs_mfr/eeprom_read
+scs_mfr/eeprom_write
+
+BUGS
+Builds Raspberry Pi HAT images only - BeagleBone cape images are not supported.
+
+RESOURCES
+https://github.com/raspberrypi/hats/blob/master/eeprom-format.md
+https://github.com/raspberrypi/hats/tree/master/eepromutils
+"""
+
+import json
+import os
+import sys
+import time
+import uuid
+
+from collections import OrderedDict
+
+from scs_core.data.json import JSONify
+
+from scs_mfr.cmd.cmd_eeprom_build import CmdEEPROMBuild
+
+from scs_mfr.eeprom.cat24c32_pages import CAT24C32Pages
+from scs_mfr.eeprom.hat_image import HATImage
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # cmd...
+
+    cmd = CmdEEPROMBuild()
+
+    if not cmd.is_valid():
+        cmd.print_help(sys.stderr)
+        exit(2)
+
+    if cmd.verbose:
+        print(cmd, file=sys.stderr)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # resources...
+
+    try:
+        with open(cmd.conf_filename) as f:
+            spec = HATImage.construct_from_jdict(json.load(f, object_pairs_hook=OrderedDict))
+
+        template = spec.template()
+
+    except (OSError, ValueError, TypeError) as ex:
+        print("eeprom_build: %s" % ex, file=sys.stderr)
+        exit(1)
+
+    if len(template) > CAT24C32Pages.SIZE:
+        print("eeprom_build: image of %d bytes exceeds EEPROM" % len(template), file=sys.stderr)
+        exit(1)
+
+    if cmd.verbose:
+        print(spec, file=sys.stderr)
+        print(template, file=sys.stderr)
+        sys.stderr.flush()
+
+    os.makedirs(cmd.dir, exist_ok=True)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # run...
+
+    serial_numbers = cmd.serial_numbers if cmd.serial_numbers else (line.strip() for line in sys.stdin)
+
+    start = time.monotonic()
+    built = 0
+
+    try:
+        for serial_number in serial_numbers:
+            if not serial_number:
+                continue
+
+            product_uuid = uuid.uuid4()
+            image = template.stamp(serial_number, product_uuid)
+
+            filename = os.path.join(cmd.dir, serial_number + ".eep")
+
+            with open(filename, 'wb') as f:
+                f.write(image)
+
+            built += 1
+
+            jdict = OrderedDict()
+
+            jdict['serial'] = serial_number
+            jdict['uuid'] = str(product_uuid)
+            jdict['file'] = os.path.abspath(filename)
+
+            print(JSONify.dumps(jdict))
+            sys.stdout.flush()
+
+    except ValueError as ex:
+        print("eeprom_build: %s" % ex, file=sys.stderr)
+        exit(1)
+
+    except KeyboardInterrupt:
+        pass
+
+    if cmd.verbose:
+        elapsed = time.monotonic() - start
+        print("eeprom_build: %d images in %0.3fs" % (built, elapsed), file=sys.stderr)
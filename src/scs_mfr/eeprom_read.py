@@ -12,18 +12,36 @@ contents to stdout.
 The EEPROM contains information on vendor, product ID and a universally unique ID (UUID) code, as specified by either
 the Raspberry Pi HAT or BeagleBone cape standards.
 
+By default, the whole EEPROM is presented as hex. Alternatively, the whole EEPROM may be written to stdout as binary,
+with a single sequential read, or a Raspberry Pi HAT image may be decoded and written to stdout as a JSON document -
+only the bytes up to the image's eeplen are read.
+
+In identity mode, only the HAT header and vendor info atom are read, usually with a single sequential burst of 96
+bytes, and the UUID, product ID, product version, vendor and product are written to stdout as a JSON document. This
+is intended for fleet audits of many boards.
+
+The JSON and identity modes are not available for BeagleBone cape images.
+
 SYNOPSIS
-eeprom_read.py
+eeprom_read.py [{ -b | -j | -i }] [-v]
 
 EXAMPLES
 ./eeprom_read.py
+./eeprom_read.py -b > ~/SCS/dump.eep
+./eeprom_read.py -i
+
+DOCUMENT EXAMPLE - IDENTITY
+{"uuid": "8a6ff630-47c8-4592-809f-77145cf31d7d", "product-id": 1, "product-ver": 2, "vendor": "South Coast Science",
+"product": "Digital Front End"}
 
 SEE ALSO
 scs_mfr/dfe_id
+scs_mfr/eeprom_build
 scs_mfr/eeprom_write
 
 RESOURCES
 https://github.com/raspberrypi/hats
+https://github.com/raspberrypi/hats/blob/master/eeprom-format.md
 https://github.com/picoflamingo/BBCape_EEPROM
 
 
@@ -36,11 +54,20 @@ http://papermint-designs.com/community/node/331
 https://learn.adafruit.com/introduction-to-the-beaglebone-black-device-tree/compiling-an-overlay
 """
 
+import sys
+
+from scs_core.data.json import JSONify
+
 from scs_dfe.board.cat24c32 import CAT24C32
 
 from scs_host.bus.i2c import I2C
 from scs_host.sys.host import Host
 
+from scs_mfr.cmd.cmd_eeprom_read import CmdEEPROMRead
+
+from scs_mfr.eeprom.cat24c32_pages import CAT24C32Pages
+from scs_mfr.eeprom.hat_image_content import HATImageContent
+
 
 # --------------------------------------------------------------------------------------------------------------------
 
@@ -51,20 +78,49 @@ Host.enable_eeprom_access()
 
 if __name__ == '__main__':
 
+    # ----------------------------------------------------------------------------------------------------------------
+    # cmd...
+
+    cmd = CmdEEPROMRead()
+
+    if not cmd.is_valid():
+        cmd.print_help(sys.stderr)
+        exit(2)
+
+    if cmd.verbose:
+        print(cmd, file=sys.stderr)
+        sys.stderr.flush()
+
     try:
         I2C.open(Host.I2C_EEPROM)
 
 
         # ------------------------------------------------------------------------------------------------------------
-        # resources...
+        # run...
 
-        eeprom = CAT24C32()
+        try:
+            if cmd.binary:
+                sys.stdout.buffer.write(CAT24C32Pages().read(0, CAT24C32Pages.SIZE))
+                sys.stdout.flush()
 
+            elif cmd.json:
+                content = HATImageContent.read(CAT24C32Pages())
 
-        # ------------------------------------------------------------------------------------------------------------
-        # run...
+                if cmd.verbose:
+                    print(content, file=sys.stderr)
+
+                print(JSONify.dumps(content))
+
+            elif cmd.identity:
+                print(JSONify.dumps(HATImageContent.read_vendor_info(CAT24C32Pages())))
+
+            else:
+                eeprom = CAT24C32()
+                eeprom.image.formatted(32)
 
-        eeprom.image.formatted(32)
+        except ValueError as ex:
+            print("eeprom_read: %s" % ex, file=sys.stderr)
+            exit(1)
 
 
     # ----------------------------------------------------------------------------------------------------------------
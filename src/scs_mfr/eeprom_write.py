@@ -14,11 +14,30 @@ the Raspberry Pi HAT or BeagleBone cape standards.
 
 A jumper link must be fitted to the DFE board in order to enable the write operation.
 
+In differential mode, the EEPROM is read once, only the 32-byte pages that differ from the file are written - each
+with a single page-write burst - and only those pages are read back and verified, by CRC-32. Reprogramming an EEPROM
+that already holds the file therefore takes no write cycles. The outcome is written to stdout as a JSON document.
+
+In gang mode, the file is programmed differentially to several EEPROMs concurrently, one worker for each TARGET. A
+TARGET is an I2C bus, or a channel of the I2C multiplexer on a bus, given as BUS or BUS:CHANNEL. Only one bus may be
+multiplexed, and every TARGET on that bus must then give a channel. Transfers share the host I2C handle, which is
+kept open between transfers on the same bus, but each EEPROM's write cycles overlap the transfers to the others.
+A JSON document is written to stdout for each EEPROM as it completes, and the exit status is 1 unless all verified.
+
 SYNOPSIS
-eeprom_write.py [-v] FILENAME
+eeprom_write.py [-d] [-v] FILENAME
+eeprom_write.py -g [-m MUX_ADDR] [-v] FILENAME TARGET [... TARGET]
 
 EXAMPLES
 ./eeprom_write.py ~/SCS/hat.eep
+./eeprom_write.py -d ~/SCS/hat.eep
+./eeprom_write.py -g -m 0x70 ~/SCS/hat.eep 1:0 1:1 1:2 1:3
+
+DOCUMENT EXAMPLE - DIFFERENTIAL OUTPUT
+{"pages": 128, "written": 3, "crc": "0x5f1c0a92", "verified": true}
+
+DOCUMENT EXAMPLE - GANG OUTPUT
+{"bus": 1, "channel": 2, "pages": 128, "written": 6, "crc": "0x5f1c0a92", "verified": true, "time": 0.061}
 
 SEE ALSO
 scs_mfr/dfe_id
@@ -45,6 +64,7 @@ from os import path
 
 import sys
 
+from scs_core.data.json import JSONify
 from scs_core.sys.eeprom_image import EEPROMImage
 
 from scs_dfe.board.cat24c32 import CAT24C32
@@ -54,6 +74,14 @@ from scs_host.sys.host import Host
 
 from scs_mfr.cmd.cmd_eeprom_write import CmdEEPROMWrite
 
+from scs_mfr.eeprom.cat24c32_pages import CAT24C32Pages
+from scs_mfr.eeprom.eeprom_gang_programmer import EEPROMGangProgrammer
+from scs_mfr.eeprom.eeprom_programmer import EEPROMProgrammer
+from scs_mfr.eeprom.gang_cat24c32 import GangCAT24C32
+
+from scs_mfr.test.bus_lock import BusLock
+from scs_mfr.test.tca9548a import TCA9548A
+
 
 # --------------------------------------------------------------------------------------------------------------------
 
@@ -64,34 +92,85 @@ Host.enable_eeprom_access()
 
 if __name__ == '__main__':
 
-    try:
-        I2C.open(Host.I2C_EEPROM)
+    # ----------------------------------------------------------------------------------------------------------------
+    # cmd...
 
+    cmd = CmdEEPROMWrite()
 
-        # ------------------------------------------------------------------------------------------------------------
-        # cmd...
+    if cmd.verbose:
+        print(cmd, file=sys.stderr)
+        print("-")
 
-        cmd = CmdEEPROMWrite()
+    if not cmd.is_valid():
+        cmd.print_help(sys.stderr)
+        exit(2)
+
+    if not path.isfile(cmd.filename):
+        print("eeprom_write: file not found", file=sys.stderr)
+        exit(1)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # gang run...
+
+    if cmd.gang:
+        file_image = EEPROMImage.construct_from_file(cmd.filename, CAT24C32Pages.SIZE)
+        targets = cmd.targets
+
+        mux_buses = set(target.bus for target in targets if target.channel is not None)
+
+        if mux_buses:
+            BusLock.use_mux(TCA9548A(cmd.mux_addr), mux_buses.pop())
+
+        programmer = EEPROMGangProgrammer([GangCAT24C32(target) for target in targets])
 
         if cmd.verbose:
-            print(cmd, file=sys.stderr)
-            print("-")
+            print(programmer, file=sys.stderr)
+            sys.stderr.flush()
+
+        verified = True
+
+        for result in programmer.program(file_image.content):
+            print(JSONify.dumps(result))
+            sys.stdout.flush()
+
+            if not result.verified:
+                verified = False
+
+        if not verified:
+            print("eeprom_write: verification failed", file=sys.stderr)
+
+        exit(0 if verified else 1)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # single run...
+
+    try:
+        I2C.open(Host.I2C_EEPROM)
 
 
         # ------------------------------------------------------------------------------------------------------------
-        # resources...
+        # differential run...
 
-        eeprom = CAT24C32()
+        if cmd.differential:
+            file_image = EEPROMImage.construct_from_file(cmd.filename, CAT24C32Pages.SIZE)
 
-        if not cmd.is_valid():
-            cmd.print_help(sys.stderr)
-            I2C.close()
-            exit(2)
+            programmer = EEPROMProgrammer(CAT24C32Pages(), CAT24C32Pages.SIZE, CAT24C32Pages.PAGE_SIZE)
+            programming = programmer.program(file_image.content)
+
+            print(JSONify.dumps(programming))
+            sys.stdout.flush()
+
+            if not programming.verified:
+                print("eeprom_write: verification failed", file=sys.stderr)
+                I2C.close()
+                exit(1)
 
-        if not path.isfile(cmd.filename):
-            print("eeprom_write: file not found", file=sys.stderr)
             I2C.close()
-            exit(1)
+            exit(0)
+
+        eeprom = CAT24C32()
 
         if cmd.verbose:
             print("current eeprom image:")
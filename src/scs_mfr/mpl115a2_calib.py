@@ -10,26 +10,37 @@ The mpl115a2_calib utility is used to calibrate the temperature sensor in the MP
 operates by measuring the temperature using a Sensirion SHT sensor, measuring the temperature ADC count of the MPL115A2
 sensor, and back-calculating the offset.
 
+In interleaved mode, the SHT and MPL115A2 are sampled alternately at a fixed cadence, so that each barometer sample is
+bracketed by two SHT samples, and is paired with their mean temperature. c25 is the median of the estimates from the
+pairs, and sampling stops as soon as the median has converged - it has moved by no more than the tolerance over the
+last window of pairs. If it has not converged within the maximum number of pairs, no calibration is saved.
+
 If calibration has been performed, the pressure_sampler utility reports temperature in addition to actual pressure
 ("pA"). If the host device altitude has also been set, the pressure_sampler additionally reports equivalent pressure
 at sea level ("p0").
 
+If a simulation file is given, the simulated SHT and barometer specified by the file are used, and the calibration is
+saved in the SCS directory of the simulated host.
+
 The pressure_sampler sampler processes must be restarted for changes to take effect.
 
 SYNOPSIS
-mpl115a2_calib.py [-s] [-v]
+mpl115a2_calib.py [{ -s | -i [-c CADENCE] [-w WINDOW] [-t TOLERANCE] [-n MAX_SAMPLES] }] [-S SIM_FILE] [-v]
 
 EXAMPLES
 ./mpl115a2_calib.py -s
+./mpl115a2_calib.py -i -c 0.25 -w 20
 
 FILES
 ~/SCS/conf/mpl115a2_calib.json
+~/SCS/calib_history.db
 
 DOCUMENT EXAMPLE
 {"calibrated-on": "2018-06-20T10:25:39.045+00:00", "c25": 511}
 
 SEE ALSO
 scs_dev/pressure_sampler
+scs_mfr/calib_history
 scs_mfr/mpl115a2_conf
 """
 
@@ -37,47 +48,73 @@ import sys
 
 from scs_core.data.json import JSONify
 
-from scs_dfe.climate.mpl115a2 import MPL115A2
 from scs_core.climate.mpl115a2_calib import MPL115A2Calib
+
+from scs_dfe.climate.mpl115a2 import MPL115A2
 from scs_dfe.climate.sht_conf import SHTConf
 
 from scs_host.bus.i2c import I2C
 from scs_host.sys.host import Host
 
+from scs_mfr.calib.calib_history import CalibHistory
+from scs_mfr.calib.mpl115a2_interleaving import MPL115A2Interleaving
+
 from scs_mfr.cmd.cmd_mpl115a2_calib import CmdMPL115A2Calib
 
+from scs_mfr.sim.sim_conf import SimConf
+from scs_mfr.sim.sim_platform import SimPlatform
+
 
 # --------------------------------------------------------------------------------------------------------------------
 
 if __name__ == '__main__':
 
-    try:
-        I2C.open(Host.I2C_SENSORS)
+    # ----------------------------------------------------------------------------------------------------------------
+    # cmd...
+
+    cmd = CmdMPL115A2Calib()
+
+    if not cmd.is_valid():
+        cmd.print_help(sys.stderr)
+        exit(2)
+
+    if cmd.verbose:
+        print("mpl115a2_calib: %s" % cmd, file=sys.stderr)
+        sys.stderr.flush()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # platform...
 
-        # ----------------------------------------------------------------------------------------------------------------
-        # cmd...
+    platform = None
 
-        cmd = CmdMPL115A2Calib()
+    if cmd.sim_filename is not None:
+        try:
+            platform = SimPlatform(SimConf.load_from_file(cmd.sim_filename))
 
-        if cmd.verbose:
-            print("mpl115a2_calib: %s" % cmd, file=sys.stderr)
-            sys.stderr.flush()
+        except (OSError, ValueError) as ex:
+            print("mpl115a2_calib: invalid simulation: %s" % ex, file=sys.stderr)
+            exit(1)
 
+    host = Host if platform is None else platform.host
+    i2c = I2C if platform is None else platform.i2c
+
+    try:
+        i2c.open(host.I2C_SENSORS)
 
         # ------------------------------------------------------------------------------------------------------------
         # resources...
 
         # SHT...
-        sht_conf = SHTConf.load(Host)
-        sht = sht_conf.int_sht()
+        sht = SHTConf.load(host).int_sht() if platform is None else platform.int_sht
 
         # MPL115A2Calib...
-        calib = MPL115A2Calib.load(Host)
+        calib = MPL115A2Calib.load(host)
 
         c25 = MPL115A2Calib.DEFAULT_C25 if calib is None else calib.c25
 
         # MPL115A2...
-        barometer = MPL115A2(c25)
+        barometer = MPL115A2(c25) if platform is None else platform.barometer(c25)
 
 
         # ------------------------------------------------------------------------------------------------------------
@@ -99,24 +136,49 @@ if __name__ == '__main__':
             c25 = datum.c25(sht_datum.temp)
 
             calib = MPL115A2Calib(None, c25)
-            calib.save(Host)
+            calib.save(host)
+
+            CalibHistory.record(host, CalibHistory.MPL115A2_CALIB, MPL115A2Calib.load(host))
+
+        if cmd.interleave:
+            interleaving = MPL115A2Interleaving(sht, barometer, cadence=cmd.cadence, window=cmd.window,
+                                                tolerance=cmd.tolerance, max_samples=cmd.max_samples)
+
+            def report(temp, datum):
+                print("temp:%0.2f, c25:%d, %s" % (temp, datum.c25(temp), datum), file=sys.stderr)
+                sys.stderr.flush()
+
+            converged = interleaving.run(listener=report if cmd.verbose else None)
+
+            if cmd.verbose:
+                print(JSONify.dumps(interleaving), file=sys.stderr)
+
+            if not converged:
+                print("mpl115a2_calib: not converged after %d samples" % interleaving.samples, file=sys.stderr)
+                exit(1)
+
+            calib = MPL115A2Calib(None, interleaving.c25)
+            calib.save(host)
+
+            CalibHistory.record(host, CalibHistory.MPL115A2_CALIB, MPL115A2Calib.load(host))
 
         # calibrated...
-        calib = MPL115A2Calib.load(Host)
+        calib = MPL115A2Calib.load(host)
 
         print(JSONify.dumps(calib))
 
-        if cmd.verbose:
-            barometer = MPL115A2.construct(calib)
-            barometer.init()
-
+        if cmd.verbose and calib is not None:
+            # check - the initialised barometer reports temperature from its original c25, so compare counts...
+            sht_datum = sht.sample()
             datum = barometer.sample()
 
-            print(datum, file=sys.stderr)
+            c25 = datum.c25(sht_datum.temp)
+
+            print("%s, c25:%d, residual:%d" % (datum, c25, c25 - calib.c25), file=sys.stderr)
 
 
     # ----------------------------------------------------------------------------------------------------------------
     # end...
 
     finally:
-        I2C.close()
+        i2c.close()
@@ -26,6 +26,9 @@ location paths are used by the device only when it is installed at a given locat
 The location ID must be an integer.
 
 When the osio_project utility is executed, any topics required are created on the OpenSensors.io infrastructure.
+Topics that already exist are updated only if their name or description differ from those of the schema, so that
+running the utility again makes no further changes. The topics are independent, and are provisioned concurrently,
+each worker with its own HTTP client.
 
 When the "verbose" "-v" flag is used, the osio_project utility reports all of the topic paths derived from
 its specification.
@@ -56,6 +59,10 @@ server error.
 """
 
 import sys
+import threading
+
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
 from scs_core.data.json import JSONify
 
@@ -85,36 +92,83 @@ class HostProject(object):
     classdocs
     """
 
+    CREATED =           'created'
+    UPDATED =           'updated'
+    UNCHANGED =         'unchanged'
+
+    DEFAULT_WORKERS =   5
+
     # ----------------------------------------------------------------------------------------------------------------
 
-    def __init__(self, topic_manager):
+    def __init__(self, topic_manager_factory, workers=DEFAULT_WORKERS):
         """
         Constructor
         """
-        self.__topic_manager = topic_manager
+        self.__topic_manager_factory = topic_manager_factory        # callable returning a new TopicManager
+        self.__workers = workers                                    # int
+
+        self.__local = threading.local()
 
 
     # ----------------------------------------------------------------------------------------------------------------
 
+    def construct_topics(self, topics):
+        """
+        topics: iterable of (path, schema), provisioned concurrently
+        returns OrderedDict of path: CREATED, UPDATED or UNCHANGED, in the order given
+        """
+        topics = list(topics)
+
+        if not topics:
+            return OrderedDict()
+
+        with ThreadPoolExecutor(max_workers=min(self.__workers, len(topics))) as executor:
+            futures = [(path, executor.submit(self.construct_topic, path, schema)) for path, schema in topics]
+
+            return OrderedDict((path, future.result()) for path, future in futures)
+
+
     def construct_topic(self, path, schema):
-        topic = self.__topic_manager.find(path)
+        """
+        returns CREATED, UPDATED or UNCHANGED
+        """
+        topic_manager = self.__topic_manager()
+
+        topic = topic_manager.find(path)
 
         if topic:
+            if topic.name == schema.name and topic.description == schema.description:
+                return self.UNCHANGED
+
             updated = Topic(None, schema.name, schema.description, topic.is_public, topic.info, None, None)
 
-            self.__topic_manager.update(topic.path, updated)
+            topic_manager.update(topic.path, updated)
+
+            return self.UPDATED
+
+        info = TopicInfo(TopicInfo.FORMAT_JSON, None, None, None)     # for the v2 API, schema_id goes in Topic
+        constructed = Topic(path, schema.name, schema.description, True, info, True, schema.schema_id)
+
+        topic_manager.create(constructed)
 
-        else:
-            info = TopicInfo(TopicInfo.FORMAT_JSON, None, None, None)     # for the v2 API, schema_id goes in Topic
-            constructed = Topic(path, schema.name, schema.description, True, info, True, schema.schema_id)
+        return self.CREATED
 
-            self.__topic_manager.create(constructed)
+
+    def __topic_manager(self):
+        # one TopicManager - and its HTTP client - per worker thread...
+        topic_manager = getattr(self.__local, 'topic_manager', None)
+
+        if topic_manager is None:
+            topic_manager = self.__topic_manager_factory()
+            self.__local.topic_manager = topic_manager
+
+        return topic_manager
 
 
     # ----------------------------------------------------------------------------------------------------------------
 
     def __str__(self, *args, **kwargs):
-        return "HostProject:{topic_manager:%s}" % self.__topic_manager
+        return "HostProject:{workers:%s}" % self.__workers
 
 
 # --------------------------------------------------------------------------------------------------------------------
@@ -177,7 +231,7 @@ if __name__ == '__main__':
     # manager...
     manager = TopicManager(HTTPClient(), api_auth.api_key)
 
-    creator = HostProject(manager)
+    creator = HostProject(lambda: TopicManager(HTTPClient(), api_auth.api_key))
 
     # gases schema...
     gases_topic = ProjectTopic.get_gases_topic(afe_calib.gas_names())
@@ -201,14 +255,22 @@ if __name__ == '__main__':
                   (existing_gases_topic.schema_id, gases_topic.schema_id), file=sys.stderr)
 
         # set topics...
-        creator.construct_topic(project.climate_topic_path(), ProjectTopic.CLIMATE)
-        creator.construct_topic(project.gases_topic_path(), gases_topic)
+        topics = [(project.climate_topic_path(), ProjectTopic.CLIMATE),
+                  (project.gases_topic_path(), gases_topic)]
 
         if include_particulates:
-            creator.construct_topic(project.particulates_topic_path(), ProjectTopic.PARTICULATES)
+            topics.append((project.particulates_topic_path(), ProjectTopic.PARTICULATES))
+
+        topics.append((project.status_topic_path(system_id), ProjectTopic.STATUS))
+        topics.append((project.control_topic_path(system_id), ProjectTopic.CONTROL))
+
+        actions = creator.construct_topics(topics)
+
+        if cmd.verbose:
+            for path, action in actions.items():
+                print("osio_project: %s: %s" % (action, path), file=sys.stderr)
 
-        creator.construct_topic(project.status_topic_path(system_id), ProjectTopic.STATUS)
-        creator.construct_topic(project.control_topic_path(system_id), ProjectTopic.CONTROL)
+            sys.stderr.flush()
 
         project.save(Host)
 
@@ -11,24 +11,39 @@ The pt1000_calib utility is used to determine and save the voltage offset for ea
 The utility operates by measuring the temperature using a Sensirion SHT sensor, measuring the voltage output of the
 Pt1000 sensor, and back-calculating the voltage offset.
 
+In settling mode, the SHT and Pt1000 are sampled in lockstep, and the temperature and back-calculated voltage offset
+are held in a sliding window. Sampling stops as soon as the slope and standard deviation of both windows are within
+their limits - the voltage offset is then the mean of its window, and is saved with the number of samples in the
+window and its uncertainty. If the readings have not settled by the timeout, no calibration is saved. A board that is
+still warming up is therefore not calibrated with a bad offset, without the need to wait a fixed warm-up time.
+
 For the utility to operate, the I2C address of the Pt1000 ADC must be set. This is done using the dfe_conf utility.
 
+If a simulation file is given, the simulated SHT and Pt1000 specified by the file are used, and the calibration is
+saved in the SCS directory of the simulated host.
+
 Note that the scs_analysis/gases_sampler process must be restarted for changes to take effect.
 
 SYNOPSIS
-pt1000_calib.py [-s] [-v]
+pt1000_calib.py [{ -s | -c [-w WINDOW] [-i INTERVAL] [-t TIMEOUT] [-T SLOPE STD] [-V SLOPE STD] }] [-S SIM_FILE] [-v]
 
 EXAMPLES
 ./pt1000_calib.py -s
+./pt1000_calib.py -c -w 30 -t 900 -T 0.05 0.05
 
 DOCUMENT EXAMPLE
 {"calibrated-on": "2017-07-19T13:56:48.289+00:00", "v20": 0.002891}
 
+DOCUMENT EXAMPLE - SETTLING MODE
+{"calibrated-on": "2026-10-18T10:21:07.113+00:00", "v20": 0.002891, "n": 20, "uncertainty": 4e-06}
+
 FILES
 ~/SCS/conf/pt1000_calib.json
+~/SCS/calib_history.db
 
 SEE ALSO
 scs_dev/gases_sampler
+scs_mfr/calib_history
 scs_mfr/dfe_conf
 """
 
@@ -44,42 +59,75 @@ from scs_dfe.climate.sht_conf import SHTConf
 from scs_host.bus.i2c import I2C
 from scs_host.sys.host import Host
 
+from scs_mfr.calib.calib_history import CalibHistory
+from scs_mfr.calib.pt1000_settling import Pt1000Settling
+
 from scs_mfr.cmd.cmd_pt1000_calib import CmdPt1000Calib
 
+from scs_mfr.sim.sim_conf import SimConf
+from scs_mfr.sim.sim_platform import SimPlatform
+
 
 # --------------------------------------------------------------------------------------------------------------------
 
 if __name__ == '__main__':
 
-    try:
-        I2C.open(Host.I2C_SENSORS)
+    # ----------------------------------------------------------------------------------------------------------------
+    # cmd...
 
-        # ----------------------------------------------------------------------------------------------------------------
-        # cmd...
+    cmd = CmdPt1000Calib()
 
-        cmd = CmdPt1000Calib()
+    if not cmd.is_valid():
+        cmd.print_help(sys.stderr)
+        exit(2)
 
-        if cmd.verbose:
-            print("pt1000_calib: %s" % cmd, file=sys.stderr)
-            sys.stderr.flush()
+    if cmd.verbose:
+        print("pt1000_calib: %s" % cmd, file=sys.stderr)
+        sys.stderr.flush()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # platform...
+
+    platform = None
+
+    if cmd.sim_filename is not None:
+        try:
+            platform = SimPlatform(SimConf.load_from_file(cmd.sim_filename))
+
+        except (OSError, ValueError) as ex:
+            print("pt1000_calib: invalid simulation: %s" % ex, file=sys.stderr)
+            exit(1)
+
+    host = Host if platform is None else platform.host
+    i2c = I2C if platform is None else platform.i2c
 
+    try:
+        i2c.open(host.I2C_SENSORS)
 
         # ------------------------------------------------------------------------------------------------------------
         # resources...
 
-        # SHT...
-        sht_conf = SHTConf.load(Host)
-        sht = sht_conf.int_sht()
+        if platform is None:
+            # SHT...
+            sht_conf = SHTConf.load(host)
+            sht = sht_conf.int_sht()
 
-        # AFE...
-        dfe_conf = DFEConf.load(Host)
+            # AFE...
+            dfe_conf = DFEConf.load(host)
 
-        # validate...
-        if dfe_conf.pt1000_addr is None:
-            print("pt1000_calib: a Pt1000 ADC has not been configured for this system.", file=sys.stderr)
-            exit(1)
+            # validate...
+            if dfe_conf.pt1000_addr is None:
+                print("pt1000_calib: a Pt1000 ADC has not been configured for this system.", file=sys.stderr)
+                exit(1)
+
+            afe = dfe_conf.afe(host)
+
+        else:
+            dfe_conf = None
 
-        afe = dfe_conf.afe(Host)
+            sht = platform.int_sht
+            afe = platform.afe()
 
 
         # ------------------------------------------------------------------------------------------------------------
@@ -99,15 +147,39 @@ if __name__ == '__main__':
             v20 = pt1000_datum.v20(sht_datum.temp)
 
             pt1000_calib = Pt1000Calib(None, v20)
-            pt1000_calib.save(Host)
+            pt1000_calib.save(host)
+
+            CalibHistory.record(host, CalibHistory.PT1000_CALIB, Pt1000Calib.load(host))
+
+        if cmd.settle:
+            settling = Pt1000Settling(sht, afe, window=cmd.window, interval=cmd.interval, timeout=cmd.timeout,
+                                      temp_limits=cmd.temp_limits, v20_limits=cmd.v20_limits)
+
+            def report(progress):
+                print(JSONify.dumps(progress), file=sys.stderr)
+                sys.stderr.flush()
+
+            settled = settling.run(listener=report if cmd.verbose else None)
+
+            if not settled:
+                print("pt1000_calib: not settled after %d samples: %s" % (settling.samples, JSONify.dumps(settling)),
+                      file=sys.stderr)
+                exit(1)
+
+            pt1000_calib = settling.calib()
+            pt1000_calib.save(host)
+
+            # the settled calib, with its sample count and uncertainty...
+            CalibHistory.record(host, CalibHistory.PT1000_CALIB, pt1000_calib)
 
         # calibrated...
-        pt1000_calib = Pt1000Calib.load(Host)
+        if not cmd.settle:
+            pt1000_calib = Pt1000Calib.load(host)
 
         print(JSONify.dumps(pt1000_calib))
 
         if cmd.verbose:
-            afe = dfe_conf.afe(Host)
+            afe = dfe_conf.afe(host) if platform is None else platform.afe()
             pt1000_datum = afe.sample_pt1000()
 
             print(pt1000_datum, file=sys.stderr)
@@ -117,4 +189,4 @@ if __name__ == '__main__':
     # end...
 
     finally:
-        I2C.close()
+        i2c.close()
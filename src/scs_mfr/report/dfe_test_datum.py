@@ -16,9 +16,31 @@ class DFETestDatum(Sample):
 
     # ----------------------------------------------------------------------------------------------------------------
 
-    def __init__(self, tag, rec, host_serial_number, dfe_serial_number, subjects, afe, result):
+    def __init__(self, tag, rec, host_serial_number, dfe_serial_number, subjects, afe, result, rtc=None,
+                 timing=None, retest_of=None, afe_stats=None, z_scores=None, carried=None):
         """
         Constructor
         """
-        super().__init__(tag, rec, ('host-sn', host_serial_number), ('dfe-sn', dfe_serial_number), ('result', result),
-                         ('subjects', subjects), ('afe', afe))
+        values = [('host-sn', host_serial_number), ('dfe-sn', dfe_serial_number), ('result', result),
+                  ('subjects', subjects), ('afe', afe)]
+
+        # optional blocks...
+        if afe_stats is not None:
+            values.append(('afe-stats', afe_stats))
+
+        if z_scores is not None:
+            values.append(('z-scores', z_scores))
+
+        if rtc is not None:
+            values.append(('rtc', rtc))
+
+        if timing is not None:
+            values.append(('timing', timing))
+
+        if retest_of is not None:
+            values.append(('retest-of', retest_of))
+
+        if carried:
+            values.append(('carried', carried))
+
+        super().__init__(tag, rec, *values)
@@ -0,0 +1,159 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+An event in the course of a DFE test run: the start of a subject's test, or its result. Subjects that are ignored or
+carried over from a previous report have a result, but no start.
+
+In batch mode, each event is labelled with the serial number of its DFE.
+
+The outcome of a result is reported as by DFETestReporter. The datum is reported as JSON where the test datum
+supports it, otherwise as a string.
+
+example JSON:
+{"event": "result", "subject": "Int SHT", "rec": "2026-10-18T10:12:42.501+00:00", "outcome": "OK",
+"timing": {"wall": 0.021, "bus": 0.019, "retries": 0}, "datum": {"hmd": 44.1, "tmp": 22.3}}
+"""
+
+from collections import OrderedDict
+
+from scs_core.data.json import JSONable
+from scs_core.data.localized_datetime import LocalizedDatetime
+
+from scs_mfr.test.test_timeout_error import TestTimeoutError
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class DFETestEvent(JSONable):
+    """
+    classdocs
+    """
+
+    START =     'start'
+    RESULT =    'result'
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct_start(cls, subject):
+        return DFETestEvent(cls.START, subject, LocalizedDatetime.now())
+
+
+    @classmethod
+    def construct_result(cls, subject, outcome, timing=None, datum=None):
+        """
+        outcome: None (ignored), bool (test result), 'OK' (carried) or Exception
+        """
+        return DFETestEvent(cls.RESULT, subject, LocalizedDatetime.now(), outcome=cls.__report(outcome),
+                            timing=timing, datum=datum)
+
+
+    @staticmethod
+    def __report(outcome):
+        if outcome is None:
+            return '-'
+
+        if isinstance(outcome, str):
+            return outcome
+
+        if isinstance(outcome, TestTimeoutError):
+            return 'TIMEOUT'
+
+        if isinstance(outcome, Exception):
+            return outcome.__class__.__name__
+
+        return 'OK' if outcome else 'FAIL'
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, event, subject, rec, outcome=None, timing=None, datum=None):
+        """
+        Constructor
+        """
+        self.__event = event                        # string
+        self.__subject = subject                    # string
+        self.__rec = rec                            # LocalizedDatetime
+
+        self.__outcome = outcome                    # string or None
+        self.__timing = timing                      # SubjectTiming or None
+        self.__datum = datum                        # test datum or None
+
+        self.__dfe_sn = None                        # string or None
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self):
+        jdict = OrderedDict()
+
+        jdict['event'] = self.event
+
+        if self.dfe_sn is not None:
+            jdict['dfe-sn'] = self.dfe_sn
+
+        jdict['subject'] = self.subject
+        jdict['rec'] = self.rec
+
+        if self.event == self.RESULT:
+            jdict['outcome'] = self.outcome
+            jdict['timing'] = self.timing
+
+            if self.datum is None or isinstance(self.datum, (JSONable, str, int, float, bool)):
+                jdict['datum'] = self.datum
+
+            else:
+                jdict['datum'] = str(self.datum)
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def event(self):
+        return self.__event
+
+
+    @property
+    def subject(self):
+        return self.__subject
+
+
+    @property
+    def rec(self):
+        return self.__rec
+
+
+    @property
+    def outcome(self):
+        return self.__outcome
+
+
+    @property
+    def timing(self):
+        return self.__timing
+
+
+    @property
+    def datum(self):
+        return self.__datum
+
+
+    @property
+    def dfe_sn(self):
+        return self.__dfe_sn
+
+
+    @dfe_sn.setter
+    def dfe_sn(self, dfe_sn):
+        self.__dfe_sn = dfe_sn
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "DFETestEvent:{event:%s, dfe_sn:%s, subject:%s, rec:%s, outcome:%s, timing:%s, datum:%s}" % \
+               (self.event, self.dfe_sn, self.subject, self.rec, self.outcome, self.timing, self.datum)
@@ -8,6 +8,8 @@ import sys
 
 from collections import OrderedDict
 
+from scs_mfr.report.dfe_test_timing import DFETestTiming
+
 
 # --------------------------------------------------------------------------------------------------------------------
 
@@ -27,6 +29,9 @@ class DFETestReporter(object):
         self.__passed = True
         self.__subjects = OrderedDict()
 
+        self.__total = None
+        self.__timings = OrderedDict()
+
 
     # ----------------------------------------------------------------------------------------------------------------
 
@@ -47,6 +52,34 @@ class DFETestReporter(object):
             self.__passed = False
 
 
+    def report_timeout(self, subject, error):
+        report = 'TIMEOUT'
+
+        self.__subjects[subject] = report
+
+        if self.__verbose:
+            print("%s after %ss, abandoned: %s" % (report, error.timeout, error.abandoned), file=sys.stderr)
+            print("-", file=sys.stderr)
+
+        self.__passed = False
+
+
+    def report_carried(self, subject):
+        self.__subjects[subject] = 'OK'
+
+        if self.__verbose:
+            print("OK (carried)", file=sys.stderr)
+            print("-", file=sys.stderr)
+
+
+    def report_timing(self, subject, timing):
+        self.__timings[subject] = timing
+
+
+    def report_total(self, total):
+        self.__total = total
+
+
     def report_exception(self, subject, exception):
         # print(exception, file=sys.stderr)
 
@@ -73,6 +106,11 @@ class DFETestReporter(object):
         return self.__subjects
 
 
+    @property
+    def timing(self):
+        return DFETestTiming(self.__total, self.__timings)
+
+
     @property
     def result(self):
         return 'OK' if self.__passed else 'FAIL'
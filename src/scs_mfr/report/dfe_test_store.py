@@ -0,0 +1,371 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+An embedded SQLite store of DFETestDatum reports. Each report is held in full, indexed on dfe-sn, host-sn, rec and
+result, with one indexed row per subject outcome.
+
+Daily counts of results and of subject outcomes, and the total wall time of each subject, are maintained in the same
+transaction as each append, so that the yield, Pareto, throughput and subject statistics queries read only the summary
+tables, however many reports are held. Subjects that a retest carried over from a previous report are held in the
+report document, but are not indexed or counted again. A store written before this was so has its subject counts
+rebuilt from the report documents when it is first opened.
+
+The running statistics of the AFE and Pt1000 readings of passing DFEs - the golden population - are also maintained
+with each append, one row per channel. Readings that a retest carried over from a previous report are not added again.
+"""
+
+import json
+import os
+import sqlite3
+
+from collections import OrderedDict
+
+from scs_core.data.json import JSONify
+
+from scs_mfr.data.running_statistics import RunningStatistics
+
+from scs_mfr.test.golden_population import GoldenPopulation
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class DFETestStore(object):
+    """
+    classdocs
+    """
+
+    PASSED =        'OK'
+    FAILED =        'FAIL'
+    IGNORED =       '-'
+
+    __FILENAME =    "dfe_test.db"
+    __VERSION =     1                   # 1: subjects carried by a retest are not counted
+
+    __SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS reports (id INTEGER PRIMARY KEY, rec TEXT NOT NULL, day TEXT NOT NULL, tag TEXT, "
+        "host_sn TEXT, dfe_sn TEXT NOT NULL, result TEXT NOT NULL, document TEXT NOT NULL)",
+        "CREATE INDEX IF NOT EXISTS reports_dfe_sn ON reports (dfe_sn, rec)",
+        "CREATE INDEX IF NOT EXISTS reports_host_sn ON reports (host_sn, rec)",
+        "CREATE INDEX IF NOT EXISTS reports_rec ON reports (rec)",
+        "CREATE INDEX IF NOT EXISTS reports_result ON reports (result, rec)",
+
+        "CREATE TABLE IF NOT EXISTS subjects (report_id INTEGER NOT NULL REFERENCES reports (id), "
+        "subject TEXT NOT NULL, outcome TEXT NOT NULL, wall REAL, PRIMARY KEY (report_id, subject))",
+        "CREATE INDEX IF NOT EXISTS subjects_outcome ON subjects (subject, outcome)",
+
+        "CREATE TABLE IF NOT EXISTS daily_results (day TEXT NOT NULL, result TEXT NOT NULL, "
+        "count INTEGER NOT NULL, PRIMARY KEY (day, result))",
+
+        "CREATE TABLE IF NOT EXISTS daily_subjects (day TEXT NOT NULL, subject TEXT NOT NULL, outcome TEXT NOT NULL, "
+        "count INTEGER NOT NULL, PRIMARY KEY (day, subject, outcome))",
+
+        "CREATE TABLE IF NOT EXISTS subject_walls (subject TEXT NOT NULL PRIMARY KEY, count INTEGER NOT NULL, "
+        "total REAL NOT NULL)",
+
+        "CREATE TABLE IF NOT EXISTS population (channel TEXT NOT NULL PRIMARY KEY, n INTEGER NOT NULL, "
+        "mean REAL NOT NULL, m2 REAL NOT NULL)"
+    )
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def filename(cls, host):
+        return os.path.join(host.scs_dir(), cls.__FILENAME)
+
+
+    @classmethod
+    def exists(cls, host):
+        return cls.exists_file(cls.filename(host))
+
+
+    @classmethod
+    def exists_file(cls, filename):
+        return os.path.isfile(filename)
+
+
+    @classmethod
+    def open(cls, host):
+        return cls.open_file(cls.filename(host))
+
+
+    @classmethod
+    def open_file(cls, filename):
+        directory = os.path.dirname(filename)
+
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        connection = sqlite3.connect(filename)
+        connection.execute("PRAGMA journal_mode=WAL")
+
+        with connection:
+            for statement in cls.__SCHEMA:
+                connection.execute(statement)
+
+            if connection.execute("PRAGMA user_version").fetchone()[0] < cls.__VERSION:
+                cls.__recount_subjects(connection)
+                connection.execute("PRAGMA user_version = %d" % cls.__VERSION)
+
+        return DFETestStore(connection)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def __measured(cls, val):
+        """
+        yields subject, outcome, wall for each subject that the report measured - not those carried from a previous
+        report
+        """
+        carried = set(val.get('carried') or [])
+        subject_timings = (val.get('timing') or {}).get('subjects') or {}
+
+        for subject, outcome in val['subjects'].items():
+            if subject not in carried:
+                yield subject, outcome, (subject_timings.get(subject) or {}).get('wall')
+
+
+    @classmethod
+    def __index_subject(cls, connection, report_id, day, subject, outcome, wall):
+        connection.execute("INSERT INTO subjects (report_id, subject, outcome, wall) VALUES (?, ?, ?, ?)",
+                           (report_id, subject, outcome, wall))
+
+        cls.__increment(connection, 'daily_subjects', ('day', 'subject', 'outcome'), (day, subject, outcome))
+
+
+    @classmethod
+    def __recount_subjects(cls, connection):
+        # stores written before carried subjects were excluded counted each carried subject as a new pass...
+        connection.execute("DELETE FROM subjects")
+        connection.execute("DELETE FROM daily_subjects")
+
+        for report_id, day, document in connection.execute("SELECT id, day, document FROM reports").fetchall():
+            for subject, outcome, wall in cls.__measured(json.loads(document)['val']):
+                cls.__index_subject(connection, report_id, day, subject, outcome, wall)
+
+
+    @classmethod
+    def __increment(cls, connection, table, keys, values):
+        where = " AND ".join("%s = ?" % key for key in keys)
+
+        cursor = connection.execute("UPDATE %s SET count = count + 1 WHERE %s" % (table, where), values)
+
+        if cursor.rowcount == 0:
+            columns = ", ".join(keys)
+            params = ", ".join("?" for _ in keys)
+
+            connection.execute("INSERT INTO %s (%s, count) VALUES (%s, 1)" % (table, columns, params), values)
+
+
+    @classmethod
+    def __range(cls, start_day, end_day):
+        clauses = []
+        params = []
+
+        if start_day is not None:
+            clauses.append("day >= ?")
+            params.append(start_day)
+
+        if end_day is not None:
+            clauses.append("day <= ?")
+            params.append(end_day)
+
+        where = "" if not clauses else "WHERE " + " AND ".join(clauses)
+
+        return where, params
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, connection):
+        """
+        Constructor
+        """
+        self.__connection = connection
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def append(self, datum):
+        """
+        datum: a DFETestDatum, or its JSON dictionary
+        returns the report ID
+        """
+        jdict = datum if isinstance(datum, dict) else json.loads(JSONify.dumps(datum), object_pairs_hook=OrderedDict)
+
+        val = jdict['val']
+        rec = jdict['rec']
+        day = rec[:10]
+
+        with self.__connection:
+            cursor = self.__connection.execute(
+                "INSERT INTO reports (rec, day, tag, host_sn, dfe_sn, result, document) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (rec, day, jdict.get('tag'), val.get('host-sn'), val['dfe-sn'], val['result'], json.dumps(jdict)))
+
+            report_id = cursor.lastrowid
+
+            for subject, outcome, wall in self.__measured(val):
+                self.__index_subject(self.__connection, report_id, day, subject, outcome, wall)
+
+                if wall is not None:
+                    self.__add_wall(subject, wall)
+
+            self.__increment(self.__connection, 'daily_results', ('day', 'result'), (day, val['result']))
+
+            if val['result'] == self.PASSED:
+                for channel, value in GoldenPopulation.readings(val):
+                    self.__add_reading(channel, value)
+
+        return report_id
+
+
+    def close(self):
+        self.__connection.close()
+
+
+    def __add_wall(self, subject, wall):
+        cursor = self.__connection.execute("UPDATE subject_walls SET count = count + 1, total = total + ? "
+                                           "WHERE subject = ?", (wall, subject))
+
+        if cursor.rowcount == 0:
+            self.__connection.execute("INSERT INTO subject_walls (subject, count, total) VALUES (?, 1, ?)",
+                                      (subject, wall))
+
+
+    def __add_reading(self, channel, value):
+        row = self.__connection.execute("SELECT n, mean, m2 FROM population WHERE channel = ?", (channel, )).fetchone()
+
+        statistics = RunningStatistics() if row is None else RunningStatistics(*row)
+        statistics.append(value)
+
+        self.__connection.execute("INSERT OR REPLACE INTO population (channel, n, mean, m2) VALUES (?, ?, ?, ?)",
+                                  (channel, statistics.n, statistics.mean, statistics.m2))
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def latest(self, dfe_serial_number):
+        """
+        returns the JSON dictionary of the most recent report for the given DFE, or None
+        """
+        row = self.__connection.execute("SELECT document FROM reports WHERE dfe_sn = ? ORDER BY rec DESC, id DESC "
+                                        "LIMIT 1", (dfe_serial_number, )).fetchone()
+
+        return None if row is None else json.loads(row[0], object_pairs_hook=OrderedDict)
+
+
+    def subject_yields(self, start_day=None, end_day=None):
+        where, params = self.__range(start_day, end_day)
+
+        rows = self.__connection.execute(
+            "SELECT subject, SUM(CASE WHEN outcome != ? THEN count ELSE 0 END), "
+            "SUM(CASE WHEN outcome = ? THEN count ELSE 0 END) FROM daily_subjects %s "
+            "GROUP BY subject ORDER BY subject" % where, [self.IGNORED, self.PASSED] + params)
+
+        for subject, tested, passed in rows:
+            yield self.__yield(OrderedDict([('subject', subject)]), tested, passed)
+
+
+    def failure_pareto(self, start_day=None, end_day=None):
+        where, params = self.__range(start_day, end_day)
+        where = ("WHERE " if not where else where + " AND ") + "outcome NOT IN (?, ?)"
+
+        rows = self.__connection.execute(
+            "SELECT subject, outcome, SUM(count) AS failures FROM daily_subjects %s "
+            "GROUP BY subject, outcome ORDER BY failures DESC, subject, outcome" % where,
+            params + [self.PASSED, self.IGNORED]).fetchall()
+
+        total = sum(row[2] for row in rows)
+        cumulative = 0
+
+        for subject, outcome, failures in rows:
+            cumulative += failures
+
+            jdict = OrderedDict()
+
+            jdict['subject'] = subject
+            jdict['outcome'] = outcome
+            jdict['failures'] = failures
+            jdict['cum-pct'] = round(100.0 * cumulative / total, 1)
+
+            yield jdict
+
+
+    def daily_throughput(self, start_day=None, end_day=None):
+        where, params = self.__range(start_day, end_day)
+
+        rows = self.__connection.execute(
+            "SELECT day, SUM(count), SUM(CASE WHEN result = ? THEN count ELSE 0 END) FROM daily_results %s "
+            "GROUP BY day ORDER BY day" % where, [self.PASSED] + params)
+
+        for day, tested, passed in rows:
+            yield self.__yield(OrderedDict([('day', day)]), tested, passed)
+
+
+    def subject_statistics(self):
+        """
+        returns, for each subject ever tested, the numbers of tests and failures, and the mean wall time, or None if
+        no wall time has been recorded - only outcomes that were measured are counted, not those carried by a retest
+        """
+        rows = self.__connection.execute(
+            "SELECT d.subject, SUM(CASE WHEN d.outcome != ? THEN d.count ELSE 0 END), "
+            "SUM(CASE WHEN d.outcome NOT IN (?, ?) THEN d.count ELSE 0 END), w.total / w.count "
+            "FROM daily_subjects d LEFT JOIN subject_walls w ON w.subject = d.subject "
+            "GROUP BY d.subject ORDER BY d.subject", (self.IGNORED, self.PASSED, self.IGNORED))
+
+        for subject, tested, failed, wall in rows:
+            jdict = OrderedDict()
+
+            jdict['subject'] = subject
+            jdict['tested'] = tested
+            jdict['failed'] = failed
+            jdict['wall'] = None if wall is None else round(wall, 3)
+
+            yield jdict
+
+
+    def population(self, min_count=GoldenPopulation.MIN_COUNT):
+        rows = self.__connection.execute("SELECT channel, n, mean, m2 FROM population ORDER BY channel")
+
+        statistics = OrderedDict((channel, RunningStatistics(n, mean, m2)) for channel, n, mean, m2 in rows)
+
+        return GoldenPopulation(statistics, min_count)
+
+
+    def population_statistics(self):
+        """
+        returns, for each channel of the golden population, the number of readings, their mean and standard deviation
+        """
+        population = self.population()
+
+        for channel in population.channels:
+            statistics = population.statistics(channel)
+
+            jdict = OrderedDict()
+
+            jdict['channel'] = channel
+            jdict['n'] = statistics.n
+            jdict['mean'] = round(statistics.mean, 6)
+            jdict['std'] = None if statistics.std is None else round(statistics.std, 6)
+
+            yield jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def __yield(jdict, tested, passed):
+        jdict['tested'] = tested
+        jdict['passed'] = passed
+        jdict['yield'] = None if tested == 0 else round(100.0 * passed / tested, 1)
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "DFETestStore:{connection:%s}" % self.__connection
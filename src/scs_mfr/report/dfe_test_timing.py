@@ -0,0 +1,77 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+The total run time of a DFE test, and the timing of each subject that was conducted, in seconds.
+
+example JSON:
+{"total": 9.412, "subjects": {"RTC": {"wall": 1.024, "bus": 0.012, "retries": 0},
+"GPS": {"wall": 8.913, "bus": 8.861, "retries": 0}}}
+"""
+
+from collections import OrderedDict
+
+from scs_core.data.json import JSONable
+
+from scs_mfr.report.subject_timing import SubjectTiming
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class DFETestTiming(JSONable):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct_from_jdict(cls, jdict):
+        if not jdict:
+            return None
+
+        total = jdict.get('total')
+        subjects = OrderedDict((subject, SubjectTiming.construct_from_jdict(timing_jdict))
+                               for subject, timing_jdict in jdict.get('subjects', {}).items())
+
+        return DFETestTiming(total, subjects)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, total, subjects):
+        """
+        Constructor
+        """
+        self.__total = total                    # float seconds
+        self.__subjects = subjects              # OrderedDict of subject: SubjectTiming
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self):
+        jdict = OrderedDict()
+
+        jdict['total'] = None if self.total is None else round(self.total, 3)
+        jdict['subjects'] = self.subjects
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def total(self):
+        return self.__total
+
+
+    @property
+    def subjects(self):
+        return self.__subjects
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "DFETestTiming:{total:%s, subjects:%s}" % (self.total, self.subjects)
@@ -0,0 +1,58 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Writes DFE test documents - events and reports - as newline-delimited JSON. Documents written by the runners of
+concurrent DFE tests are written whole, one at a time, and are flushed as they are written.
+"""
+
+import sys
+import threading
+
+from scs_core.data.json import JSONify
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class DFETestWriter(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, file=sys.stdout):
+        """
+        Constructor
+        """
+        self.__file = file
+
+        self.__lock = threading.Lock()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def write(self, document):
+        line = JSONify.dumps(document)
+
+        with self.__lock:
+            print(line, file=self.__file)
+            self.__file.flush()
+
+
+    def listener(self, dfe_sn=None):
+        """
+        returns a TestRunner listener, writing each event, labelled with the given DFE serial number if not None
+        """
+        def write_event(event):
+            event.dfe_sn = dfe_sn
+            self.write(event)
+
+        return write_event
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "DFETestWriter:{file:%s}" % self.__file
@@ -0,0 +1,89 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+The period of the first RTC tick after setting, measured against the host monotonic clock, with its drift in parts per
+million and the resolution of the measurement, also in parts per million.
+
+example JSON:
+{"period": 1.000412, "ppm": 412.0, "res": 520.0}
+"""
+
+from collections import OrderedDict
+
+from scs_core.data.json import JSONable
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class RTCDriftDatum(JSONable):
+    """
+    classdocs
+    """
+
+    NOMINAL_PERIOD = 1.0                    # seconds
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct(cls, set_at, earliest, latest):
+        """
+        set_at: monotonic time at which the RTC was set
+        earliest, latest: monotonic times bounding the observed rollover
+        """
+        period = (earliest + latest) / 2 - set_at
+        res = (latest - earliest) / 2
+
+        return RTCDriftDatum(period, cls.__as_ppm(period - cls.NOMINAL_PERIOD), cls.__as_ppm(res))
+
+
+    @classmethod
+    def __as_ppm(cls, interval):
+        return round(interval / cls.NOMINAL_PERIOD * 1e6, 1)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, period, ppm, res):
+        """
+        Constructor
+        """
+        self.__period = period                  # float seconds
+        self.__ppm = ppm                        # float parts per million
+        self.__res = res                        # float parts per million
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self):
+        jdict = OrderedDict()
+
+        jdict['period'] = round(self.period, 6)
+        jdict['ppm'] = self.ppm
+        jdict['res'] = self.res
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def period(self):
+        return self.__period
+
+
+    @property
+    def ppm(self):
+        return self.__ppm
+
+
+    @property
+    def res(self):
+        return self.__res
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "RTCDriftDatum:{period:%s, ppm:%s, res:%s}" % (self.period, self.ppm, self.res)
@@ -0,0 +1,81 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+The wall time of a test subject, the time within that spent holding a bus, and the number of retries, in seconds.
+
+example JSON:
+{"wall": 1.024, "bus": 0.012, "retries": 0}
+"""
+
+from collections import OrderedDict
+
+from scs_core.data.json import JSONable
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class SubjectTiming(JSONable):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct_from_jdict(cls, jdict):
+        if not jdict:
+            return None
+
+        wall = jdict.get('wall')
+        bus = jdict.get('bus')
+        retries = jdict.get('retries', 0)
+
+        return SubjectTiming(wall, bus, retries)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, wall, bus, retries):
+        """
+        Constructor
+        """
+        self.__wall = wall                      # float seconds
+        self.__bus = bus                        # float seconds
+        self.__retries = retries                # int
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self):
+        jdict = OrderedDict()
+
+        jdict['wall'] = round(self.wall, 3)
+        jdict['bus'] = round(self.bus, 3)
+        jdict['retries'] = self.retries
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def wall(self):
+        return self.__wall
+
+
+    @property
+    def bus(self):
+        return self.__bus
+
+
+    @property
+    def retries(self):
+        return self.__retries
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "SubjectTiming:{wall:%s, bus:%s, retries:%s}" % (self.wall, self.bus, self.retries)
@@ -0,0 +1,70 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A simulated analogue front-end, with a Pt1000 and a set of electrochemical sensors. Each ADC conversion takes the
+configured latency, so that sampling the AFE occupies the bus for one conversion per channel.
+
+The Pt1000 temperature is derived from its voltage using the Pt1000 calibration, if one is given, or the true v20.
+"""
+
+from collections import OrderedDict
+
+from scs_mfr.sim.sim_afe_datum import SimAFEDatum
+from scs_mfr.sim.sim_device import SimDevice
+from scs_mfr.sim.sim_pt1000_datum import SimPt1000Datum
+from scs_mfr.sim.sim_sensor_datum import SimSensorDatum
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class SimAFE(SimDevice):
+    """
+    classdocs
+    """
+
+    DEFAULT_V20 =       0.35                # V
+    DEFAULT_SENSORS =   OrderedDict((gas, {'we-v': 1.0, 'ae-v': 1.0}) for gas in ('CO', 'SO2', 'H2S', 'VOC'))
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, conf, seed, ambient, calib_v20=None):
+        """
+        Constructor
+        """
+        super().__init__('afe', conf, seed)
+
+        self.__ambient = ambient                    # SimAmbient
+        self.__calib_v20 = calib_v20                # float V or None
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def sample(self):
+        sensors = self._value('sensors', self.DEFAULT_SENSORS)
+
+        self._operate('sample', 1 + 2 * len(sensors))
+
+        sns = OrderedDict((gas, SimSensorDatum(self._noisy(sensor['we-v']), self._noisy(sensor['ae-v'])))
+                          for gas, sensor in sensors.items())
+
+        return SimAFEDatum(self.__pt1000_datum(), sns)
+
+
+    def sample_pt1000(self):
+        self._operate('sample_pt1000')
+
+        return self.__pt1000_datum()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __pt1000_datum(self):
+        v20 = self._value('v20', self.DEFAULT_V20)
+        calib_v20 = v20 if self.__calib_v20 is None else self.__calib_v20
+
+        v = self._noisy(v20 + (self.__ambient.temp - 20.0) * SimPt1000Datum.SENSITIVITY)
+        temp = 20.0 + (v - calib_v20) / SimPt1000Datum.SENSITIVITY
+
+        return SimPt1000Datum(v, temp)
@@ -0,0 +1,60 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+example JSON:
+{"pt1": {"v": 0.352, "tmp": 22.1}, "sns": {"CO": {"weV": 1.000312, "aeV": 0.999821}}}
+"""
+
+from collections import OrderedDict
+
+from scs_core.data.json import JSONable
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class SimAFEDatum(JSONable):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, pt1000, sns):
+        """
+        Constructor
+        """
+        self.__pt1000 = pt1000                  # SimPt1000Datum
+        self.__sns = sns                        # OrderedDict of gas: SimSensorDatum
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self):
+        jdict = OrderedDict()
+
+        jdict['pt1'] = self.pt1000
+        jdict['sns'] = self.sns
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def pt1000(self):
+        return self.__pt1000
+
+
+    @property
+    def sns(self):
+        return self.__sns
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        sns = '{' + ', '.join(gas + ': ' + str(datum) for gas, datum in self.sns.items()) + '}'
+
+        return "SimAFEDatum:{pt1000:%s, sns:%s}" % (self.pt1000, sns)
@@ -0,0 +1,98 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+The conditions shared by all of the simulated sensors.
+
+If a rise is given, the temperature starts the given number of degrees below its final value, and approaches it
+exponentially with the given time constant - as a board does as it warms up.
+
+example JSON:
+{"temp": 22.0, "humid": 45.0, "rise": 3.0, "tau": 60.0}
+"""
+
+import math
+import time
+
+from collections import OrderedDict
+
+from scs_core.data.json import JSONable
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class SimAmbient(JSONable):
+    """
+    classdocs
+    """
+
+    DEFAULT_TEMP =      22.0                # °C
+    DEFAULT_HUMID =     45.0                # %
+    DEFAULT_TAU =       60.0                # seconds
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct_from_jdict(cls, jdict):
+        if not jdict:
+            return SimAmbient(cls.DEFAULT_TEMP, cls.DEFAULT_HUMID)
+
+        temp = jdict.get('temp', cls.DEFAULT_TEMP)
+        humid = jdict.get('humid', cls.DEFAULT_HUMID)
+
+        rise = jdict.get('rise', 0.0)
+        tau = jdict.get('tau', cls.DEFAULT_TAU)
+
+        return SimAmbient(temp, humid, rise=rise, tau=tau)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, temp, humid, rise=0.0, tau=DEFAULT_TAU):
+        """
+        Constructor
+        """
+        self.__temp = float(temp)
+        self.__humid = float(humid)
+
+        self.__rise = float(rise)                   # °C below temp at construction
+        self.__tau = float(tau)                     # seconds
+
+        self.__start = time.monotonic()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self):
+        jdict = OrderedDict()
+
+        jdict['temp'] = self.temp
+        jdict['humid'] = self.humid
+
+        if self.__rise:
+            jdict['rise'] = self.__rise
+            jdict['tau'] = self.__tau
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def temp(self):
+        if not self.__rise:
+            return self.__temp
+
+        return self.__temp - self.__rise * math.exp(-(time.monotonic() - self.__start) / self.__tau)
+
+
+    @property
+    def humid(self):
+        return self.__humid
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "SimAmbient:{temp:%s, humid:%s, rise:%s, tau:%s}" % (self.temp, self.humid, self.__rise, self.__tau)
@@ -0,0 +1,70 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A simulated CAT24C32 EEPROM. Writing takes the configured latency for each 32-byte page, and reading takes the
+configured latency for each sequential read. The device is blank - all 0xff - until written.
+
+Both the whole-image interface of the CAT24C32 driver and the page-level interface of CAT24C32Pages are provided.
+"""
+
+from scs_mfr.sim.sim_device import SimDevice
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class SimCAT24C32(SimDevice):
+    """
+    classdocs
+    """
+
+    SIZE =          4096                    # bytes
+    PAGE_SIZE =     32                      # bytes
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, conf, seed=None):
+        """
+        Constructor
+        """
+        super().__init__('eeprom', conf, seed)
+
+        self.__image = None                         # EEPROMImage
+        self.__content = bytearray(b'\xff' * self.SIZE)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def write(self, image):
+        self._operate('write', self.SIZE // self.PAGE_SIZE)
+
+        self.__image = image
+        self.__content = bytearray(image.content)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def read(self, memory_addr, count):
+        if memory_addr < 0 or memory_addr + count > self.SIZE:
+            raise ValueError("invalid range: 0x%04x + %d" % (memory_addr, count))
+
+        self._operate('read')
+
+        return bytes(self.__content[memory_addr:memory_addr + count])
+
+
+    def write_page(self, memory_addr, values, wait=True):
+        if memory_addr % self.PAGE_SIZE != 0 or not 0 < len(values) <= self.PAGE_SIZE:
+            raise ValueError("invalid page write: 0x%04x + %d" % (memory_addr, len(values)))
+
+        self._operate('write_page')
+
+        self.__content[memory_addr:memory_addr + len(values)] = values
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def image(self):
+        return self.__image
@@ -0,0 +1,150 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+The specification of a simulated DFE and host. Devices that are not listed have no latency, noise or faults.
+
+example JSON:
+{"seed": 1, "tag": "scs-sim", "host-sn": "sim-0001", "scs-dir": "~/SCS-sim", "eep-image": null,
+"ambient": {"temp": 22.0, "humid": 45.0},
+"devices": {"i2c": {"latency": 0.0005}, "afe": {"latency": 0.012, "noise": 0.002},
+"rtc": {"values": {"ppm": 35}}, "gps": {"latency": 2.5, "fault": 0.05}, "eeprom": {"latency": 0.005}}}
+"""
+
+import json
+
+from collections import OrderedDict
+
+from scs_core.data.json import JSONable
+
+from scs_mfr.sim.sim_ambient import SimAmbient
+from scs_mfr.sim.sim_device_conf import SimDeviceConf
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class SimConf(JSONable):
+    """
+    classdocs
+    """
+
+    DEVICES = ('i2c', 'int-sht', 'ext-sht', 'board-temp', 'afe', 'rtc', 'opc', 'gps', 'eeprom', 'barometer',
+               'mux')
+
+    DEFAULT_TAG =           "scs-sim"
+    DEFAULT_HOST_SN =       "sim"
+    DEFAULT_SCS_DIR =       "~/SCS-sim"
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def load_from_file(cls, filename):
+        with open(filename) as f:
+            jdict = json.load(f, object_pairs_hook=OrderedDict)
+
+        return cls.construct_from_jdict(jdict)
+
+
+    @classmethod
+    def construct_from_jdict(cls, jdict):
+        if jdict is None:
+            return None
+
+        seed = jdict.get('seed')
+        tag = jdict.get('tag', cls.DEFAULT_TAG)
+        host_sn = jdict.get('host-sn', cls.DEFAULT_HOST_SN)
+        scs_dir = jdict.get('scs-dir', cls.DEFAULT_SCS_DIR)
+        eep_image = jdict.get('eep-image')
+
+        ambient = SimAmbient.construct_from_jdict(jdict.get('ambient'))
+
+        device_jdicts = jdict.get('devices', {})
+
+        for name in device_jdicts:
+            if name not in cls.DEVICES:
+                raise ValueError("unknown device: %s" % name)
+
+        devices = OrderedDict((name, SimDeviceConf.construct_from_jdict(device_jdicts.get(name)))
+                              for name in cls.DEVICES)
+
+        return SimConf(seed, tag, host_sn, scs_dir, eep_image, ambient, devices)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, seed, tag, host_sn, scs_dir, eep_image, ambient, devices):
+        """
+        Constructor
+        """
+        self.__seed = seed                          # int or None
+        self.__tag = tag                            # string
+        self.__host_sn = host_sn                    # string
+        self.__scs_dir = scs_dir                    # string path
+        self.__eep_image = eep_image                # string path or None
+
+        self.__ambient = ambient                    # SimAmbient
+        self.__devices = devices                    # OrderedDict of name: SimDeviceConf
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def device(self, name):
+        return self.__devices[name]
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self):
+        jdict = OrderedDict()
+
+        jdict['seed'] = self.seed
+        jdict['tag'] = self.tag
+        jdict['host-sn'] = self.host_sn
+        jdict['scs-dir'] = self.scs_dir
+        jdict['eep-image'] = self.eep_image
+
+        jdict['ambient'] = self.ambient
+        jdict['devices'] = self.__devices
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def seed(self):
+        return self.__seed
+
+
+    @property
+    def tag(self):
+        return self.__tag
+
+
+    @property
+    def host_sn(self):
+        return self.__host_sn
+
+
+    @property
+    def scs_dir(self):
+        return self.__scs_dir
+
+
+    @property
+    def eep_image(self):
+        return self.__eep_image
+
+
+    @property
+    def ambient(self):
+        return self.__ambient
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "SimConf:{seed:%s, tag:%s, host_sn:%s, scs_dir:%s, eep_image:%s, ambient:%s, devices:%s}" % \
+               (self.seed, self.tag, self.host_sn, self.scs_dir, self.eep_image, self.ambient,
+                {name: str(conf) for name, conf in self.__devices.items()})
@@ -0,0 +1,97 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+The base of the simulated devices. Each operation waits for the configured latency - so that bus occupancy is modelled
+when the operation is conducted under a BusLock - and then raises an OSError with the configured fault probability.
+
+Each device has its own random number generator, seeded from the simulation seed and the device name, so that a
+simulation is repeatable whatever the order in which devices are used.
+
+A device may be attached to a channel of a simulated multiplexer, in which case it cannot be operated unless its
+channel is selected.
+"""
+
+import random
+import time
+import zlib
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class SimDevice(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, name, conf, seed=None):
+        """
+        Constructor
+        """
+        self.__name = name                              # string
+        self.__conf = conf                              # SimDeviceConf
+
+        device_seed = None if seed is None else seed ^ zlib.crc32(name.encode())
+        self.__random = random.Random(device_seed)
+
+        self.__mux = None
+        self.__channel = None
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def attach(self, mux, channel):
+        self.__mux = mux                                # SimTCA9548A
+        self.__channel = channel                        # int
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def _operate(self, operation, count=1):
+        """
+        waits for count times the device latency, then raises OSError with the device fault probability
+        """
+        if self.__mux is not None and self.__mux.channel != self.__channel:
+            raise OSError("simulated fault: %s.%s: channel %s not selected" % (self.__name, operation, self.__channel))
+
+        if self.__conf.latency > 0:
+            time.sleep(self.__conf.latency * count)
+
+        if self.__conf.fault > 0 and self.__random.random() < self.__conf.fault:
+            raise OSError("simulated fault: %s.%s" % (self.__name, operation))
+
+
+    def _noisy(self, value, noise=None):
+        noise = self.__conf.noise if noise is None else noise
+
+        return value if noise == 0 else self.__random.gauss(value, noise)
+
+
+    def _value(self, name, default):
+        return self.__conf.value(name, default)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def name(self):
+        return self.__name
+
+
+    @property
+    def conf(self):
+        return self.__conf
+
+
+    @property
+    def channel(self):
+        return self.__channel
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "%s:{name:%s, conf:%s}" % (self.__class__.__name__, self.name, self.conf)
@@ -0,0 +1,98 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+The behaviour of a simulated device: the latency of each operation, the standard deviation of the noise added to each
+reading, the probability that an operation raises an OSError, and any device-specific nominal values.
+
+example JSON:
+{"latency": 0.012, "noise": 0.002, "fault": 0.01, "values": {"we-v": 1.0, "ae-v": 1.0}}
+"""
+
+from collections import OrderedDict
+
+from scs_core.data.json import JSONable
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class SimDeviceConf(JSONable):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct_from_jdict(cls, jdict):
+        if not jdict:
+            return SimDeviceConf()
+
+        latency = jdict.get('latency', 0.0)
+        noise = jdict.get('noise', 0.0)
+        fault = jdict.get('fault', 0.0)
+        values = jdict.get('values', OrderedDict())
+
+        return SimDeviceConf(latency, noise, fault, values)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, latency=0.0, noise=0.0, fault=0.0, values=None):
+        """
+        Constructor
+        """
+        self.__latency = float(latency)                     # float seconds per operation
+        self.__noise = float(noise)                         # float standard deviation, in device units
+        self.__fault = float(fault)                         # float probability of OSError per operation
+
+        self.__values = OrderedDict() if values is None else values     # dict of device-specific values
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def value(self, name, default):
+        return self.__values.get(name, default)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self):
+        jdict = OrderedDict()
+
+        jdict['latency'] = self.latency
+        jdict['noise'] = self.noise
+        jdict['fault'] = self.fault
+        jdict['values'] = self.values
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def latency(self):
+        return self.__latency
+
+
+    @property
+    def noise(self):
+        return self.__noise
+
+
+    @property
+    def fault(self):
+        return self.__fault
+
+
+    @property
+    def values(self):
+        return self.__values
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "SimDeviceConf:{latency:%s, noise:%s, fault:%s, values:%s}" % \
+               (self.latency, self.noise, self.fault, self.values)
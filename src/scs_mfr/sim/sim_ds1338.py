@@ -0,0 +1,73 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A simulated DS1338 real-time clock, driven by the host monotonic clock. As on the device, setting the time restarts
+the seconds divider, so the first tick follows one (drifted) second after the time is set.
+
+The drift is given in parts per million by the "ppm" value.
+"""
+
+import time
+
+from datetime import timedelta
+
+import tzlocal
+
+from scs_core.data.localized_datetime import LocalizedDatetime
+from scs_core.data.rtc_datetime import RTCDatetime
+
+from scs_mfr.sim.sim_device import SimDevice
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class SimDS1338(SimDevice):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, conf, seed=None):
+        """
+        Constructor
+        """
+        super().__init__('rtc', conf, seed)
+
+        self.__set_time = None                      # LocalizedDatetime
+        self.__set_at = None                        # float monotonic seconds
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def init(self):
+        self._operate('init')
+
+        if self.__set_time is None:
+            self.__set(LocalizedDatetime.now())
+
+
+    def set_time(self, rtc_datetime):
+        self._operate('set_time')
+
+        self.__set(rtc_datetime.as_localized_datetime(tzlocal.get_localzone()))
+
+
+    def get_time(self):
+        self._operate('get_time')
+
+        rate = 1.0 + self._value('ppm', 0.0) / 1e6
+        ticks = int((time.monotonic() - self.__set_at) * rate)
+
+        localized_datetime = LocalizedDatetime(self.__set_time.datetime + timedelta(seconds=ticks))
+
+        return RTCDatetime.construct_from_localized_datetime(localized_datetime)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __set(self, localized_datetime):
+        self.__set_time = localized_datetime
+        self.__set_at = time.monotonic()
@@ -0,0 +1,92 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A host for simulations, with its own SCS directory, so that conf documents, calibrations and result stores are kept
+apart from those of the workstation. The bus identifiers are those of the real host, since they serve as BusLock keys.
+
+If no EEPROM image is given, a blank image is created in the SCS directory.
+"""
+
+import os
+
+from scs_host.sys.host import Host
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class SimHost(object):
+    """
+    classdocs
+    """
+
+    I2C_SENSORS =       Host.I2C_SENSORS
+    I2C_EEPROM =        Host.I2C_EEPROM
+
+    __EEPROM_SIZE =     4096                # bytes
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, scs_dir, serial_number, eep_image=None):
+        """
+        Constructor
+        """
+        self.__scs_dir = os.path.expanduser(scs_dir)
+        self.__serial_number = serial_number
+
+        self.__eep_image = eep_image
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def serial_number(self):
+        return self.__serial_number
+
+
+    def scs_dir(self):
+        return self.__scs_dir
+
+
+    def conf_dir(self):
+        return os.path.join(self.__scs_dir, 'conf')
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def opc_spi_bus(self):
+        return 0
+
+
+    def opc_spi_device(self):
+        return 0
+
+
+    def gps_device(self):
+        return 1
+
+
+    def enable_eeprom_access(self):
+        pass
+
+
+    def eep_image(self):
+        if self.__eep_image is not None:
+            return os.path.expanduser(self.__eep_image)
+
+        filename = os.path.join(self.__scs_dir, 'hat', 'sim.eep')
+
+        if not os.path.isfile(filename):
+            os.makedirs(os.path.dirname(filename), exist_ok=True)
+
+            with open(filename, 'wb') as f:
+                f.write(bytes(self.__EEPROM_SIZE))
+
+        return filename
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "SimHost:{scs_dir:%s, serial_number:%s, eep_image:%s}" % \
+               (self.__scs_dir, self.__serial_number, self.__eep_image)
@@ -0,0 +1,46 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A simulated I2C driver, for use in place of the host I2C driver by BusLock. Opening the bus takes the configured
+latency, and may fail with the configured fault probability.
+"""
+
+from scs_mfr.sim.sim_device import SimDevice
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class SimI2C(SimDevice):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, conf, seed=None):
+        """
+        Constructor
+        """
+        super().__init__('i2c', conf, seed)
+
+        self.__bus = None
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def open(self, bus):
+        self._operate('open')
+        self.__bus = bus
+
+
+    def close(self):
+        self.__bus = None
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def bus(self):
+        return self.__bus
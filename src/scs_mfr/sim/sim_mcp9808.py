@@ -0,0 +1,36 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A simulated MCP9808 board temperature sensor. The board runs warmer than ambient by the configured offset.
+"""
+
+from scs_mfr.sim.sim_device import SimDevice
+from scs_mfr.sim.sim_temp_datum import SimTempDatum
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class SimMCP9808(SimDevice):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, conf, seed, ambient):
+        """
+        Constructor
+        """
+        super().__init__('board-temp', conf, seed)
+
+        self.__ambient = ambient                    # SimAmbient
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def sample(self):
+        self._operate('sample')
+
+        return SimTempDatum(self._noisy(self.__ambient.temp + self._value('temp-offset', 1.5)))
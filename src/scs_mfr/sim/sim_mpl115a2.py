@@ -0,0 +1,53 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A simulated MPL115A2 barometer. The true temperature count at 25 °C is given by the "c25" value, and the reported
+temperature is derived using the c25 with which the barometer is constructed.
+"""
+
+from scs_mfr.sim.sim_device import SimDevice
+from scs_mfr.sim.sim_mpl115a2_datum import SimMPL115A2Datum
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class SimMPL115A2(SimDevice):
+    """
+    classdocs
+    """
+
+    DEFAULT_C25 =       510                 # count
+    DEFAULT_PRESSURE =  101.3               # kPa
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, conf, seed, ambient, c25):
+        """
+        Constructor
+        """
+        super().__init__('barometer', conf, seed)
+
+        self.__ambient = ambient                    # SimAmbient
+        self.__c25 = c25                            # int count
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def init(self):
+        self._operate('init')
+
+
+    def sample(self):
+        self._operate('sample')
+
+        true_c25 = self._value('c25', self.DEFAULT_C25)
+
+        tc = true_c25 + (self.__ambient.temp - 25.0) * SimMPL115A2Datum.COUNTS_PER_DEGREE
+        tc = int(round(self._noisy(tc)))
+
+        temp = 25.0 + (tc - self.__c25) / SimMPL115A2Datum.COUNTS_PER_DEGREE
+        pressure = self._value('pressure', self.DEFAULT_PRESSURE)
+
+        return SimMPL115A2Datum(pressure, tc, temp)
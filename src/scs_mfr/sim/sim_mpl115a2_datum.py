@@ -0,0 +1,78 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+The MPL115A2 temperature count falls by 5.35 counts per °C from its value at 25 °C - c25.
+
+example JSON:
+{"pA": 101.3, "tc": 495, "tmp": 22.1}
+"""
+
+from collections import OrderedDict
+
+from scs_core.data.json import JSONable
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class SimMPL115A2Datum(JSONable):
+    """
+    classdocs
+    """
+
+    COUNTS_PER_DEGREE = -5.35
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, pressure, tc, temp):
+        """
+        Constructor
+        """
+        self.__pressure = pressure              # float kPa
+        self.__tc = tc                          # int count
+        self.__temp = temp                      # float °C
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def c25(self, temp):
+        """
+        returns the temperature count at 25 °C, given the true temperature
+        """
+        return int(round(self.tc - (temp - 25.0) * self.COUNTS_PER_DEGREE))
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self):
+        jdict = OrderedDict()
+
+        jdict['pA'] = round(self.pressure, 1)
+        jdict['tc'] = self.tc
+        jdict['tmp'] = round(self.temp, 1)
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def pressure(self):
+        return self.__pressure
+
+
+    @property
+    def tc(self):
+        return self.__tc
+
+
+    @property
+    def temp(self):
+        return self.__temp
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "SimMPL115A2Datum:{pressure:%0.1f, tc:%d, temp:%0.1f}" % (self.pressure, self.tc, self.temp)
@@ -0,0 +1,52 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A simulated Alphasense OPC-N2 optical particle counter. Powering on and off are modelled as I2C operations, and the
+remainder as SPI operations, each taking the configured latency.
+"""
+
+from scs_mfr.sim.sim_device import SimDevice
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class SimOPCN2(SimDevice):
+    """
+    classdocs
+    """
+
+    DEFAULT_FIRMWARE = "OPC-N2 FirmwareVer=OPC-018.2..............................BD"
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, conf, seed=None):
+        """
+        Constructor
+        """
+        super().__init__('opc', conf, seed)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def power_on(self):
+        self._operate('power_on')
+
+
+    def power_off(self):
+        self._operate('power_off')
+
+
+    def operations_on(self):
+        self._operate('operations_on')
+
+
+    def operations_off(self):
+        self._operate('operations_off')
+
+
+    def firmware(self):
+        self._operate('firmware')
+
+        return self._value('firmware', self.DEFAULT_FIRMWARE)
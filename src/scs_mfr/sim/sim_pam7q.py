@@ -0,0 +1,52 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A simulated PAM7Q GPS receiver. Waiting for a report takes the configured latency. If the "fix" value is false, no
+report is received; otherwise the report is the configured NMEA sentence, rather than a parsed message.
+"""
+
+from scs_mfr.sim.sim_device import SimDevice
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class SimPAM7Q(SimDevice):
+    """
+    classdocs
+    """
+
+    DEFAULT_SENTENCE = "$GPRMC,103422.00,A,5049.38023,N,00007.37931,W,0.102,,181026,,,D*6C"
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, conf, seed=None):
+        """
+        Constructor
+        """
+        super().__init__('gps', conf, seed)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def power_on(self):
+        self._operate('power_on', 0)
+
+
+    def power_off(self):
+        self._operate('power_off', 0)
+
+
+    def open(self):
+        self._operate('open', 0)
+
+
+    def close(self):
+        pass
+
+
+    def report(self, message_class):
+        self._operate('report')
+
+        return self._value('sentence', self.DEFAULT_SENTENCE) if self._value('fix', True) else None
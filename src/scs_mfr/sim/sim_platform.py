@@ -0,0 +1,169 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+The simulated host, I2C driver and devices specified by a SimConf.
+
+The AFE and barometer are constructed on request, since - as with the real devices - they depend on calibrations
+that may be changed by the caller.
+
+In a simulated test fixture, each DFE is on a channel of the multiplexer. The platform of each DFE shares the host, I2C
+driver and multiplexer, but has its own devices, with their own random number generators. Its I2C devices are attached
+to its multiplexer channel.
+"""
+
+from scs_core.gas.pt1000_calib import Pt1000Calib
+
+from scs_mfr.sim.sim_afe import SimAFE
+from scs_mfr.sim.sim_cat24c32 import SimCAT24C32
+from scs_mfr.sim.sim_ds1338 import SimDS1338
+from scs_mfr.sim.sim_host import SimHost
+from scs_mfr.sim.sim_i2c import SimI2C
+from scs_mfr.sim.sim_mcp9808 import SimMCP9808
+from scs_mfr.sim.sim_mpl115a2 import SimMPL115A2
+from scs_mfr.sim.sim_opc_n2 import SimOPCN2
+from scs_mfr.sim.sim_pam7q import SimPAM7Q
+from scs_mfr.sim.sim_sht import SimSHT
+from scs_mfr.sim.sim_tca9548a import SimTCA9548A
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class SimPlatform(object):
+    """
+    classdocs
+    """
+
+    INT_SHT_ADDR =      0x44
+    EXT_SHT_ADDR =      0x45
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, conf, parent=None, channel=None):
+        """
+        Constructor
+        """
+        self.__conf = conf
+        self.__channel = channel                    # int multiplexer channel or None
+
+        seed = conf.seed if conf.seed is None or channel is None else conf.seed + channel
+        ambient = conf.ambient
+
+        self.__seed = seed
+
+        if parent is None:
+            self.__host = SimHost(conf.scs_dir, conf.host_sn, conf.eep_image)
+            self.__i2c = SimI2C(conf.device('i2c'), seed)
+            self.__mux = SimTCA9548A(conf.device('mux'), seed)
+
+        else:
+            self.__host = parent.host
+            self.__i2c = parent.i2c
+            self.__mux = parent.mux
+
+        self.__int_sht = self.__attach(SimSHT('int-sht', conf.device('int-sht'), seed, self.INT_SHT_ADDR, ambient))
+        self.__ext_sht = self.__attach(SimSHT('ext-sht', conf.device('ext-sht'), seed, self.EXT_SHT_ADDR, ambient))
+        self.__board_temp = self.__attach(SimMCP9808(conf.device('board-temp'), seed, ambient))
+        self.__rtc = self.__attach(SimDS1338(conf.device('rtc'), seed))
+        self.__opc = SimOPCN2(conf.device('opc'), seed)
+        self.__gps = SimPAM7Q(conf.device('gps'), seed)
+        self.__eeprom = SimCAT24C32(conf.device('eeprom'), seed)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def board(self, channel):
+        """
+        returns the platform of the DFE on the given channel of the multiplexer
+        """
+        if not 0 <= channel < SimTCA9548A.CHANNELS:
+            raise ValueError("invalid channel: %s" % channel)
+
+        return SimPlatform(self.__conf, parent=self, channel=channel)
+
+
+    def afe(self):
+        calib = Pt1000Calib.load(self.__host)
+        calib_v20 = None if calib is None else calib.v20
+
+        return self.__attach(SimAFE(self.__conf.device('afe'), self.__seed, self.__conf.ambient, calib_v20))
+
+
+    def barometer(self, c25):
+        return self.__attach(SimMPL115A2(self.__conf.device('barometer'), self.__seed, self.__conf.ambient, c25))
+
+
+    def __attach(self, device):
+        if self.__channel is not None:
+            device.attach(self.__mux, self.__channel)
+
+        return device
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def conf(self):
+        return self.__conf
+
+
+    @property
+    def host(self):
+        return self.__host
+
+
+    @property
+    def channel(self):
+        return self.__channel
+
+
+    @property
+    def i2c(self):
+        return self.__i2c
+
+
+    @property
+    def mux(self):
+        return self.__mux
+
+
+    @property
+    def int_sht(self):
+        return self.__int_sht
+
+
+    @property
+    def ext_sht(self):
+        return self.__ext_sht
+
+
+    @property
+    def board_temp(self):
+        return self.__board_temp
+
+
+    @property
+    def rtc(self):
+        return self.__rtc
+
+
+    @property
+    def opc(self):
+        return self.__opc
+
+
+    @property
+    def gps(self):
+        return self.__gps
+
+
+    @property
+    def eeprom(self):
+        return self.__eeprom
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "SimPlatform:{conf:%s, host:%s, channel:%s}" % (self.conf, self.host, self.channel)
@@ -0,0 +1,71 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+The simulated Pt1000 voltage rises linearly with temperature from its voltage at 20 °C.
+
+example JSON:
+{"v": 0.352, "tmp": 22.1}
+"""
+
+from collections import OrderedDict
+
+from scs_core.data.json import JSONable
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class SimPt1000Datum(JSONable):
+    """
+    classdocs
+    """
+
+    SENSITIVITY = 0.001                     # V / °C
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, v, temp):
+        """
+        Constructor
+        """
+        self.__v = v                            # float V
+        self.__temp = temp                      # float °C
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def v20(self, temp):
+        """
+        returns the voltage at 20 °C, given the true temperature
+        """
+        return round(self.v - (temp - 20.0) * self.SENSITIVITY, 6)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self):
+        jdict = OrderedDict()
+
+        jdict['v'] = round(self.v, 6)
+        jdict['tmp'] = round(self.temp, 1)
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def v(self):
+        return self.__v
+
+
+    @property
+    def temp(self):
+        return self.__temp
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "SimPt1000Datum:{v:%0.6f, temp:%0.1f}" % (self.v, self.temp)
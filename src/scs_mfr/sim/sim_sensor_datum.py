@@ -0,0 +1,58 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+example JSON:
+{"weV": 1.000312, "aeV": 0.999821}
+"""
+
+from collections import OrderedDict
+
+from scs_core.data.json import JSONable
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class SimSensorDatum(JSONable):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, we_v, ae_v):
+        """
+        Constructor
+        """
+        self.__we_v = we_v                      # float V
+        self.__ae_v = ae_v                      # float V
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self):
+        jdict = OrderedDict()
+
+        jdict['weV'] = round(self.we_v, 6)
+        jdict['aeV'] = round(self.ae_v, 6)
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def we_v(self):
+        return self.__we_v
+
+
+    @property
+    def ae_v(self):
+        return self.__ae_v
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "SimSensorDatum:{we_v:%0.6f, ae_v:%0.6f}" % (self.we_v, self.ae_v)
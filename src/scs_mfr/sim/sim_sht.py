@@ -0,0 +1,51 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A simulated SHT31 humidity and temperature sensor, reading the ambient conditions plus the configured offsets.
+"""
+
+from scs_mfr.sim.sim_device import SimDevice
+from scs_mfr.sim.sim_sht_datum import SimSHTDatum
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class SimSHT(SimDevice):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, name, conf, seed, addr, ambient):
+        """
+        Constructor
+        """
+        super().__init__(name, conf, seed)
+
+        self.__addr = addr                          # int
+        self.__ambient = ambient                    # SimAmbient
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def reset(self):
+        self._operate('reset')
+
+
+    def sample(self):
+        self._operate('sample')
+
+        humid = self._noisy(self.__ambient.humid + self._value('humid-offset', 0.0))
+        temp = self._noisy(self.__ambient.temp + self._value('temp-offset', 0.0))
+
+        return SimSHTDatum(humid, temp)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def addr(self):
+        return self.__addr
@@ -0,0 +1,58 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+example JSON:
+{"hmd": 45.2, "tmp": 22.1}
+"""
+
+from collections import OrderedDict
+
+from scs_core.data.json import JSONable
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class SimSHTDatum(JSONable):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, humid, temp):
+        """
+        Constructor
+        """
+        self.__humid = humid                    # float %
+        self.__temp = temp                      # float °C
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self):
+        jdict = OrderedDict()
+
+        jdict['hmd'] = round(self.humid, 1)
+        jdict['tmp'] = round(self.temp, 1)
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def humid(self):
+        return self.__humid
+
+
+    @property
+    def temp(self):
+        return self.__temp
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "SimSHTDatum:{humid:%0.1f, temp:%0.1f}" % (self.humid, self.temp)
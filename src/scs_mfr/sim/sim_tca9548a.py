@@ -0,0 +1,48 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A simulated TCA9548A I2C multiplexer. Simulated devices attached to a channel raise an OSError if they are operated
+while their channel is not selected.
+"""
+
+from scs_mfr.sim.sim_device import SimDevice
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class SimTCA9548A(SimDevice):
+    """
+    classdocs
+    """
+
+    CHANNELS =          8
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, conf, seed=None):
+        """
+        Constructor
+        """
+        super().__init__('mux', conf, seed)
+
+        self.__channel = None
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def select(self, channel):
+        if channel is not None and not 0 <= channel < self.CHANNELS:
+            raise ValueError("invalid channel: %s" % channel)
+
+        self.__channel = None
+        self._operate('select')
+        self.__channel = channel
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def channel(self):
+        return self.__channel
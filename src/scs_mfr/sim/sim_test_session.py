@@ -0,0 +1,126 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A TestSession whose devices are those of a SimPlatform. The simulated I2C driver is used by BusLock while the session
+is open. If the platform is that of a DFE on a multiplexer channel, the simulated multiplexer is also used.
+"""
+
+import threading
+
+from scs_mfr.test.bus_lock import BusLock
+from scs_mfr.test.test_session import TestSession
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class SimTestSession(TestSession):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, platform, population=None):
+        """
+        Constructor
+        """
+        mux = None if platform.channel is None else platform.mux
+
+        super().__init__(platform.host, mux=mux, channel=platform.channel, population=population)
+
+        self.__platform = platform
+
+        self.__lock = threading.RLock()
+
+        self.__afe = None
+        self.__rtc = None
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def open(self):
+        BusLock.use_i2c(self.__platform.i2c)
+        super().open()
+
+
+    def close(self):
+        super().close()
+        BusLock.use_i2c(None)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def sht_conf(self):
+        return None
+
+
+    @property
+    def dfe_conf(self):
+        return None
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def int_sht(self):
+        return self.__platform.int_sht
+
+
+    @property
+    def ext_sht(self):
+        return self.__platform.ext_sht
+
+
+    @property
+    def afe(self):
+        with self.__lock:
+            if self.__afe is None:
+                self.__afe = self.__platform.afe()
+
+            return self.__afe
+
+
+    @property
+    def board_temp(self):
+        return self.__platform.board_temp
+
+
+    @property
+    def rtc(self):
+        with self.__lock:
+            if self.__rtc is None:
+                with BusLock.i2c(BusLock.I2C_SENSORS, self.host.I2C_SENSORS):
+                    self.__platform.rtc.init()
+
+                self.__rtc = self.__platform.rtc
+
+            return self.__rtc
+
+
+    @property
+    def opc(self):
+        return self.__platform.opc
+
+
+    @property
+    def gps(self):
+        return self.__platform.gps
+
+
+    @property
+    def eeprom(self):
+        return self.__platform.eeprom
+
+
+    @property
+    def eeprom_pages(self):
+        return self.__platform.eeprom
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "SimTestSession:{platform:%s}" % self.__platform
@@ -2,15 +2,27 @@
 Created on 18 May 2017
 
 @author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+In burst mode, a number of samples are taken back-to-back, under a single hold of the bus. The mean, standard
+deviation, peak-to-peak range and drift of the WE and AE voltages of each sensor are then tested against their limits -
+named for the channel and statistic, for example we_v_std. The mean is tested against the single-sample limits.
+
+In burst mode, the datum is the first sample of the burst, and the burst statistics are reported separately. The
+mean is the statistic that is scored, both against the limits and against the golden population, and it is the mean
+that the result store adds to the population.
+
+If a golden population is given, the WE and AE voltages - or their means - are also tested by z-score.
 """
 
 import sys
+import time
 
-from scs_dfe.board.dfe_conf import DFEConf
+from collections import OrderedDict
 
-from scs_host.bus.i2c import I2C
-from scs_host.sys.host import Host
+from scs_mfr.data.sample_statistics import SampleStatistics
 
+from scs_mfr.test.bus_lock import BusLock
+from scs_mfr.test.golden_population import GoldenPopulation
 from scs_mfr.test.test import Test
 
 
@@ -21,41 +33,137 @@ class AFETest(Test):
     test script
     """
 
+    BUSES = (BusLock.I2C_SENSORS, )
+
+    DEFAULT_SAMPLES =   1
+
+    DEFAULT_LIMITS = {'we_v': (0.9, 1.1), 'ae_v': (0.9, 1.1),
+                      'we_v_std': (None, 0.002), 'ae_v_std': (None, 0.002),                 # V
+                      'we_v_ptp': (None, 0.01), 'ae_v_ptp': (None, 0.01),                   # V
+                      'we_v_slope': (-0.001, 0.001), 'ae_v_slope': (-0.001, 0.001),         # V per second
+                      'we_v_z': (-4.0, 4.0), 'ae_v_z': (-4.0, 4.0)}
+
+    __CHANNELS = OrderedDict((('we_v', 'weV'), ('ae_v', 'aeV')))                            # limit name: JSON name
+    __STATISTICS = ('std', 'ptp', 'slope')
+
+
     # ----------------------------------------------------------------------------------------------------------------
 
-    def __init__(self, verbose):
-        Test.__init__(self, verbose)
+    @classmethod
+    def construct(cls, subject, session, args, limits, verbose):
+        return cls(session.afe, session.host, verbose, limits, samples=args.get('samples', cls.DEFAULT_SAMPLES),
+                   population=session.population)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, afe, host, verbose, limits=None, samples=DEFAULT_SAMPLES, population=None):
+        Test.__init__(self, verbose, limits)
+
+        self.__afe = afe
+        self.__host = host
+        self.__samples = int(samples)
+        self.__population = population
+
+        self.__statistics = None
 
 
     # ----------------------------------------------------------------------------------------------------------------
 
     def conduct(self):
         if self.verbose:
-            print("AFE...", file=sys.stderr)
+            print("AFE..." if self.__samples == 1 else "AFE (%d samples)..." % self.__samples, file=sys.stderr)
 
-        try:
-            I2C.open(Host.I2C_SENSORS)
-
-            # AFE...
-            dfe_conf = DFEConf.load(Host)
-            afe = dfe_conf.afe(Host)
+        if self.__samples > 1:
+            return self.__conduct_burst()
 
+        with BusLock.i2c(BusLock.I2C_SENSORS, self.__host.I2C_SENSORS):
             # test...
-            self.datum = afe.sample()
+            self.datum = self.__afe.sample()
 
             if self.verbose:
                 print(self.datum, file=sys.stderr)
 
             ok = True
 
-            # test criterion...
+            # test criteria...
             for gas, sensor in self.datum.sns.items():
-                sensor_ok = 0.9 < sensor.we_v < 1.1 and 0.9 < sensor.ae_v < 1.1
+                sensor_ok = self.within('we_v', sensor.we_v) and self.within('ae_v', sensor.ae_v)
 
                 if not sensor_ok:
                     ok = False
 
+                for channel, name in self.__CHANNELS.items():
+                    value = getattr(sensor, channel, None)
+
+                    if value is not None and not self.__within_population(gas, channel, name, value):
+                        ok = False
+
             return ok
 
-        finally:
-            I2C.close()
+
+    def __conduct_burst(self):
+        samples = []
+        times = []
+
+        # test...
+        with BusLock.i2c(BusLock.I2C_SENSORS, self.__host.I2C_SENSORS):
+            for _ in range(self.__samples):
+                samples.append(self.__afe.sample())
+                times.append(time.monotonic())
+
+        self.datum = samples[0]                     # the statistics - not this sample - are scored and stored
+        self.__statistics = OrderedDict()
+
+        ok = True
+
+        for gas in self.datum.sns:
+            self.__statistics[gas] = OrderedDict()
+
+            for channel, name in self.__CHANNELS.items():
+                values = [getattr(sample.sns[gas], channel, None) for sample in samples]
+
+                if None in values:
+                    continue
+
+                statistics = SampleStatistics.construct(values, times)
+                self.__statistics[gas][name] = statistics
+
+                if self.verbose:
+                    print("%s %s: %s" % (gas, name, statistics), file=sys.stderr)
+
+                # test criteria...
+                if not self.within(channel, statistics.mean):
+                    ok = False
+
+                if not self.__within_population(gas, channel, name, statistics.mean):
+                    ok = False
+
+                for statistic in self.__STATISTICS:
+                    value = getattr(statistics, statistic)
+
+                    if value is not None and not self.within('%s_%s' % (channel, statistic), value):
+                        ok = False
+
+        return ok
+
+
+    def __within_population(self, gas, channel, name, value):
+        population_channel = GoldenPopulation.sensor_channel(gas, name)
+
+        return self.within_population(self.__population, population_channel, channel + '_z', value)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def samples(self):
+        return self.__samples
+
+
+    @property
+    def statistics(self):
+        """
+        returns OrderedDict of gas: OrderedDict of channel: SampleStatistics, or None if not in burst mode
+        """
+        return self.__statistics
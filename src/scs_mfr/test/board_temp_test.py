@@ -6,11 +6,7 @@ Created on 18 May 2017
 
 import sys
 
-from scs_dfe.board.mcp9808 import MCP9808
-
-from scs_host.bus.i2c import I2C
-from scs_host.sys.host import Host
-
+from scs_mfr.test.bus_lock import BusLock
 from scs_mfr.test.test import Test
 
 
@@ -21,10 +17,24 @@ class BoardTempTest(Test):
     test script
     """
 
+    BUSES = (BusLock.I2C_SENSORS, )
+    DEFAULT_LIMITS = {'temp': (10, 50)}
+
+
     # ----------------------------------------------------------------------------------------------------------------
 
-    def __init__(self, verbose):
-        Test.__init__(self, verbose)
+    @classmethod
+    def construct(cls, subject, session, args, limits, verbose):
+        return cls(session.board_temp, session.host, verbose, limits)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, sensor, host, verbose, limits=None):
+        Test.__init__(self, verbose, limits)
+
+        self.__sensor = sensor
+        self.__host = host
 
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -33,22 +43,12 @@ class BoardTempTest(Test):
         if self.verbose:
             print("Board temp...", file=sys.stderr)
 
-        try:
-            I2C.open(Host.I2C_SENSORS)
-
-            # resources...
-            sensor = MCP9808(True)
-
+        with BusLock.i2c(BusLock.I2C_SENSORS, self.__host.I2C_SENSORS):
             # test...
-            self.datum = sensor.sample()
+            self.datum = self.__sensor.sample()
 
             if self.verbose:
                 print(self.datum, file=sys.stderr)
 
-            temp = self.datum.temp
-
             # test criterion...
-            return 10 < temp < 50
-
-        finally:
-            I2C.close()
+            return self.within('temp', self.datum.temp)
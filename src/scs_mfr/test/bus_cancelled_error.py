@@ -0,0 +1,44 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Raised by a thread whose bus locks have been abandoned, whenever it next attempts to hold a bus.
+"""
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class BusCancelledError(RuntimeError):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, thread_name, key):
+        """
+        Constructor
+        """
+        super().__init__(thread_name, key)
+
+        self.__thread_name = thread_name            # string
+        self.__key = key                            # bus lock name
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def thread_name(self):
+        return self.__thread_name
+
+
+    @property
+    def key(self):
+        return self.__key
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "BusCancelledError:{thread_name:%s, key:%s}" % (self.thread_name, self.key)
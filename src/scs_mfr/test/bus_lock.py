@@ -0,0 +1,307 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Mutual exclusion for the host buses, so that tests on different buses may be conducted concurrently.
+
+Note that the host I2C driver holds a single device handle for the whole process - the I2C sensors bus and the I2C
+EEPROM bus therefore also share the handle lock.
+
+While retained, the I2C handle is left open between holds, and is only re-opened when a different bus is required.
+
+The I2C driver may be replaced - for example by a simulated driver - while no I2C bus is open.
+
+The time for which each thread holds any bus - excluding time spent waiting for the lock - is accumulated, so that
+time spent in bus I/O can be attributed to the test conducted on that thread.
+
+The locks held by a thread that has hung may be abandoned: each is replaced by a new lock, so that other threads may
+proceed, and the I2C handle is closed. Threads waiting on an abandoned lock move to its replacement. The abandoned
+thread is cancelled: if it is still running, any later attempt by it to hold a bus raises BusCancelledError, rather
+than taking a bus that other threads are now using.
+
+One I2C bus may be fanned out by a multiplexer, such as a TCA9548A. Each thread may be bound to a multiplexer channel,
+which is selected - if it is not already selected - whenever the thread holds the multiplexed bus. Threads bound to
+different channels therefore share the bus, one hold at a time.
+"""
+
+import threading
+import time
+
+from contextlib import contextmanager
+
+from scs_host.bus.i2c import I2C
+
+from scs_mfr.test.bus_cancelled_error import BusCancelledError
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class BusLock(object):
+    """
+    classdocs
+    """
+
+    I2C_SENSORS =       'I2C_SENSORS'
+    I2C_EEPROM =        'I2C_EEPROM'
+    SPI =               'SPI'
+    UART =              'UART'
+
+    __I2C_HANDLE =      ('I2C_HANDLE', None)
+
+    __POLL_INTERVAL =   0.1                 # seconds between checks for an abandoned lock
+
+    __LOCKS = {}
+    __LOCKS_GUARD = threading.Lock()
+
+    __held = {}                             # thread ident: list of keys
+    __cancelled = set()                     # abandoned threads
+
+    __i2c = I2C
+    __i2c_bus = None
+    __i2c_depth = 0
+    __i2c_retained = False
+    __i2c_generation = 0
+
+    __mux = None
+    __mux_bus = None
+    __mux_channel = None                    # the channel currently selected, or None if not known
+
+    __timing = threading.local()
+    __binding = threading.local()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def __lock(cls, key):
+        with cls.__LOCKS_GUARD:
+            if key not in cls.__LOCKS:
+                cls.__LOCKS[key] = threading.RLock()
+
+            return cls.__LOCKS[key]
+
+
+    @classmethod
+    @contextmanager
+    def __hold(cls, key):
+        thread = threading.current_thread()
+
+        while True:
+            if thread in cls.__cancelled:
+                raise BusCancelledError(thread.name, key[0])
+
+            lock = cls.__lock(key)
+
+            if not lock.acquire(timeout=cls.__POLL_INTERVAL):
+                continue
+
+            if lock is cls.__lock(key) and thread not in cls.__cancelled:
+                break
+
+            lock.release()                  # the lock was abandoned while waiting
+
+        ident = threading.get_ident()
+
+        with cls.__LOCKS_GUARD:
+            cls.__held.setdefault(ident, []).append(key)
+
+        try:
+            yield
+
+        finally:
+            with cls.__LOCKS_GUARD:
+                held = cls.__held.get(ident)
+
+                if held and key in held:
+                    held.remove(key)
+
+                    if not held:
+                        del cls.__held[ident]
+
+            lock.release()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def start_timing(cls):
+        cls.__timing.bus_time = 0.0
+        cls.__timing.depth = 0
+
+
+    @classmethod
+    def bus_time(cls):
+        return getattr(cls.__timing, 'bus_time', 0.0)
+
+
+    @classmethod
+    @contextmanager
+    def __timed(cls):
+        if not hasattr(cls.__timing, 'bus_time'):
+            cls.start_timing()
+
+        cls.__timing.depth += 1
+        start = time.monotonic()
+
+        try:
+            yield
+
+        finally:
+            cls.__timing.depth -= 1
+
+            if cls.__timing.depth == 0:
+                cls.__timing.bus_time += time.monotonic() - start
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def use_i2c(cls, driver):
+        """
+        driver: an object with open(bus) and close() methods, or None for the host I2C driver
+        """
+        with cls.__hold(cls.__I2C_HANDLE):
+            if cls.__i2c_bus is not None:
+                raise ValueError("I2C bus %s is in use" % cls.__i2c_bus)
+
+            cls.__i2c = I2C if driver is None else driver
+
+
+    @classmethod
+    def use_mux(cls, mux, bus=None):
+        """
+        mux: an object with a select(channel) method, fanning out the given I2C bus, or None for no multiplexer
+        """
+        with cls.__hold(cls.__I2C_HANDLE):
+            if cls.__i2c_bus is not None:
+                raise ValueError("I2C bus %s is in use" % cls.__i2c_bus)
+
+            cls.__mux = mux
+            cls.__mux_bus = None if mux is None else bus
+            cls.__mux_channel = None
+
+
+    @classmethod
+    def bind(cls, channel):
+        """
+        binds the calling thread to the given multiplexer channel, or to none
+        """
+        cls.__binding.channel = channel
+
+
+    @classmethod
+    def retain(cls):
+        with cls.__hold(cls.__I2C_HANDLE):
+            cls.__i2c_retained = True
+
+
+    @classmethod
+    def release(cls):
+        with cls.__hold(cls.__I2C_HANDLE):
+            cls.__i2c_retained = False
+
+            if cls.__i2c_depth == 0:
+                cls.__close_i2c()
+
+
+    @classmethod
+    def abandon(cls, thread):
+        """
+        replaces the locks held by the given thread, closing the I2C handle if it was held, and cancels the thread
+        returns the names of the abandoned bus locks
+        """
+        with cls.__LOCKS_GUARD:
+            cls.__cancelled = {cancelled for cancelled in cls.__cancelled if cancelled.is_alive()}
+            cls.__cancelled.add(thread)
+
+            keys = set(cls.__held.pop(thread.ident, []))
+
+            for key in keys:
+                cls.__LOCKS[key] = threading.RLock()
+
+        if cls.__I2C_HANDLE in keys:
+            with cls.__hold(cls.__I2C_HANDLE):
+                cls.__i2c_generation += 1
+                cls.__i2c_depth = 0
+
+                try:
+                    cls.__close_i2c()
+
+                finally:
+                    cls.__i2c_bus = None
+
+        return sorted(key[0] for key in keys if key != cls.__I2C_HANDLE)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    @contextmanager
+    def i2c(cls, name, bus):
+        with cls.__hold((name, bus)), cls.__hold(cls.__I2C_HANDLE):
+            generation = cls.__i2c_generation
+
+            if cls.__i2c_bus != bus:
+                if cls.__i2c_depth > 0:
+                    raise ValueError("I2C bus %s is in use" % cls.__i2c_bus)
+
+                cls.__close_i2c()
+
+                cls.__i2c.open(bus)
+                cls.__i2c_bus = bus
+
+            cls.__i2c_depth += 1
+
+            try:
+                with cls.__timed():
+                    cls.__select(bus)
+                    yield
+
+            finally:
+                if generation == cls.__i2c_generation:
+                    cls.__i2c_depth -= 1
+
+                    if cls.__i2c_depth == 0 and not cls.__i2c_retained:
+                        cls.__close_i2c()
+
+
+    @classmethod
+    @contextmanager
+    def spi(cls, bus, device):
+        with cls.__hold((cls.SPI, (bus, device))), cls.__timed():
+            yield
+
+
+    @classmethod
+    @contextmanager
+    def uart(cls, device):
+        with cls.__hold((cls.UART, device)), cls.__timed():
+            yield
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def __select(cls, bus):
+        if bus != cls.__mux_bus:
+            return
+
+        channel = getattr(cls.__binding, 'channel', None)
+
+        if channel is None or channel == cls.__mux_channel:
+            return
+
+        cls.__mux_channel = None
+        cls.__mux.select(channel)
+        cls.__mux_channel = channel
+
+
+    @classmethod
+    def __close_i2c(cls):
+        if cls.__i2c_bus is None:
+            return
+
+        cls.__i2c.close()
+        cls.__i2c_bus = None
+        cls.__mux_channel = None
@@ -4,6 +4,9 @@ Created on 18 May 2017
 @author: Bruno Beloff (bruno.beloff@southcoastscience.com)
 
 Note that this test updates the EEPROM contents.
+
+In differential mode, only the pages that differ from the image are written, and only those pages are verified - see
+EEPROMProgrammer. The programming outcome is the test datum.
 """
 
 from os import path
@@ -14,9 +17,10 @@ from scs_core.sys.eeprom_image import EEPROMImage
 
 from scs_dfe.board.cat24c32 import CAT24C32
 
-from scs_host.bus.i2c import I2C
-from scs_host.sys.host import Host
+from scs_mfr.eeprom.cat24c32_pages import CAT24C32Pages
+from scs_mfr.eeprom.eeprom_programmer import EEPROMProgrammer
 
+from scs_mfr.test.bus_lock import BusLock
 from scs_mfr.test.test import Test
 
 
@@ -27,11 +31,30 @@ class EEPROMTest(Test):
     test script
     """
 
+    BUSES = (BusLock.I2C_EEPROM, )
+
+    MODE_FULL =             'full'
+    MODE_DIFFERENTIAL =     'differential'
+
     # ----------------------------------------------------------------------------------------------------------------
 
-    def __init__(self, verbose):
+    @classmethod
+    def construct(cls, subject, session, args, limits, verbose):
+        mode = args.get('mode', cls.MODE_FULL)
+        eeprom = session.eeprom_pages if mode == cls.MODE_DIFFERENTIAL else session.eeprom
+
+        return cls(eeprom, session.host, verbose, mode=mode)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, eeprom, host, verbose, mode=MODE_FULL):
         Test.__init__(self, verbose)
 
+        self.__eeprom = eeprom
+        self.__host = host
+        self.__mode = mode
+
 
     # ----------------------------------------------------------------------------------------------------------------
 
@@ -40,24 +63,26 @@ class EEPROMTest(Test):
             print("EEPROM...", file=sys.stderr)
 
         # validate...
-        if not path.isfile(Host.eep_image()):
+        if not path.isfile(self.__host.eep_image()):
             print("error: eeprom image not found", file=sys.stderr)
             exit(1)
 
-        try:
-            # resources...
-            Host.enable_eeprom_access()
+        with BusLock.i2c(BusLock.I2C_EEPROM, self.__host.I2C_EEPROM):
+            # test...
+            if self.__mode == self.MODE_DIFFERENTIAL:
+                file_image = EEPROMImage.construct_from_file(self.__host.eep_image(), CAT24C32Pages.SIZE)
+
+                programmer = EEPROMProgrammer(self.__eeprom, CAT24C32Pages.SIZE, CAT24C32Pages.PAGE_SIZE)
+                self.datum = programmer.program(file_image.content)
 
-            I2C.open(Host.I2C_EEPROM)
+                if self.verbose:
+                    print(self.datum, file=sys.stderr)
 
-            eeprom = CAT24C32()
+                # test criterion...
+                return self.datum.verified
 
-            # test...
-            file_image = EEPROMImage.construct_from_file(Host.eep_image(), CAT24C32.SIZE)
-            eeprom.write(file_image)
+            file_image = EEPROMImage.construct_from_file(self.__host.eep_image(), CAT24C32.SIZE)
+            self.__eeprom.write(file_image)
 
             # test criterion...
-            return eeprom.image == file_image
-
-        finally:
-            I2C.close()
+            return self.__eeprom.image == file_image
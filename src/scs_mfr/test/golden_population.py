@@ -0,0 +1,127 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+The running statistics of the AFE and Pt1000 readings of the DFEs that have passed, by channel. A channel is named for
+the path of its reading in the DFETestDatum report, for example afe.pt1.v or afe.sns.CO.weV.
+
+A reading is only scored once its channel has the minimum population, so that early z-scores are not distorted by a
+handful of boards.
+"""
+
+from collections import OrderedDict
+
+from scs_mfr.data.running_statistics import RunningStatistics
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class GoldenPopulation(object):
+    """
+    classdocs
+    """
+
+    SUBJECT =           'AFE'                   # the subject whose report block holds the readings
+
+    PT1000 =            'afe.pt1.v'
+
+    MIN_COUNT =         30
+
+    __ELECTRODES =      ('weV', 'aeV')
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def sensor_channel(cls, gas, electrode):
+        return 'afe.sns.%s.%s' % (gas, electrode)
+
+
+    @classmethod
+    def readings(cls, val):
+        """
+        yields channel, value for each population reading in the val block of a DFETestDatum JSON dictionary -
+        readings carried from a previous report are not yielded, so that they are not counted twice
+
+        Where the report has an afe-stats block, from AFE burst mode, the WE and AE readings are the burst means - the
+        statistic that the AFE test scores - rather than the single sample in the afe block.
+        """
+        if cls.SUBJECT in (val.get('carried') or []):
+            return
+
+        afe = val.get('afe')
+
+        if not afe:
+            return
+
+        pt1 = afe.get('pt1') or {}
+
+        if pt1.get('v') is not None:
+            yield cls.PT1000, pt1['v']
+
+        afe_stats = val.get('afe-stats') or {}
+
+        for gas, sensor in (afe.get('sns') or {}).items():
+            gas_stats = afe_stats.get(gas) or {}
+
+            for electrode in cls.__ELECTRODES:
+                electrode_stats = gas_stats.get(electrode)
+
+                if electrode_stats is not None and electrode_stats.get('mean') is not None:
+                    yield cls.sensor_channel(gas, electrode), electrode_stats['mean']
+
+                elif sensor.get(electrode) is not None:
+                    yield cls.sensor_channel(gas, electrode), sensor[electrode]
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, statistics=None, min_count=MIN_COUNT):
+        """
+        Constructor
+        """
+        self.__statistics = OrderedDict() if statistics is None else statistics    # channel: RunningStatistics
+        self.__min_count = min_count                                                # int
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def append(self, channel, value):
+        if channel not in self.__statistics:
+            self.__statistics[channel] = RunningStatistics()
+
+        self.__statistics[channel].append(value)
+
+
+    def z_score(self, channel, value):
+        """
+        returns the z-score of the value, or None if the channel's population is too small to score
+        """
+        statistics = self.__statistics.get(channel)
+
+        if statistics is None or statistics.n < self.__min_count:
+            return None
+
+        return statistics.z_score(value)
+
+
+    def statistics(self, channel):
+        return self.__statistics.get(channel)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def channels(self):
+        return list(self.__statistics.keys())
+
+
+    @property
+    def min_count(self):
+        return self.__min_count
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "GoldenPopulation:{channels:%s, min_count:%s}" % (len(self.__statistics), self.min_count)
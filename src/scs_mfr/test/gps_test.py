@@ -8,11 +8,7 @@ import sys
 
 from scs_core.position.gprmc import GPRMC
 
-from scs_dfe.gps.pam7q import PAM7Q
-
-from scs_host.bus.i2c import I2C
-from scs_host.sys.host import Host
-
+from scs_mfr.test.bus_lock import BusLock
 from scs_mfr.test.test import Test
 
 
@@ -23,11 +19,23 @@ class GPSTest(Test):
     test script
     """
 
+    BUSES = (BusLock.I2C_SENSORS, BusLock.UART)
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct(cls, subject, session, args, limits, verbose):
+        return cls(session.gps, session.host, verbose)
+
+
     # ----------------------------------------------------------------------------------------------------------------
 
-    def __init__(self, verbose):
+    def __init__(self, gps, host, verbose):
         Test.__init__(self, verbose)
 
+        self.__gps = gps
+        self.__host = host
+
 
     # ----------------------------------------------------------------------------------------------------------------
 
@@ -35,19 +43,15 @@ class GPSTest(Test):
         if self.verbose:
             print("GPS...", file=sys.stderr)
 
-        gps = None
-
         try:
-            I2C.open(Host.I2C_SENSORS)
-
-            # GPS...
-            gps = PAM7Q(Host.gps_device())
+            with BusLock.i2c(BusLock.I2C_SENSORS, self.__host.I2C_SENSORS):
+                self.__gps.power_on()
 
-            gps.power_on()
-            gps.open()
+            with BusLock.uart(self.__host.gps_device()):
+                self.__gps.open()
 
-            # test...
-            self.datum = gps.report(GPRMC)
+                # test...
+                self.datum = self.__gps.report(GPRMC)
 
             if self.verbose:
                 print(self.datum, file=sys.stderr)
@@ -56,8 +60,16 @@ class GPSTest(Test):
             return self.datum is not None
 
         finally:
-            if gps:
-                gps.close()
-                gps.power_off()
+            with BusLock.uart(self.__host.gps_device()):
+                self.__gps.close()
+
+            with BusLock.i2c(BusLock.I2C_SENSORS, self.__host.I2C_SENSORS):
+                self.__gps.power_off()
+
+
+    def abort(self):
+        with BusLock.uart(self.__host.gps_device()):
+            self.__gps.close()
 
-            I2C.close()
+        with BusLock.i2c(BusLock.I2C_SENSORS, self.__host.I2C_SENSORS):
+            self.__gps.power_off()
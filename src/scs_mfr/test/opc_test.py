@@ -6,11 +6,7 @@ Created on 18 May 2017
 
 import sys
 
-from scs_dfe.particulate.opc_n2 import OPCN2
-
-from scs_host.bus.i2c import I2C
-from scs_host.sys.host import Host
-
+from scs_mfr.test.bus_lock import BusLock
 from scs_mfr.test.test import Test
 
 
@@ -21,11 +17,23 @@ class OPCTest(Test):
     test script
     """
 
+    BUSES = (BusLock.I2C_SENSORS, BusLock.SPI)
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct(cls, subject, session, args, limits, verbose):
+        return cls(session.opc, session.host, verbose)
+
+
     # ----------------------------------------------------------------------------------------------------------------
 
-    def __init__(self, verbose):
+    def __init__(self, opc, host, verbose):
         Test.__init__(self, verbose)
 
+        self.__opc = opc
+        self.__host = host
+
 
     # ----------------------------------------------------------------------------------------------------------------
 
@@ -33,19 +41,15 @@ class OPCTest(Test):
         if self.verbose:
             print("OPC...", file=sys.stderr)
 
-        opc = None
-
         try:
-            I2C.open(Host.I2C_SENSORS)
-
-            # resources...
-            opc = OPCN2(Host.opc_spi_bus(), Host.opc_spi_device())
+            with BusLock.i2c(BusLock.I2C_SENSORS, self.__host.I2C_SENSORS):
+                self.__opc.power_on()
 
-            opc.power_on()
-            opc.operations_on()
+            with self.__spi():
+                self.__opc.operations_on()
 
-            # test...
-            self.datum = opc.firmware()
+                # test...
+                self.datum = self.__opc.firmware()
 
             if self.verbose:
                 print(self.datum, file=sys.stderr)
@@ -54,8 +58,19 @@ class OPCTest(Test):
             return len(self.datum) > 0 and self.datum.startswith('OPC')
 
         finally:
-            if opc:
-                opc.operations_off()
-                opc.power_off()
+            with self.__spi():
+                self.__opc.operations_off()
+
+            with BusLock.i2c(BusLock.I2C_SENSORS, self.__host.I2C_SENSORS):
+                self.__opc.power_off()
+
+
+    def abort(self):
+        with BusLock.i2c(BusLock.I2C_SENSORS, self.__host.I2C_SENSORS):
+            self.__opc.power_off()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
 
-            I2C.close()
+    def __spi(self):
+        return BusLock.spi(self.__host.opc_spi_bus(), self.__host.opc_spi_device())
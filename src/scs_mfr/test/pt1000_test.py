@@ -6,11 +6,8 @@ Created on 18 May 2017
 
 import sys
 
-from scs_dfe.board.dfe_conf import DFEConf
-
-from scs_host.bus.i2c import I2C
-from scs_host.sys.host import Host
-
+from scs_mfr.test.bus_lock import BusLock
+from scs_mfr.test.golden_population import GoldenPopulation
 from scs_mfr.test.test import Test
 
 
@@ -21,10 +18,25 @@ class Pt1000Test(Test):
     test script
     """
 
+    BUSES = (BusLock.I2C_SENSORS, )
+    DEFAULT_LIMITS = {'v': (0.3, 0.4), 'v_z': (-4.0, 4.0)}
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct(cls, subject, session, args, limits, verbose):
+        return cls(session.afe, session.host, verbose, limits, population=session.population)
+
+
     # ----------------------------------------------------------------------------------------------------------------
 
-    def __init__(self, verbose):
-        Test.__init__(self, verbose)
+    def __init__(self, afe, host, verbose, limits=None, population=None):
+        Test.__init__(self, verbose, limits)
+
+        self.__afe = afe
+        self.__host = host
+        self.__population = population
 
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -33,21 +45,17 @@ class Pt1000Test(Test):
         if self.verbose:
             print("Pt1000...", file=sys.stderr)
 
-        try:
-            I2C.open(Host.I2C_SENSORS)
-
-            # AFE...
-            dfe_conf = DFEConf.load(Host)
-            afe = dfe_conf.afe(Host)
-
+        with BusLock.i2c(BusLock.I2C_SENSORS, self.__host.I2C_SENSORS):
             # test...
-            self.datum = afe.sample_pt1000()
+            self.datum = self.__afe.sample_pt1000()
 
             if self.verbose:
                 print(self.datum, file=sys.stderr)
 
-            # test criterion...
-            return 0.3 < self.datum.v < 0.4
+            # test criteria...
+            ok = self.within('v', self.datum.v)
+
+            if not self.within_population(self.__population, GoldenPopulation.PT1000, 'v_z', self.datum.v):
+                ok = False
 
-        finally:
-            I2C.close()
+            return ok
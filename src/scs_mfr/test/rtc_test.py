@@ -2,6 +2,14 @@
 Created on 18 May 2017
 
 @author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+In fast mode, the test relies on the DS1338 resetting its one-second countdown chain whenever the seconds register is
+written. The clock is set, then polled for the first seconds rollover, whose time is measured against the host's
+monotonic clock. The test completes as soon as the one tick has been observed.
+
+The I2C bus is held for the whole of the poll window, so that the polls are not delayed by tests on other threads.
+If the tick is nonetheless not bracketed to within the resolution limit, the measurement is repeated; if it still
+cannot be, RTCUnmeasurableError is raised, rather than failing the RTC on an imprecise measurement.
 """
 
 import sys
@@ -11,11 +19,10 @@ import tzlocal
 from scs_core.data.localized_datetime import LocalizedDatetime
 from scs_core.data.rtc_datetime import RTCDatetime
 
-from scs_dfe.time.ds1338 import DS1338
-
-from scs_host.bus.i2c import I2C
-from scs_host.sys.host import Host
+from scs_mfr.report.rtc_drift_datum import RTCDriftDatum
 
+from scs_mfr.test.bus_lock import BusLock
+from scs_mfr.test.rtc_unmeasurable_error import RTCUnmeasurableError
 from scs_mfr.test.test import Test
 
 
@@ -26,42 +33,132 @@ class RTCTest(Test):
     test script
     """
 
+    BUSES = (BusLock.I2C_SENSORS, )
+
+    MODE_STANDARD =             'standard'
+    MODE_FAST =                 'fast'
+
+    DEFAULT_LIMITS = {'seconds': (1, 2), 'ppm': (-20000, 20000), 'res': (None, 5000)}
+
+    __POLL_INTERVAL =           0.001               # seconds
+    __POLL_LEAD =               0.02                # seconds before the expected rollover
+    __POLL_TIMEOUT =            2.0                 # seconds
+    __MEASUREMENTS =            2
+
+
     # ----------------------------------------------------------------------------------------------------------------
 
-    def __init__(self, verbose):
-        Test.__init__(self, verbose)
+    @classmethod
+    def construct(cls, subject, session, args, limits, verbose):
+        return cls(session.rtc, session.host, verbose, limits, mode=args.get('mode', cls.MODE_STANDARD))
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, rtc, host, verbose, limits=None, mode=MODE_STANDARD):
+        Test.__init__(self, verbose, limits)
+
+        self.__rtc = rtc
+        self.__host = host
+        self.__mode = mode
 
 
     # ----------------------------------------------------------------------------------------------------------------
 
     def conduct(self):
         if self.verbose:
-            print("RTC...", file=sys.stderr)
+            print("RTC (%s)..." % self.__mode, file=sys.stderr)
 
-        try:
-            I2C.open(Host.I2C_SENSORS)
+        if self.__mode == self.MODE_FAST:
+            return self.__conduct_fast()
 
-            # resources...
+        with BusLock.i2c(BusLock.I2C_SENSORS, self.__host.I2C_SENSORS):
             now = LocalizedDatetime.now()
 
-            DS1338.init()
-
             # test...
             rtc_datetime = RTCDatetime.construct_from_localized_datetime(now)
-            DS1338.set_time(rtc_datetime)
+            self.__rtc.set_time(rtc_datetime)
+
+        # the bus is released while the clock runs...
+        time.sleep(2)
+
+        with BusLock.i2c(BusLock.I2C_SENSORS, self.__host.I2C_SENSORS):
+            rtc_datetime = self.__rtc.get_time()
+
+        localized_datetime = rtc_datetime.as_localized_datetime(tzlocal.get_localzone())
+
+        self.datum = localized_datetime - now
+
+        if self.verbose:
+            print(self.datum, file=sys.stderr)
+
+        # test criterion...
+        lower, upper = self.limits['seconds']
 
-            time.sleep(2)
+        return lower <= self.datum.seconds <= upper
 
-            rtc_datetime = DS1338.get_time()
-            localized_datetime = rtc_datetime.as_localized_datetime(tzlocal.get_localzone())
 
-            self.datum = localized_datetime - now
+    def __conduct_fast(self):
+        for _ in range(self.__MEASUREMENTS):
+            self.datum = self.__measure_tick()
 
             if self.verbose:
                 print(self.datum, file=sys.stderr)
 
-            # test criterion...
-            return 1 <= self.datum.seconds <= 2
+            if self.datum is None:
+                return False
+
+            if self.within('res', self.datum.res):
+                break
+
+        else:
+            raise RTCUnmeasurableError(self.datum, self.limits['res'][1])
+
+        # test criterion...
+        return self.within('ppm', self.datum.ppm)
+
+
+    def __measure_tick(self):
+        """
+        returns RTCDriftDatum, or None if no rollover was observed
+        """
+        with BusLock.i2c(BusLock.I2C_SENSORS, self.__host.I2C_SENSORS):
+            now = LocalizedDatetime.now()
+
+            rtc_datetime = RTCDatetime.construct_from_localized_datetime(now)
+            self.__rtc.set_time(rtc_datetime)
+
+            set_at = time.monotonic()
+
+        # the bus is released until shortly before the rollover...
+        time.sleep(1.0 - self.__POLL_LEAD)
+
+        # ...and then held for the whole poll window...
+        with BusLock.i2c(BusLock.I2C_SENSORS, self.__host.I2C_SENSORS):
+            previous = time.monotonic()         # the rollover is not expected before this time
+
+            while previous - set_at < self.__POLL_TIMEOUT:
+                start = time.monotonic()
+                second = self.__rtc.get_time().second
+                latched = (start + time.monotonic()) / 2
+
+                if second != rtc_datetime.second:
+                    # the rollover occurred between the previous read and this one...
+                    return RTCDriftDatum.construct(set_at, previous, latched)
+
+                previous = latched
+                time.sleep(self.__POLL_INTERVAL)
+
+        return None
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def mode(self):
+        return self.__mode
+
 
-        finally:
-            I2C.close()
+    @property
+    def drift(self):
+        return self.datum if self.__mode == self.MODE_FAST else None
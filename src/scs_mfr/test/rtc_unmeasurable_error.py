@@ -0,0 +1,45 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Raised by the fast RTC test when the first tick could not be timed to within the resolution limit, so that its drift
+is reported as unmeasurable rather than as a failure of the RTC.
+"""
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class RTCUnmeasurableError(RuntimeError):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, datum, limit):
+        """
+        Constructor
+        """
+        super().__init__(datum, limit)
+
+        self.__datum = datum                        # RTCDriftDatum, or None if no tick was observed
+        self.__limit = limit                        # float parts per million
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def datum(self):
+        return self.__datum
+
+
+    @property
+    def limit(self):
+        return self.__limit
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "RTCUnmeasurableError:{datum:%s, limit:%s}" % (self.datum, self.limit)
@@ -6,9 +6,7 @@ Created on 18 May 2017
 
 import sys
 
-from scs_host.bus.i2c import I2C
-from scs_host.sys.host import Host
-
+from scs_mfr.test.bus_lock import BusLock
 from scs_mfr.test.test import Test
 
 
@@ -19,13 +17,27 @@ class SHTTest(Test):
     test script
     """
 
+    BUSES = (BusLock.I2C_SENSORS, )
+    DEFAULT_LIMITS = {'humid': (10, 90), 'temp': (10, 50)}
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct(cls, subject, session, args, limits, verbose):
+        sht = session.ext_sht if args.get('sht') == 'ext' else session.int_sht
+
+        return cls(subject, sht, session.host, verbose, limits)
+
+
     # ----------------------------------------------------------------------------------------------------------------
 
-    def __init__(self, name, sht, verbose):
-        Test.__init__(self, verbose)
+    def __init__(self, name, sht, host, verbose, limits=None):
+        Test.__init__(self, verbose, limits)
 
         self.__name = name
         self.__sht = sht
+        self.__host = host
 
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -34,9 +46,7 @@ class SHTTest(Test):
         if self.verbose:
             print("%s (0x%02x)..." % (self.__name, self.__sht.addr), file=sys.stderr)
 
-        try:
-            I2C.open(Host.I2C_SENSORS)
-
+        with BusLock.i2c(BusLock.I2C_SENSORS, self.__host.I2C_SENSORS):
             # test...
             self.__sht.reset()
 
@@ -46,10 +56,7 @@ class SHTTest(Test):
                 print(self.datum, file=sys.stderr)
 
             # criterion...
-            return 10 < self.datum.humid < 90 and 10 < self.datum.temp < 50
-
-        finally:
-            I2C.close()
+            return self.within('humid', self.datum.humid) and self.within('temp', self.datum.temp)
 
 
     # ----------------------------------------------------------------------------------------------------------------
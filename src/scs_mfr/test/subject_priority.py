@@ -0,0 +1,42 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+The priority of each subject is its estimated probability of failure divided by its expected duration, so that the
+subjects most likely to reject a board, per second of station time, are conducted first.
+
+The failure probability is estimated from historical results with Laplace's rule of succession, so that a subject with
+few results is neither certain to fail nor certain to pass. Subjects without a recorded duration are given the default
+duration.
+"""
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class SubjectPriority(object):
+    """
+    classdocs
+    """
+
+    DEFAULT_WALL =      1.0                 # seconds
+    MIN_WALL =          0.001               # seconds
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def priorities(cls, statistics):
+        """
+        statistics: iterable of dict with subject, tested, failed and wall fields, as given by DFETestStore
+        returns dict of subject: priority
+        """
+        priorities = {}
+
+        for statistic in statistics:
+            failure_probability = (statistic['failed'] + 1) / (statistic['tested'] + 2)
+
+            wall = cls.DEFAULT_WALL if statistic['wall'] is None else max(statistic['wall'], cls.MIN_WALL)
+
+            priorities[statistic['subject']] = failure_probability / wall
+
+        return priorities
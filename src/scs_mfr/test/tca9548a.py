@@ -0,0 +1,63 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+TCA9548A eight-channel I2C multiplexer, fanning out the host I2C bus to the boards of a test fixture. Writing the
+control register connects the downstream channel given by each bit - only one channel is connected at a time here.
+
+http://www.ti.com/lit/ds/symlink/tca9548a.pdf
+"""
+
+from scs_host.bus.i2c import I2C
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class TCA9548A(object):
+    """
+    classdocs
+    """
+
+    DEFAULT_ADDR =      0x70
+    CHANNELS =          8
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, addr=DEFAULT_ADDR):
+        """
+        Constructor
+        """
+        self.__addr = addr
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def select(self, channel):
+        """
+        connects the given channel, or disconnects all channels if channel is None
+        """
+        if channel is not None and not 0 <= channel < self.CHANNELS:
+            raise ValueError("invalid channel: %s" % channel)
+
+        control = 0 if channel is None else 1 << channel
+
+        try:
+            I2C.start_tx(self.__addr)
+            I2C.write(control)
+
+        finally:
+            I2C.end_tx()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def addr(self):
+        return self.__addr
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "TCA9548A:{addr:0x%02x}" % self.addr
@@ -6,6 +6,8 @@ Created on 18 May 2017
 
 from abc import abstractmethod
 
+from collections import OrderedDict
+
 
 # --------------------------------------------------------------------------------------------------------------------
 
@@ -14,12 +16,30 @@ class Test(object):
     classdocs
     """
 
+    BUSES = ()                          # BusLock names of the buses used
+    DEFAULT_LIMITS = {}                 # name: (lower, upper) - a bound of None is open
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    @abstractmethod
+    def construct(cls, subject, session, args, limits, verbose):
+        pass
+
+
     # ----------------------------------------------------------------------------------------------------------------
 
-    def __init__(self, verbose):
+    def __init__(self, verbose, limits=None):
         self.__verbose = verbose
 
+        self.__limits = dict(self.DEFAULT_LIMITS)
+
+        if limits:
+            self.__limits.update(limits)
+
         self.__datum = None
+        self.__z_scores = OrderedDict()
 
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -29,6 +49,38 @@ class Test(object):
         pass
 
 
+    def abort(self):
+        """
+        called from another thread when the test has timed out - the bus locks held by the test have been abandoned
+        """
+        pass
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def within(self, name, value):
+        lower, upper = self.__limits[name]
+
+        return (lower is None or lower < value) and (upper is None or value < upper)
+
+
+    def within_population(self, population, channel, name, value):
+        """
+        tests the z-score of the value against the named limits, if the population is sufficient to score it
+        """
+        if population is None:
+            return True
+
+        z_score = population.z_score(channel, value)
+
+        if z_score is None:
+            return True
+
+        self.__z_scores[channel] = z_score
+
+        return self.within(name, z_score)
+
+
     # ----------------------------------------------------------------------------------------------------------------
 
     @property
@@ -41,6 +93,16 @@ class Test(object):
         self.__datum = value
 
 
+    @property
+    def z_scores(self):
+        return self.__z_scores
+
+
+    @property
+    def limits(self):
+        return self.__limits
+
+
     @property
     def verbose(self):
         return self.__verbose
@@ -49,4 +111,5 @@ class Test(object):
     # ----------------------------------------------------------------------------------------------------------------
 
     def __str__(self, *args, **kwargs):
-        return self.__class__.__name__ + ":{datum:%s, verbose:%s}" % (self.datum, self.verbose)
+        return self.__class__.__name__ + ":{datum:%s, limits:%s, verbose:%s}" % \
+               (self.datum, self.limits, self.verbose)
@@ -0,0 +1,180 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A test plan specifies the subjects of a DFE test, the Test class and arguments for each, the subjects on which each
+depends, and its acceptance limits. Subjects that are not listed are not tested.
+
+example JSON:
+{"tests": [{"subject": "RTC", "test": "RTCTest", "args": {}, "depends-on": [], "limits": {}, "enabled": true},
+{"subject": "Pt1000", "test": "Pt1000Test", "args": {}, "depends-on": [], "limits": {"v": [0.3, 0.4]},
+"enabled": true},
+{"subject": "AFE", "test": "AFETest", "args": {}, "depends-on": ["Pt1000"], "limits": {}, "enabled": true}]}
+"""
+
+import heapq
+import json
+
+from collections import OrderedDict
+
+from scs_core.data.json import JSONable
+
+from scs_mfr.test.afe_test import AFETest
+from scs_mfr.test.board_temp_test import BoardTempTest
+from scs_mfr.test.eeprom_test import EEPROMTest
+from scs_mfr.test.gps_test import GPSTest
+from scs_mfr.test.opc_test import OPCTest
+from scs_mfr.test.pt1000_test import Pt1000Test
+from scs_mfr.test.rtc_test import RTCTest
+from scs_mfr.test.sht_test import SHTTest
+from scs_mfr.test.test_plan_item import TestPlanItem
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class TestPlan(JSONable):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def default(cls):
+        return TestPlan([
+            TestPlanItem("RTC", RTCTest),
+            TestPlanItem("BoardTemp", BoardTempTest),
+            TestPlanItem("OPC", OPCTest),
+            TestPlanItem("GPS", GPSTest),
+            TestPlanItem("Int SHT", SHTTest, args={'sht': 'int'}),
+            TestPlanItem("Ext SHT", SHTTest, args={'sht': 'ext'}),
+            TestPlanItem("Pt1000", Pt1000Test),
+            TestPlanItem("AFE", AFETest),
+            TestPlanItem("EEPROM", EEPROMTest)
+        ])
+
+
+    @classmethod
+    def load_from_file(cls, filename):
+        with open(filename) as f:
+            jdict = json.load(f, object_pairs_hook=OrderedDict)
+
+        return cls.construct_from_jdict(jdict)
+
+
+    @classmethod
+    def construct_from_jdict(cls, jdict):
+        if not jdict:
+            return None
+
+        items = [TestPlanItem.construct_from_jdict(item_jdict) for item_jdict in jdict.get('tests', [])]
+
+        return TestPlan(items)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, items):
+        """
+        Constructor
+        """
+        self.__items = OrderedDict((item.subject, item) for item in items)
+        self.__priorities = {}
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def disable(self, subject):
+        if subject in self.__items:
+            self.__items[subject].enabled = False
+
+
+    def prioritise(self, priorities):
+        """
+        priorities: dict of subject: priority - subjects of higher priority are ordered first
+        """
+        self.__priorities = dict(priorities)
+
+
+    def ordered(self):
+        """
+        returns the items in an order consistent with their dependencies, otherwise in order of priority, then plan
+        order - subjects without a priority follow those with one
+        raises ValueError if a dependency is unknown or cyclic
+        """
+        subjects = list(self.__items.keys())
+        indices = {subject: index for index, subject in enumerate(subjects)}
+
+        def key(subject):
+            priority = self.__priorities.get(subject)
+
+            return (1, 0.0, indices[subject]) if priority is None else (0, -priority, indices[subject])
+
+        dependants = {subject: [] for subject in subjects}
+        pending = {}
+
+        for item in self.items:
+            for dependency in item.depends_on:
+                if dependency not in self.__items:
+                    raise ValueError("%s depends on unknown subject: %s" % (item.subject, dependency))
+
+                dependants[dependency].append(item.subject)
+
+            pending[item.subject] = len(item.depends_on)
+
+        ready = [key(subject) for subject in subjects if pending[subject] == 0]
+        heapq.heapify(ready)
+
+        ordered = []
+
+        while ready:
+            subject = subjects[heapq.heappop(ready)[2]]
+            ordered.append(self.__items[subject])
+
+            for dependant in dependants[subject]:
+                pending[dependant] -= 1
+
+                if pending[dependant] == 0:
+                    heapq.heappush(ready, key(dependant))
+
+        if len(ordered) < len(subjects):
+            raise ValueError("cyclic dependency among: %s" % [subject for subject in subjects if pending[subject]])
+
+        return ordered
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self):
+        jdict = OrderedDict()
+
+        jdict['tests'] = self.items
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def item(self, subject):
+        return self.__items.get(subject)
+
+
+    @property
+    def items(self):
+        return list(self.__items.values())
+
+
+    @property
+    def subjects(self):
+        return list(self.__items.keys())
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __len__(self):
+        return len(self.__items)
+
+
+    def __str__(self, *args, **kwargs):
+        return "TestPlan:{items:[%s]}" % ', '.join(str(item) for item in self.items)
@@ -0,0 +1,165 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+example JSON:
+{"subject": "Ext SHT", "test": "SHTTest", "args": {"sht": "ext"}, "depends-on": [], "limits": {"temp": [10, 50]},
+"retries": 0, "timeout": 5.0, "mandatory": true, "enabled": true}
+"""
+
+from collections import OrderedDict
+
+from scs_core.data.json import JSONable
+
+from scs_mfr.test.afe_test import AFETest
+from scs_mfr.test.board_temp_test import BoardTempTest
+from scs_mfr.test.eeprom_test import EEPROMTest
+from scs_mfr.test.gps_test import GPSTest
+from scs_mfr.test.opc_test import OPCTest
+from scs_mfr.test.pt1000_test import Pt1000Test
+from scs_mfr.test.rtc_test import RTCTest
+from scs_mfr.test.sht_test import SHTTest
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class TestPlanItem(JSONable):
+    """
+    classdocs
+    """
+
+    TESTS = OrderedDict((test.__name__, test) for test in (RTCTest, BoardTempTest, OPCTest, GPSTest, SHTTest,
+                                                           Pt1000Test, AFETest, EEPROMTest))
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct_from_jdict(cls, jdict):
+        if not jdict:
+            return None
+
+        subject = jdict.get('subject')
+        test_name = jdict.get('test')
+
+        if test_name not in cls.TESTS:
+            raise ValueError("unknown test: %s" % test_name)
+
+        args = jdict.get('args', {})
+        depends_on = jdict.get('depends-on', [])
+        limits = OrderedDict((name, tuple(limit)) for name, limit in jdict.get('limits', {}).items())
+        retries = jdict.get('retries', 0)
+        timeout = jdict.get('timeout')
+        mandatory = jdict.get('mandatory', True)
+        enabled = jdict.get('enabled', True)
+
+        return TestPlanItem(subject, cls.TESTS[test_name], args=args, depends_on=depends_on, limits=limits,
+                            retries=retries, timeout=timeout, mandatory=mandatory, enabled=enabled)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, subject, test_class, args=None, depends_on=None, limits=None, retries=0, timeout=None,
+                 mandatory=True, enabled=True):
+        """
+        Constructor
+        """
+        self.__subject = subject                            # string
+        self.__test_class = test_class                      # Test subclass
+
+        self.__args = {} if args is None else args          # dict
+        self.__depends_on = [] if depends_on is None else list(depends_on)
+        self.__limits = {} if limits is None else limits    # dict of name: (lower, upper)
+        self.__retries = retries                            # int
+        self.__timeout = timeout                            # float seconds or None
+        self.__mandatory = mandatory                        # bool
+
+        self.__enabled = enabled                            # bool
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def construct(self, session, verbose):
+        return self.__test_class.construct(self.subject, session, self.args, self.limits, verbose)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self):
+        jdict = OrderedDict()
+
+        jdict['subject'] = self.subject
+        jdict['test'] = self.test_class.__name__
+        jdict['args'] = self.args
+        jdict['depends-on'] = self.depends_on
+        jdict['limits'] = OrderedDict((name, list(limit)) for name, limit in self.limits.items())
+        jdict['retries'] = self.retries
+
+        if self.timeout is not None:
+            jdict['timeout'] = self.timeout
+
+        jdict['mandatory'] = self.mandatory
+        jdict['enabled'] = self.enabled
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def subject(self):
+        return self.__subject
+
+
+    @property
+    def test_class(self):
+        return self.__test_class
+
+
+    @property
+    def args(self):
+        return self.__args
+
+
+    @property
+    def depends_on(self):
+        return self.__depends_on
+
+
+    @property
+    def limits(self):
+        return self.__limits
+
+
+    @property
+    def retries(self):
+        return self.__retries
+
+
+    @property
+    def timeout(self):
+        return self.__timeout
+
+
+    @property
+    def mandatory(self):
+        return self.__mandatory
+
+
+    @property
+    def enabled(self):
+        return self.__enabled
+
+
+    @enabled.setter
+    def enabled(self, enabled):
+        self.__enabled = enabled
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "TestPlanItem:{subject:%s, test_class:%s, args:%s, depends_on:%s, limits:%s, retries:%s, " \
+               "timeout:%s, mandatory:%s, enabled:%s}" % \
+               (self.subject, self.test_class.__name__, self.args, self.depends_on, self.limits, self.retries,
+                self.timeout, self.mandatory, self.enabled)
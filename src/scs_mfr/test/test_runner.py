@@ -0,0 +1,314 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Conducts the tests of a test plan. The plan's dependencies form a directed acyclic graph: a test is started as soon as
+all the tests it depends on have passed, or is ignored if any of them did not pass.
+
+In parallel mode, every test that is ready is conducted concurrently in a thread pool. Otherwise, tests are conducted
+one at a time, in plan order where dependencies allow. In either case, results are passed to the reporter in plan order.
+
+A test that fails or raises an exception is conducted again, up to the number of retries given in the plan, but no
+retry is started once the subject's timeout has passed. The wall time, bus time and retries of each subject are passed
+to the reporter, together with the total run time.
+
+Each test is conducted on its own daemon thread. If a subject has not completed within its timeout - including any
+retries - the bus locks held by its thread are abandoned, the test is asked to abort, and the subject is reported as
+timed out. The thread is left to finish, or not, in the background, but is cancelled: it cannot hold a bus again. The
+time taken by a subject is therefore bounded by its timeout plus the abort timeout.
+
+In fail-fast mode, once a mandatory subject has not passed, no further tests are started - the subjects not yet
+started are ignored, and tests already running are allowed to complete.
+
+Subjects that passed in a previous run may be carried over: they are not conducted again, but are treated as having
+passed, both for the tests that depend on them and in the report.
+
+If a listener is given, it is passed a DFETestEvent as each test is started, and as each subject is resolved - unlike
+the reporter, the listener is not held to plan order.
+"""
+
+import threading
+import time
+
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+from scs_mfr.report.dfe_test_event import DFETestEvent
+from scs_mfr.report.subject_timing import SubjectTiming
+
+from scs_mfr.test.bus_lock import BusLock
+from scs_mfr.test.test_timeout_error import TestTimeoutError
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class TestRunner(object):
+    """
+    classdocs
+    """
+
+    __ABORT_TIMEOUT = 5.0                   # seconds
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def __conduct(cls, item, session, timeout, verbose):
+        start = time.monotonic()
+        deadline = None if timeout is None else start + timeout
+
+        bus_time = 0.0
+        retries = 0
+
+        while True:
+            remaining = None if deadline is None else max(deadline - time.monotonic(), 0.0)
+
+            test, outcome, attempt_bus_time = cls.__attempt(item, session, timeout, remaining, verbose)
+            bus_time += attempt_bus_time
+
+            if outcome is True or isinstance(outcome, TestTimeoutError) or retries >= item.retries:
+                break
+
+            if deadline is not None and time.monotonic() >= deadline:
+                break                       # no time for a retry - the last outcome stands
+
+            retries += 1
+
+        timing = SubjectTiming(time.monotonic() - start, bus_time, retries)
+
+        return test, outcome, timing
+
+
+    @classmethod
+    def __attempt(cls, item, session, timeout, remaining, verbose):
+        attempt = {'test': None, 'outcome': None, 'bus_time': 0.0}
+
+        def conduct():
+            session.bind()
+            BusLock.start_timing()
+
+            try:
+                attempt['test'] = item.construct(session, verbose)
+                attempt['outcome'] = bool(attempt['test'].conduct())
+
+            except BaseException as ex:
+                attempt['outcome'] = ex
+
+            finally:
+                attempt['bus_time'] = BusLock.bus_time()
+
+        thread = threading.Thread(target=conduct, name=item.subject, daemon=True)
+        thread.start()
+        thread.join(remaining)
+
+        if thread.is_alive():
+            abandoned = BusLock.abandon(thread)
+            cls.__abort(attempt['test'], session)
+
+            return attempt['test'], TestTimeoutError(item.subject, timeout, abandoned), 0.0
+
+        outcome = attempt['outcome']
+
+        if isinstance(outcome, BaseException) and not isinstance(outcome, Exception):
+            raise outcome                   # for example, SystemExit
+
+        return attempt['test'], outcome, attempt['bus_time']
+
+
+    @classmethod
+    def __abort(cls, test, session):
+        if test is None:
+            return
+
+        def abort():
+            session.bind()
+
+            try:
+                test.abort()
+
+            except Exception:
+                pass
+
+        thread = threading.Thread(target=abort, daemon=True)
+        thread.start()
+        thread.join(cls.__ABORT_TIMEOUT)
+
+        if thread.is_alive():
+            BusLock.abandon(thread)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, reporter, parallel=False, max_workers=None, timeout=None, fail_fast=False, listener=None,
+                 verbose=False):
+        """
+        Constructor
+        """
+        self.__reporter = reporter
+        self.__parallel = parallel
+        self.__max_workers = max_workers
+        self.__timeout = timeout                # default seconds for each subject, or None
+        self.__fail_fast = fail_fast
+        self.__listener = listener              # callable taking DFETestEvent, or None
+        self.__verbose = verbose
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def run(self, plan, session, carried=None):
+        """
+        carried: subjects that passed in a previous run, and are not to be conducted again
+        returns OrderedDict of subject: test, in plan order, for each test that was conducted
+        """
+        start = time.monotonic()
+
+        carried = set() if carried is None else set(carried)
+
+        waiting = plan.ordered()
+        running = {}
+
+        outcomes = {}                   # subject: None (ignored), bool (test result) or Exception (incl. timeout)
+        timings = {}
+        conducted = {}
+
+        reported = 0
+        halted = False
+
+        max_workers = self.__max_workers if self.__parallel else 1
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            while waiting or running:
+                # start...
+                for item in self.__ready(waiting, outcomes, running, carried, halted):
+                    timeout = self.__timeout if item.timeout is None else item.timeout
+                    running[executor.submit(self.__conduct, item, session, timeout, self.__verbose)] = item
+
+                    self.__notify(DFETestEvent.construct_start(item.subject))
+
+                # report...
+                reported = self.__report(plan.subjects, outcomes, timings, carried, reported)
+
+                if not running:
+                    continue
+
+                # complete...
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    item = running.pop(future)
+                    test, outcome, timing = future.result()
+
+                    if not isinstance(outcome, Exception):
+                        conducted[item.subject] = test
+
+                    outcomes[item.subject] = outcome
+                    timings[item.subject] = timing
+
+                    datum = None if test is None else test.datum
+                    self.__notify(DFETestEvent.construct_result(item.subject, outcome, timing=timing, datum=datum))
+
+                    if self.__fail_fast and item.mandatory and outcome is not True:
+                        halted = True
+
+        self.__report(plan.subjects, outcomes, timings, carried, reported)
+        self.__reporter.report_total(time.monotonic() - start)
+
+        return OrderedDict((subject, conducted[subject]) for subject in plan.subjects if subject in conducted)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __ready(self, waiting, outcomes, running, carried, halted):
+        """
+        resolves the waiting items that are not to be conducted, and returns those that may now be started
+        """
+        if halted:
+            for item in waiting:
+                outcomes[item.subject] = None
+                self.__notify(DFETestEvent.construct_result(item.subject, None))
+
+            waiting.clear()
+
+        ready = []
+
+        while True:
+            for item in waiting:
+                if any(subject not in outcomes for subject in item.depends_on):
+                    continue
+
+                if item.enabled and item.subject in carried:
+                    outcomes[item.subject] = True
+                    self.__notify(DFETestEvent.construct_result(item.subject, 'OK'))
+
+                elif item.enabled and all(outcomes[subject] is True for subject in item.depends_on):
+                    if not self.__parallel and (running or ready):
+                        continue
+
+                    ready.append(item)
+
+                else:
+                    outcomes[item.subject] = None
+                    self.__notify(DFETestEvent.construct_result(item.subject, None))
+
+                waiting.remove(item)
+                break
+
+            else:
+                return ready
+
+
+    def __notify(self, event):
+        if self.__listener is not None:
+            self.__listener(event)
+
+
+    def __report(self, subjects, outcomes, timings, carried, reported):
+        while reported < len(subjects) and subjects[reported] in outcomes:
+            subject = subjects[reported]
+            outcome = outcomes[subject]
+
+            if subject in timings:
+                self.__reporter.report_timing(subject, timings[subject])
+
+            if outcome is None:
+                self.__reporter.report_ignore(subject)
+
+            elif subject in carried:
+                self.__reporter.report_carried(subject)
+
+            elif isinstance(outcome, TestTimeoutError):
+                self.__reporter.report_timeout(subject, outcome)
+
+            elif isinstance(outcome, Exception):
+                self.__reporter.report_exception(subject, outcome)
+
+            else:
+                self.__reporter.report_test(subject, outcome)
+
+            reported += 1
+
+        return reported
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def parallel(self):
+        return self.__parallel
+
+
+    @property
+    def timeout(self):
+        return self.__timeout
+
+
+    @property
+    def fail_fast(self):
+        return self.__fail_fast
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "TestRunner:{reporter:%s, parallel:%s, max_workers:%s, timeout:%s, fail_fast:%s, verbose:%s}" % \
+               (self.__reporter, self.parallel, self.__max_workers, self.timeout, self.fail_fast, self.__verbose)
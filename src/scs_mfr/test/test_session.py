@@ -0,0 +1,236 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+The resources shared by the tests of a single DFE test run. The I2C bus is opened once for the session, each conf
+document is loaded once, and each device is constructed once, on first use.
+
+Tests obtain their devices, and the host, only from the session - a session of simulated devices may therefore be
+substituted.
+
+In a test fixture, the DFE may be on one channel of an I2C multiplexer. The multiplexer is then used by BusLock while
+the session is open, and each thread that uses the session's devices must first be bound to the session.
+
+A golden population may be given, against which the tests score their readings.
+"""
+
+import threading
+
+from scs_dfe.board.cat24c32 import CAT24C32
+from scs_dfe.board.dfe_conf import DFEConf
+from scs_dfe.board.mcp9808 import MCP9808
+from scs_dfe.climate.sht_conf import SHTConf
+from scs_dfe.gps.pam7q import PAM7Q
+from scs_dfe.particulate.opc_n2 import OPCN2
+from scs_dfe.time.ds1338 import DS1338
+
+from scs_mfr.eeprom.cat24c32_pages import CAT24C32Pages
+
+from scs_mfr.test.bus_lock import BusLock
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class TestSession(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, host, mux=None, channel=None, population=None):
+        """
+        Constructor
+        """
+        self.__host = host
+        self.__mux = mux                            # I2C multiplexer or None
+        self.__channel = channel                    # int multiplexer channel or None
+        self.__population = population              # GoldenPopulation or None
+
+        self.__lock = threading.RLock()
+
+        self.__sht_conf = None
+        self.__dfe_conf = None
+
+        self.__int_sht = None
+        self.__ext_sht = None
+        self.__afe = None
+        self.__board_temp = None
+        self.__rtc = None
+        self.__opc = None
+        self.__gps = None
+        self.__eeprom = None
+        self.__eeprom_pages = None
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def open(self):
+        if self.__mux is not None:
+            BusLock.use_mux(self.__mux, self.__host.I2C_SENSORS)
+
+        BusLock.retain()
+
+
+    def close(self):
+        BusLock.release()
+
+        if self.__mux is not None:
+            BusLock.use_mux(None)
+
+
+    def bind(self):
+        """
+        binds the calling thread to the multiplexer channel of the session's DFE, if any
+        """
+        BusLock.bind(self.__channel)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __sensors(self):
+        return BusLock.i2c(BusLock.I2C_SENSORS, self.__host.I2C_SENSORS)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def host(self):
+        return self.__host
+
+
+    @property
+    def mux(self):
+        return self.__mux
+
+
+    @property
+    def channel(self):
+        return self.__channel
+
+
+    @property
+    def population(self):
+        return self.__population
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def sht_conf(self):
+        with self.__lock:
+            if self.__sht_conf is None:
+                self.__sht_conf = SHTConf.load(self.__host)
+
+            return self.__sht_conf
+
+
+    @property
+    def dfe_conf(self):
+        with self.__lock:
+            if self.__dfe_conf is None:
+                self.__dfe_conf = DFEConf.load(self.__host)
+
+            return self.__dfe_conf
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def int_sht(self):
+        with self.__lock:
+            if self.__int_sht is None:
+                self.__int_sht = self.sht_conf.int_sht()
+
+            return self.__int_sht
+
+
+    @property
+    def ext_sht(self):
+        with self.__lock:
+            if self.__ext_sht is None:
+                self.__ext_sht = self.sht_conf.ext_sht()
+
+            return self.__ext_sht
+
+
+    @property
+    def afe(self):
+        with self.__lock:
+            if self.__afe is None:
+                dfe_conf = self.dfe_conf
+
+                with self.__sensors():
+                    self.__afe = dfe_conf.afe(self.__host)
+
+            return self.__afe
+
+
+    @property
+    def board_temp(self):
+        with self.__lock:
+            if self.__board_temp is None:
+                with self.__sensors():
+                    self.__board_temp = MCP9808(True)
+
+            return self.__board_temp
+
+
+    @property
+    def rtc(self):
+        with self.__lock:
+            if self.__rtc is None:
+                with self.__sensors():
+                    DS1338.init()
+
+                self.__rtc = DS1338
+
+            return self.__rtc
+
+
+    @property
+    def opc(self):
+        with self.__lock:
+            if self.__opc is None:
+                self.__opc = OPCN2(self.__host.opc_spi_bus(), self.__host.opc_spi_device())
+
+            return self.__opc
+
+
+    @property
+    def gps(self):
+        with self.__lock:
+            if self.__gps is None:
+                self.__gps = PAM7Q(self.__host.gps_device())
+
+            return self.__gps
+
+
+    @property
+    def eeprom(self):
+        with self.__lock:
+            if self.__eeprom is None:
+                self.__host.enable_eeprom_access()
+
+                with BusLock.i2c(BusLock.I2C_EEPROM, self.__host.I2C_EEPROM):
+                    self.__eeprom = CAT24C32()
+
+            return self.__eeprom
+
+
+    @property
+    def eeprom_pages(self):
+        with self.__lock:
+            if self.__eeprom_pages is None:
+                self.__host.enable_eeprom_access()
+                self.__eeprom_pages = CAT24C32Pages()
+
+            return self.__eeprom_pages
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "TestSession:{mux:%s, channel:%s, sht_conf:%s, dfe_conf:%s}" % \
+               (self.mux, self.channel, self.__sht_conf, self.__dfe_conf)
@@ -0,0 +1,49 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+"""
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class TestTimeoutError(Exception):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, subject, timeout, abandoned):
+        """
+        Constructor
+        """
+        super().__init__(subject, timeout, abandoned)
+
+        self.__subject = subject                    # string
+        self.__timeout = timeout                    # float seconds
+        self.__abandoned = abandoned                # list of bus lock names
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def subject(self):
+        return self.__subject
+
+
+    @property
+    def timeout(self):
+        return self.__timeout
+
+
+    @property
+    def abandoned(self):
+        return self.__abandoned
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "TestTimeoutError:{subject:%s, timeout:%s, abandoned:%s}" % \
+               (self.subject, self.timeout, self.abandoned)